@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Attendance
+from .models import Attendance, AttendanceImportCheckpoint
 
 # Register your models here.
 admin.site.register(Attendance)
+admin.site.register(AttendanceImportCheckpoint)
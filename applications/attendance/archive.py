@@ -0,0 +1,208 @@
+import heapq
+from datetime import timedelta
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from .models import Attendance, AttendanceArchive
+
+# Archive Horizon
+# --------------------------------------------------------
+# Archiving is enabled by setting `ATTENDANCE_ARCHIVE_AFTER_DAYS` to a positive
+# number of days. While it is 0, every read stays on the hot table.
+def archive_enabled():
+    return settings.ATTENDANCE_ARCHIVE_AFTER_DAYS > 0
+
+def archive_cutoff(days=None):
+    """
+    Return the instant before which closed sessions may live in the archive.
+
+    Args:
+        days (int, optional): The horizon in days; defaults to `ATTENDANCE_ARCHIVE_AFTER_DAYS`.
+
+    Returns:
+        datetime: An aware datetime.
+    """
+    return timezone.now() - timedelta(days=settings.ATTENDANCE_ARCHIVE_AFTER_DAYS if days is None else days)
+
+def needs_archive(lower=None):
+    """
+    Whether a read starting at `lower` can reach archived sessions.
+
+    No query is needed to decide: archived sessions are always older than the
+    configured horizon, so any range starting inside it is served by the hot
+    table alone.
+
+    Args:
+        lower (datetime, optional): The earliest clock-in time the read covers;
+                                    None means the whole history.
+
+    Returns:
+        bool: False when archiving is disabled or the range lies entirely
+              inside the hot horizon.
+    """
+    return archive_enabled() and (lower is None or lower < archive_cutoff())
+
+# Merged Hot/Cold Reads
+# --------------------------------------------------------
+class MergedQuerySet:
+    """
+    Read-only view over the same query run against several tables.
+
+    It supports the subset of the `QuerySet` API used by list views, reports
+    and exports: `filter`, `exclude`, `annotate`, `order_by`, `values_list`,
+    slicing, `iterator`, `count` and `exists`. Every call is applied to each
+    underlying queryset; when an ordering is set, results are combined with a
+    streaming `heapq.merge`, so each table is still read in index order and
+    memory stays flat. Only ascending orderings are supported.
+
+    Attributes:
+        querysets (list): The underlying querysets, one per table.
+        model (Model): The model of the first (hot) queryset.
+    """
+    def __init__(self, querysets, ordering=(), fields=None, flat=False, bounds=(None, None)):
+        self.querysets = list(querysets)
+        self.ordering = tuple(ordering)
+        self.fields = fields
+        self.flat = flat
+        self.bounds = bounds
+
+    @property
+    def model(self):
+        return self.querysets[0].model
+
+    def _clone(self, method, *args, **kwargs):
+        return MergedQuerySet(
+            [getattr(queryset, method)(*args, **kwargs) for queryset in self.querysets],
+            self.ordering, self.fields, self.flat, self.bounds,
+        )
+
+    def all(self):
+        return self._clone('all')
+
+    def filter(self, *args, **kwargs):
+        return self._clone('filter', *args, **kwargs)
+
+    def exclude(self, *args, **kwargs):
+        return self._clone('exclude', *args, **kwargs)
+
+    def annotate(self, *args, **kwargs):
+        return self._clone('annotate', *args, **kwargs)
+
+    def order_by(self, *fields):
+        if any(field.startswith('-') for field in fields):
+            raise ValueError('MergedQuerySet only supports ascending orderings.')
+        clone = self._clone('order_by', *fields)
+        clone.ordering = fields
+        return clone
+
+    def values_list(self, *fields, flat=False):
+        return MergedQuerySet(self.querysets, self.ordering, fields, flat, self.bounds)
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice) or key.step is not None:
+            raise TypeError('MergedQuerySet only supports slicing.')
+        start, stop = key.start or 0, key.stop
+        clone = MergedQuerySet(self.querysets, self.ordering, self.fields, self.flat, (start, stop))
+        if stop is not None:
+            # Each table needs at most `stop` rows for the merged slice
+            clone.querysets = [queryset[:stop] for queryset in self.querysets]
+        return clone
+
+    def _iter_source(self, queryset, chunk_size):
+        if self.fields is None:
+            return queryset.iterator(chunk_size=chunk_size)
+        # Fetch the ordering columns after the requested ones so rows can be merged
+        return queryset.values_list(*self.fields, *self.ordering).iterator(chunk_size=chunk_size)
+
+    def iterator(self, chunk_size=2000):
+        sources = [self._iter_source(queryset, chunk_size) for queryset in self.querysets]
+        if not self.ordering or len(sources) == 1:
+            rows = chain.from_iterable(sources)
+        elif self.fields is None:
+            rows = heapq.merge(*sources, key=attrgetter(*self.ordering))
+        else:
+            offset = len(self.fields)
+            rows = heapq.merge(*sources, key=itemgetter(*range(offset, offset + len(self.ordering))))
+        start, stop = self.bounds
+        if start or stop is not None:
+            rows = islice(rows, start, stop)
+        if self.fields is not None:
+            width = len(self.fields)
+            rows = (row[0] if self.flat else row[:width] for row in rows)
+        return rows
+
+    def __iter__(self):
+        return self.iterator()
+
+    def count(self):
+        total = sum(queryset.count() for queryset in self.querysets)
+        start, stop = self.bounds
+        return max(0, (total if stop is None else min(total, stop)) - (start or 0))
+
+    def exists(self):
+        return any(queryset.exists() for queryset in self.querysets)
+
+def attendance_history(lower=None, include_archive=True):
+    """
+    Return every attendance log, hot and archived, as one queryset-like object.
+
+    The archive is only consulted when `lower` reaches past the archive
+    horizon, so reads of recent data touch the hot table alone.
+
+    Args:
+        lower (datetime, optional): The earliest clock-in time the caller will
+                                    read; None means the whole history.
+        include_archive (bool): False when the read cannot match archived rows,
+                                e.g. open sessions only.
+
+    Returns:
+        MergedQuerySet: The logs; hot rows are `Attendance` instances and
+                        archived rows `AttendanceArchive` instances with the
+                        same field names.
+    """
+    querysets = [Attendance.objects.all()]
+    if include_archive and needs_archive(lower):
+        querysets.append(AttendanceArchive.objects.all())
+    return MergedQuerySet(querysets)
+
+# Archival
+# --------------------------------------------------------
+ARCHIVE_FIELDS = ['id', 'employee_id', 'clock_in_time', 'clock_out_time', 'duration_seconds', 'event_id']
+
+def archive_chunk(cutoff, chunk_size):
+    """
+    Move one chunk of closed sessions older than `cutoff` to the archive.
+
+    The copy and the delete run in one transaction, so an interrupted run
+    loses nothing and the next run simply continues with the remaining rows.
+    The delete is issued as plain SQL: it must not fire `post_delete`, since
+    archived sessions still count towards the daily summaries and reports.
+
+    Args:
+        cutoff (datetime): Sessions that clocked in before this are archived.
+        chunk_size (int): Maximum number of sessions to move.
+
+    Returns:
+        int: The number of sessions moved; 0 when nothing is left to archive.
+    """
+    with transaction.atomic():
+        rows = list(
+            Attendance.objects
+            .select_for_update(skip_locked=connection.features.has_select_for_update_skip_locked)
+            .filter(clock_in_time__lt=cutoff, clock_out_time__isnull=False)
+            .order_by('clock_in_time', 'id')
+            .values_list(*ARCHIVE_FIELDS)[:chunk_size]
+        )
+        if not rows:
+            return 0
+        AttendanceArchive.objects.bulk_create(
+            [AttendanceArchive(**dict(zip(ARCHIVE_FIELDS, row))) for row in rows],
+            ignore_conflicts=True,
+        )
+        ids = [row[0] for row in rows]
+        with connection.cursor() as cursor:
+            table = connection.ops.quote_name(Attendance._meta.db_table)
+            cursor.execute(f'DELETE FROM {table} WHERE id IN ({", ".join(["%s"] * len(ids))})', ids)
+    return len(rows)
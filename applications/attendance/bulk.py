@@ -0,0 +1,210 @@
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+from applications.onboarding.models import Employee
+from .models import Attendance, AttendanceArchive
+from .signals import attendance_bulk_saved
+
+# Attendance Event Serializer
+# --------------------------------------------------------
+class AttendanceEventSerializer(serializers.Serializer):
+    """
+    Serializer for a single buffered terminal event in a bulk upload.
+
+    The employee reference is validated as a plain integer here; whether the
+    employee exists is checked for the whole upload with a single query. An
+    event is a whole session (both times), a clock-in (`clock_in_time` only)
+    or a clock-out (`clock_out_time` only) that closes the employee's open
+    session.
+
+    Fields:
+        event_id (str): Client-supplied unique identifier of the event.
+        employee (int): Primary key of the employee.
+        clock_in_time (datetime, optional): The clock-in time.
+        clock_out_time (datetime, optional): The clock-out time.
+    """
+    event_id = serializers.CharField(max_length=64)
+    employee = serializers.IntegerField(min_value=1)
+    clock_in_time = serializers.DateTimeField(required=False, allow_null=True)
+    clock_out_time = serializers.DateTimeField(required=False, allow_null=True)
+
+    def validate(self, data):
+        if not data.get('clock_in_time') and not data.get('clock_out_time'):
+            raise serializers.ValidationError({'clock_in_time': 'An event needs a clock-in time, a clock-out time or both.'})
+        if data.get('clock_in_time') and data.get('clock_out_time') and data['clock_out_time'] < data['clock_in_time']:
+            raise serializers.ValidationError({'clock_out_time': 'Clock-out time must not be before clock-in time.'})
+        return data
+
+# Bulk Ingestion
+# --------------------------------------------------------
+def validate_events(events):
+    """
+    Validate each event of an upload on its own.
+
+    Returns:
+        tuple: `(valid, results)` where `valid` maps the index of each valid
+               event to its validated data, and `results` holds the error
+               result of every invalid event, keyed by index.
+    """
+    valid, results = {}, {}
+    for index, event in enumerate(events):
+        serializer = AttendanceEventSerializer(data=event)
+        if serializer.is_valid():
+            valid[index] = serializer.validated_data
+        else:
+            results[index] = {'index': index, 'event_id': event.get('event_id') if isinstance(event, dict) else None, 'status': 'error', 'errors': serializer.errors}
+    return valid, results
+
+def is_clock_out(data):
+    return not data.get('clock_in_time')
+
+def plan_inserts(valid, results):
+    """
+    Resolve duplicates, unknown employees and open sessions for an upload.
+
+    Runs four queries regardless of the upload size: existing event ids in the
+    hot and archive tables, existing employees and already-open sessions, plus
+    a fifth when the upload has clock-out events: sessions already closed at
+    those times, so a re-sent clock-out is reported as a duplicate. Events are
+    applied in upload order, so a clock-out closes the session opened by an
+    earlier clock-in of the same upload or the one already open in the table.
+
+    Args:
+        valid (dict): Validated events keyed by their index in the upload.
+        results (dict): Per-index results; rejected and duplicate events are added to it.
+
+    Returns:
+        tuple: `(inserts, closes)`, where `inserts` are `(index, Attendance)`
+               pairs of the logs to insert and `closes` are `(index, Attendance,
+               stored)` triples of the sessions clock-out events close, both in
+               upload order; `stored` is False for sessions inserted by the upload.
+    """
+    event_ids = [data['event_id'] for data in valid.values()]
+    existing_events = dict(AttendanceArchive.objects.filter(event_id__in=event_ids).values_list('event_id', 'id'))
+    existing_events.update(Attendance.objects.filter(event_id__in=event_ids).values_list('event_id', 'id'))
+    employees = set(Employee.objects.filter(id__in={data['employee'] for data in valid.values()}).values_list('id', flat=True))
+    open_sessions = {
+        employee_id: Attendance(pk=pk, employee_id=employee_id, clock_in_time=clock_in_time)
+        for employee_id, pk, clock_in_time in Attendance.objects
+        .filter(employee_id__in={data['employee'] for data in valid.values() if not data.get('clock_out_time') or is_clock_out(data)}, clock_out_time__isnull=True)
+        .values_list('employee_id', 'id', 'clock_in_time')
+    }
+    clock_outs = [data for data in valid.values() if is_clock_out(data)]
+    closed_sessions = {}
+    if clock_outs:
+        closed_sessions = {
+            (employee_id, clock_out_time): pk
+            for employee_id, clock_out_time, pk in Attendance.objects
+            .filter(employee_id__in={data['employee'] for data in clock_outs}, clock_out_time__in={data['clock_out_time'] for data in clock_outs})
+            .values_list('employee_id', 'clock_out_time', 'id')
+        }
+
+    inserts, closes, seen = [], [], set()
+    for index, data in sorted(valid.items()):
+        event_id, employee_id = data['event_id'], data['employee']
+        if event_id in existing_events:
+            results[index] = {'index': index, 'event_id': event_id, 'status': 'duplicate', 'id': existing_events[event_id]}
+        elif event_id in seen:
+            results[index] = {'index': index, 'event_id': event_id, 'status': 'duplicate', 'id': None}
+        elif employee_id not in employees:
+            results[index] = {'index': index, 'event_id': event_id, 'status': 'error', 'errors': {'employee': [f'Invalid pk "{employee_id}" - object does not exist.']}}
+        elif is_clock_out(data):
+            at = data['clock_out_time']
+            session = open_sessions.get(employee_id)
+            if (employee_id, at) in closed_sessions:
+                results[index] = {'index': index, 'event_id': event_id, 'status': 'duplicate', 'id': closed_sessions[employee_id, at]}
+            elif session is None:
+                results[index] = {'index': index, 'event_id': event_id, 'status': 'error', 'errors': {'clock_out_time': ['This employee has no open attendance session.']}}
+            elif at < session.clock_in_time:
+                results[index] = {'index': index, 'event_id': event_id, 'status': 'error', 'errors': {'clock_out_time': ['Clock-out time must not be before clock-in time.']}}
+            else:
+                seen.add(event_id)
+                del open_sessions[employee_id]
+                # A session opened earlier in this upload is simply inserted closed
+                closes.append((index, session, session.pk is not None))
+                session.clock_out_time = at
+        elif not data.get('clock_out_time') and employee_id in open_sessions:
+            results[index] = {'index': index, 'event_id': event_id, 'status': 'error', 'errors': {'clock_out_time': ['This employee already has an open attendance session.']}}
+        else:
+            seen.add(event_id)
+            log = Attendance(
+                event_id=event_id,
+                employee_id=employee_id,
+                clock_in_time=data['clock_in_time'],
+                clock_out_time=data.get('clock_out_time'),
+            )
+            if not log.clock_out_time:
+                open_sessions[employee_id] = log
+            inserts.append((index, log))
+    return inserts, closes
+
+def close_sessions(closes):
+    """
+    Close stored open sessions with the same conditional `UPDATE` as `clock_out`.
+
+    Returns:
+        set: The indexes of the clock-out events that did not close anything
+             because a concurrent request closed the session first.
+    """
+    lost = set()
+    for index, session, stored in closes:
+        if not stored:
+            continue
+        session.set_duration()
+        if not Attendance.objects.filter(pk=session.pk, clock_out_time__isnull=True).update(clock_out_time=session.clock_out_time, duration_seconds=session.duration_seconds):
+            lost.add(index)
+    return lost
+
+def ingest_events(events, batch_size, attempts=2):
+    """
+    Validate and ingest a batch of buffered terminal events.
+
+    Valid, new events are written with `bulk_create` in batches of
+    `batch_size` inside one transaction; clock-out events close their
+    session with one conditional `UPDATE` each, and `attendance_bulk_saved`
+    is sent once for every log written. Events whose `event_id` was already
+    ingested, and clock-outs of sessions already closed at that time, are
+    reported as duplicates, so re-sending an upload is safe. If a concurrent
+    upload wins a race on the same event ids, the transaction is rolled back
+    and the upload is planned again.
+
+    Args:
+        events (list): The raw event dicts of the upload.
+        batch_size (int): Rows per `INSERT` statement.
+        attempts (int): How many times to plan and insert before giving up.
+
+    Returns:
+        list: One result per event, in upload order, with `index`, `event_id`,
+              `status` ('created', 'closed', 'duplicate' or 'error') and either
+              the log `id` or the validation `errors`.
+    """
+    valid, invalid = validate_events(events)
+    for attempt in range(attempts):
+        results = dict(invalid)
+        try:
+            with transaction.atomic():
+                inserts, closes = plan_inserts(valid, results)
+                logs = Attendance.objects.bulk_create([log for _, log in inserts], batch_size=batch_size)
+                lost = close_sessions(closes)
+                closed = [session for index, session, stored in closes if stored and index not in lost]
+                if logs or closed:
+                    attendance_bulk_saved.send(sender=Attendance, instances=logs + closed)
+            break
+        except IntegrityError:
+            if attempt == attempts - 1:
+                raise
+    created = {}
+    for index, log in inserts:
+        created[log.event_id] = log.pk
+        results[index] = {'index': index, 'event_id': log.event_id, 'status': 'created', 'id': log.pk}
+    for index, session, _ in closes:
+        event_id = valid[index]['event_id']
+        if index in lost:
+            results[index] = {'index': index, 'event_id': event_id, 'status': 'error', 'errors': {'clock_out_time': ['This employee has no open attendance session.']}}
+        else:
+            created[event_id] = session.pk
+            results[index] = {'index': index, 'event_id': event_id, 'status': 'closed', 'id': session.pk}
+    for result in results.values():
+        # Repeats of an event within the same upload point at the log it created or closed
+        if result['status'] == 'duplicate' and result['id'] is None:
+            result['id'] = created.get(result['event_id'])
+    return [results[index] for index in range(len(events))]
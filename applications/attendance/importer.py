@@ -0,0 +1,182 @@
+import csv
+import io
+import json
+from itertools import islice
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from .models import Attendance, AttendanceArchive
+from .signals import attendance_bulk_saved
+
+# Import Errors
+# --------------------------------------------------------
+class ImportRowError(ValueError):
+    """
+    Raised for a row of an import file that cannot be turned into an attendance log.
+    """
+
+# Reading Import Files
+# --------------------------------------------------------
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+def detect_format(path):
+    """
+    Guess the format of an import file from its extension; CSV is the default.
+    """
+    return 'ndjson' if path.lower().endswith(('.ndjson', '.jsonl')) else 'csv'
+
+def read_rows(file, fmt):
+    """
+    Yield the records of an open import file one at a time.
+
+    Args:
+        file (file): A text file opened with `newline=''`.
+        fmt (str): 'csv' (with a header row) or 'ndjson' (one JSON object per line).
+
+    Yields:
+        dict: One record per data row; blank NDJSON lines are yielded as empty
+              dicts so row numbers always match the checkpoint.
+    """
+    if fmt == 'csv':
+        yield from csv.DictReader(file)
+        return
+    for line in file:
+        if not line.strip():
+            yield {}
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield record if isinstance(record, dict) else {'__invalid__': line}
+
+def batches(rows, size, start=0):
+    """
+    Group `rows` into lists of `size`, skipping the first `start` rows.
+
+    Yields:
+        tuple: `(first_row_number, rows)` pairs, where row numbers start at 0.
+    """
+    rows = islice(rows, start, None)
+    while batch := list(islice(rows, size)):
+        yield start, batch
+        start += len(batch)
+
+# Row Parsing
+# --------------------------------------------------------
+def parse_timestamp(value, field, required=True):
+    if value in (None, ''):
+        if required:
+            raise ImportRowError(f'{field} is required.')
+        return None
+    parsed = parse_datetime(str(value).strip())
+    if parsed is None:
+        raise ImportRowError(f'{field} is not a valid datetime: {value!r}.')
+    # Exports of the old system carry local wall-clock times
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+def parse_row(record, employees):
+    """
+    Turn one import record into an unsaved `Attendance`.
+
+    Args:
+        record (dict): The record with `employee_id`, `clock_in_time` and the
+                       optional `clock_out_time` and `event_id`.
+        employees (dict): Maps `Employee.employee_id` to the employee's primary key.
+
+    Returns:
+        Attendance: The log, with `duration_seconds` filled in.
+
+    Raises:
+        ImportRowError: If the record is malformed or refers to an unknown employee.
+    """
+    if not record or '__invalid__' in record:
+        raise ImportRowError('Row is empty or not a JSON object.')
+    reference = str(record.get('employee_id') or '').strip()
+    if reference not in employees:
+        raise ImportRowError(f'Unknown employee_id {reference!r}.')
+    log = Attendance(
+        employee_id=employees[reference],
+        clock_in_time=parse_timestamp(record.get('clock_in_time'), 'clock_in_time'),
+        clock_out_time=parse_timestamp(record.get('clock_out_time'), 'clock_out_time', required=False),
+        event_id=str(record.get('event_id') or '').strip() or None,
+    )
+    if log.clock_out_time and log.clock_out_time < log.clock_in_time:
+        raise ImportRowError('clock_out_time must not be before clock_in_time.')
+    if log.event_id and len(log.event_id) > Attendance._meta.get_field('event_id').max_length:
+        raise ImportRowError('event_id is too long.')
+    log.set_duration()
+    return log
+
+# Writing Batches
+# --------------------------------------------------------
+COPY_FIELDS = ['employee_id', 'clock_in_time', 'clock_out_time', 'duration_seconds', 'event_id']
+
+def copy_supported():
+    """
+    Whether `COPY FROM STDIN` is available on the default database connection.
+    """
+    return connection.vendor == 'postgresql' and connection.Database.__name__ == 'psycopg2'
+
+def copy_logs(logs):
+    """
+    Write `logs` with one PostgreSQL `COPY ... FROM STDIN` in CSV format.
+
+    `COPY` does not return primary keys, so the logs stay unsaved; the
+    summary receivers of `attendance_bulk_saved` only need the employee and
+    clock-in time.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for log in logs:
+        writer.writerow([
+            log.employee_id,
+            log.clock_in_time.isoformat(),
+            log.clock_out_time.isoformat() if log.clock_out_time else None,
+            log.duration_seconds,
+            log.event_id,
+        ])
+    buffer.seek(0)
+    table = connection.ops.quote_name(Attendance._meta.db_table)
+    columns = ', '.join(connection.ops.quote_name(field) for field in COPY_FIELDS)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+def import_batch(logs, batch_size, use_copy=False):
+    """
+    Insert one batch of parsed logs in a single transaction.
+
+    Logs whose `event_id` is already stored, in the hot or archive table, or
+    repeated within the batch are skipped, so re-importing a file that
+    carries event ids is harmless. `attendance_bulk_saved` is sent once for
+    the batch so the daily summaries and report versions follow.
+
+    Args:
+        logs (list): Unsaved `Attendance` instances.
+        batch_size (int): Rows per `INSERT` statement when `COPY` is not used.
+        use_copy (bool): Write with PostgreSQL `COPY` instead of `bulk_create`.
+
+    Returns:
+        int: The number of logs written.
+    """
+    event_ids = [log.event_id for log in logs if log.event_id]
+    with transaction.atomic():
+        if event_ids:
+            seen = set(AttendanceArchive.objects.filter(event_id__in=event_ids).values_list('event_id', flat=True))
+            seen.update(Attendance.objects.filter(event_id__in=event_ids).values_list('event_id', flat=True))
+            fresh = []
+            for log in logs:
+                if log.event_id and log.event_id in seen:
+                    continue
+                seen.add(log.event_id)
+                fresh.append(log)
+            logs = fresh
+        if not logs:
+            return 0
+        if use_copy:
+            copy_logs(logs)
+        else:
+            # Durations were set while parsing; the manager sets them again harmlessly
+            logs = Attendance.objects.bulk_create(logs, batch_size=batch_size)
+        attendance_bulk_saved.send(sender=Attendance, instances=logs)
+    return len(logs)
@@ -0,0 +1,51 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from applications.attendance.archive import archive_chunk, archive_cutoff, archive_enabled
+
+# Archive Attendance Command
+# -------------------------------------------------------------
+class Command(BaseCommand):
+    """
+    Management command that moves old closed sessions from `Attendance` to `AttendanceArchive`.
+
+    Sessions are moved in bounded chunks, each copied and deleted in its own
+    transaction, so the command can be stopped at any time and re-run to
+    resume. Reads of ranges older than the horizon merge the archive back in
+    transparently.
+
+    Archiving must be enabled with `ATTENDANCE_ARCHIVE_AFTER_DAYS`, and once
+    sessions have been archived the setting must stay enabled and must not be
+    raised. The horizon may be longer than the setting but never shorter:
+    reads of ranges inside the configured horizon skip the archive.
+
+    Example:
+        python manage.py archive_attendance --days 400 --chunk-size 5000 --max-chunks 100
+    """
+    help = 'Move closed attendance sessions older than the archive horizon to the archive table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ATTENDANCE_ARCHIVE_AFTER_DAYS, help='Archive sessions that clocked in more than this many days ago.')
+        parser.add_argument('--chunk-size', type=int, default=settings.ATTENDANCE_ARCHIVE_CHUNK_SIZE, help='Sessions moved per transaction.')
+        parser.add_argument('--max-chunks', type=int, help='Stop after this many chunks.')
+
+    def handle(self, *args, **options):
+        if not archive_enabled():
+            raise CommandError('Archiving is disabled; set ATTENDANCE_ARCHIVE_AFTER_DAYS to a positive number of days.')
+        if options['days'] < settings.ATTENDANCE_ARCHIVE_AFTER_DAYS:
+            raise CommandError(f'--days must be at least ATTENDANCE_ARCHIVE_AFTER_DAYS ({settings.ATTENDANCE_ARCHIVE_AFTER_DAYS}).')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be a positive integer.')
+
+        cutoff = archive_cutoff(options['days'])
+        started = time.monotonic()
+        moved = chunks = 0
+        while options['max_chunks'] is None or chunks < options['max_chunks']:
+            count = archive_chunk(cutoff, options['chunk_size'])
+            if not count:
+                break
+            moved += count
+            chunks += 1
+            self.stdout.write(f'Archived {moved} sessions in {chunks} chunk(s).')
+
+        self.stdout.write(self.style.SUCCESS(f'Attendance archive complete: {moved} sessions moved before {cutoff:%Y-%m-%d} in {time.monotonic() - started:.1f}s.'))
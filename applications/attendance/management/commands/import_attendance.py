@@ -0,0 +1,110 @@
+import os
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from applications.onboarding.models import Employee
+from applications.attendance.models import AttendanceImportCheckpoint
+from applications.attendance.importer import (
+    IMPORT_FORMATS, ImportRowError, batches, copy_supported, detect_format, import_batch, parse_row, read_rows,
+)
+
+# Import Attendance Command
+# -------------------------------------------------------------
+class Command(BaseCommand):
+    """
+    Management command that loads historical attendance logs from a CSV or NDJSON export.
+
+    Every record needs `employee_id` (the employee's `employee_id`, not the
+    primary key) and `clock_in_time`, and may carry `clock_out_time` and
+    `event_id`; naive timestamps are read in the configured time zone. The
+    file is streamed, so memory stays flat whatever its size, and employee
+    references are resolved through one dict loaded up front.
+
+    Rows are written in batches, each in its own transaction, with PostgreSQL
+    `COPY` when available and batched `INSERT`s otherwise. The number of rows
+    consumed is saved in an `AttendanceImportCheckpoint` row inside the same
+    transaction as each batch, so after a failure the same command resumes
+    exactly after the last committed batch and no batch is imported twice.
+    Rows carrying an `event_id` that is already stored are skipped as well,
+    so re-importing a file is harmless. Malformed rows are reported and skipped.
+
+    Example:
+        python manage.py import_attendance exports/site-a.csv --batch-size 5000
+    """
+    help = 'Import historical attendance logs from a CSV or NDJSON file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='The CSV or NDJSON file to import.')
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help='File format; guessed from the extension when omitted.')
+        parser.add_argument('--batch-size', type=int, default=settings.ATTENDANCE_IMPORT_BATCH_SIZE, help='Rows written per transaction.')
+        parser.add_argument('--checkpoint', help='Checkpoint name; defaults to the absolute path of the file.')
+        parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint and start from the first row.')
+        parser.add_argument('--no-copy', action='store_true', help='Use batched INSERTs even where COPY is available.')
+
+    def load_checkpoint(self, checkpoint, path):
+        state = AttendanceImportCheckpoint.objects.filter(name=checkpoint).values('path', 'rows', 'imported', 'duplicates', 'rejected').first()
+        if state is None:
+            return {'path': path, 'rows': 0, 'imported': 0, 'duplicates': 0, 'rejected': 0}
+        if state['path'] != path:
+            raise CommandError(f'Checkpoint {checkpoint} belongs to {state["path"]}; use --restart or another --checkpoint.')
+        return state
+
+    def save_checkpoint(self, checkpoint, state):
+        # Called inside the batch's transaction, so it commits with the rows it counts
+        AttendanceImportCheckpoint.objects.update_or_create(name=checkpoint, defaults=state)
+
+    def handle(self, *args, **options):
+        path = os.path.abspath(options['path'])
+        if not os.path.isfile(path):
+            raise CommandError(f'{options["path"]} does not exist.')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+        fmt = options['format'] or detect_format(path)
+        checkpoint = options['checkpoint'] or path
+        if options['restart']:
+            AttendanceImportCheckpoint.objects.filter(name=checkpoint).delete()
+        state = self.load_checkpoint(checkpoint, path)
+        if state['rows']:
+            self.stdout.write(f'Resuming after row {state["rows"]}.')
+
+        use_copy = copy_supported() and not options['no_copy']
+        employees = dict(Employee.objects.values_list('employee_id', 'id'))
+        # Row numbers as shown in an editor: CSV files start with a header line
+        first_line = 2 if fmt == 'csv' else 1
+        started, processed = time.monotonic(), 0
+        with open(path, newline='', encoding='utf-8-sig') as file:
+            for offset, records in batches(read_rows(file, fmt), options['batch_size'], start=state['rows']):
+                logs = []
+                for number, record in enumerate(records, start=offset + first_line):
+                    try:
+                        logs.append(parse_row(record, employees))
+                    except ImportRowError as error:
+                        state['rejected'] += 1
+                        self.stderr.write(f'Row {number}: {error}')
+                try:
+                    with transaction.atomic():
+                        imported = import_batch(logs, options['batch_size'], use_copy=use_copy)
+                        batch_state = {
+                            **state,
+                            'imported': state['imported'] + imported,
+                            'duplicates': state['duplicates'] + len(logs) - imported,
+                            'rows': offset + len(records),
+                        }
+                        self.save_checkpoint(checkpoint, batch_state)
+                except IntegrityError as error:
+                    raise CommandError(
+                        f'Rows {offset + first_line}-{offset + first_line + len(records) - 1} could not be written ({error}). '
+                        f'Fix the file and run the command again to resume.'
+                    )
+                state = batch_state
+                processed += len(records)
+                self.stdout.write(f'Processed {state["rows"]} rows, {processed / max(time.monotonic() - started, 1e-9):.0f} rows/s.')
+
+        AttendanceImportCheckpoint.objects.filter(name=checkpoint).delete()
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Attendance import complete: {state["imported"]} logs imported, {state["duplicates"]} duplicates skipped, '
+            f'{state["rejected"]} rows rejected, '
+            f'{state["rows"]} rows read in {elapsed:.1f}s ({processed / max(elapsed, 1e-9):.0f} rows/s, {"COPY" if use_copy else "INSERT"}).'
+        ))
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:21
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def close_duplicate_open_sessions(apps, schema_editor):
+    # Keep each employee's latest open session; older ones become zero-length
+    # sessions so the one-open-session constraint can be created.
+    Attendance = apps.get_model('attendance', 'Attendance')
+    open_sessions = Attendance.objects.filter(clock_out_time__isnull=True).order_by('employee_id', '-clock_in_time', '-id')
+    seen = set()
+    stale = []
+    for pk, employee_id in open_sessions.values_list('id', 'employee_id').iterator():
+        if employee_id in seen:
+            stale.append(pk)
+        seen.add(employee_id)
+    for offset in range(0, len(stale), 500):
+        Attendance.objects.filter(pk__in=stale[offset:offset + 500]).update(clock_out_time=F('clock_in_time'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0002_rename_clock_out_tiem_attendance_clock_out_time'),
+        ('onboarding', '0003_userdevice'),
+    ]
+
+    operations = [
+        migrations.RunPython(close_duplicate_open_sessions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(condition=models.Q(('clock_out_time__isnull', True)), fields=('employee',), name='unique_open_attendance_per_employee'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_unique_open_attendance'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='event_id',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0004_attendance_event_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['employee', 'clock_in_time'], name='attendance_employee_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['clock_in_time', 'id'], name='attendance_time_idx'),
+        ),
+        # The composite index now leads with the foreign key; drop its single-column index
+        migrations.AlterField(
+            model_name='attendance',
+            name='employee',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_logs', to='onboarding.employee'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:26
+
+from django.db import migrations, models
+
+
+def backfill_duration_seconds(apps, schema_editor):
+    Attendance = apps.get_model('attendance', 'Attendance')
+    closed = Attendance.objects.filter(clock_out_time__isnull=False).only('clock_in_time', 'clock_out_time').order_by('id')
+    batch = []
+    for log in closed.iterator(chunk_size=2000):
+        log.duration_seconds = (log.clock_out_time - log.clock_in_time).total_seconds()
+        batch.append(log)
+        if len(batch) >= 2000:
+            Attendance.objects.bulk_update(batch, ['duration_seconds'])
+            batch = []
+    Attendance.objects.bulk_update(batch, ['duration_seconds'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='duration_seconds',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_duration_seconds, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['duration_seconds'], name='attendance_duration_idx'),
+        ),
+    ]
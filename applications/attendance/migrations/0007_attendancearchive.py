@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0006_attendance_duration_seconds'),
+        ('onboarding', '0004_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('clock_in_time', models.DateTimeField()),
+                ('clock_out_time', models.DateTimeField()),
+                ('duration_seconds', models.FloatField()),
+                ('event_id', models.CharField(blank=True, max_length=64, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_attendance_logs', to='onboarding.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'clock_in_time'], name='attendance_archive_emp_idx'), models.Index(fields=['clock_in_time', 'id'], name='attendance_archive_time_idx'), models.Index(fields=['event_id'], name='attendance_archive_event_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,136 @@
-from django.db import models
+from datetime import datetime, timedelta
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
 from applications.onboarding.models import Employee
 
+# Presence Cache Keys
+# ----------------------------------
+PRESENCE_CACHE_KEY = 'attendance:presence'
+
+# Attendance Manager
+# ----------------------------------
+class AttendanceManager(models.Manager):
+    """
+    Manager implementing the clock-in / clock-out write paths.
+
+    Both operations are decided by the database rather than by a read followed
+    by a write: clock-in relies on the one-open-session-per-employee partial
+    unique constraint, and clock-out is a single conditional `UPDATE`. Parallel
+    requests for the same employee therefore cannot create duplicate open
+    sessions or close a session twice.
+
+    Methods:
+        clock_in(employee_id, at=None):
+            Open a new session for the employee.
+        clock_out(employee_id, at=None):
+            Close the employee's open session.
+        open_session(employee_id):
+            Return the employee's open session, if any.
+        presence():
+            Return the cached snapshot of everyone currently clocked in.
+    """
+    def open_session(self, employee_id):
+        return self.filter(employee_id=employee_id, clock_out_time__isnull=True).first()
+
+    def clock_in(self, employee_id, at=None):
+        """
+        Open a new attendance session.
+
+        Args:
+            employee_id (int): The primary key of the employee.
+            at (datetime, optional): The clock-in time; defaults to now.
+
+        Returns:
+            Attendance: The created session.
+
+        Raises:
+            IntegrityError: If the employee already has an open session. The
+                            insert runs in a savepoint, so the caller's
+                            transaction remains usable.
+        """
+        with transaction.atomic():
+            return self.create(employee_id=employee_id, clock_in_time=at or timezone.now())
+
+    def clock_out(self, employee_id, at=None):
+        """
+        Close the employee's open session with one conditional `UPDATE`.
+
+        The open session is read first to compute its duration, but the
+        `UPDATE ... WHERE clock_out_time IS NULL` decides: if a concurrent
+        request closed the session in between, nothing is written.
+        `QuerySet.update()` bypasses model signals, so `post_save` is sent for
+        the closed session to keep the listeners (daily rollups, report
+        versions) in step with regular saves.
+
+        Args:
+            employee_id (int): The primary key of the employee.
+            at (datetime, optional): The clock-out time; defaults to now.
+
+        Returns:
+            Attendance: The closed session, or None if the employee had no open session.
+        """
+        at = at or timezone.now()
+        with transaction.atomic():
+            session = self.open_session(employee_id)
+            if session is None or session.clock_in_time > at:
+                return None
+            session.clock_out_time = at
+            session.set_duration()
+            closed = self.filter(pk=session.pk, clock_out_time__isnull=True).update(clock_out_time=at, duration_seconds=session.duration_seconds)
+            if not closed:
+                return None
+            post_save.send(sender=self.model, instance=session, created=False, update_fields={'clock_out_time', 'duration_seconds'}, raw=False, using=self.db)
+            return session
+
+    def presence(self):
+        """
+        Return who is clocked in right now, served from the cache.
+
+        The snapshot is stored together with the attendance `DatasetVersion`
+        it was built under, and is reused only while that database marker is
+        unchanged, i.e. no session has been opened or closed since. The marker
+        lives in the database rather than the cache, so every web worker sees
+        a badge event as soon as it commits, even with a per-process cache
+        backend. A hit costs one primary-key lookup; a miss also runs one query
+        over open sessions only, which the partial unique index on
+        `clock_out_time IS NULL` answers without reading the rest of the table.
+
+        Returns:
+            dict: `as_of` (when the snapshot was built) and `sessions`, a list
+                  of dicts with the session and employee details, ordered by
+                  clock-in time.
+        """
+        # Bumped by the reporting signals after every attendance write commits
+        version = apps.get_model('reporting', 'DatasetVersion').objects.state(self.model)[0]
+        snapshot = cache.get(PRESENCE_CACHE_KEY)
+        if snapshot is not None and snapshot['version'] == version:
+            return snapshot
+        snapshot = {
+            'version': version,
+            'as_of': timezone.now(),
+            'sessions': list(
+                self.filter(clock_out_time__isnull=True)
+                .order_by('clock_in_time')
+                .values('id', 'employee_id', 'employee__employee_id', 'employee__full_name', 'employee__job_title', 'clock_in_time')
+            ),
+        }
+        cache.set(PRESENCE_CACHE_KEY, snapshot, settings.ATTENDANCE_PRESENCE_TTL)
+        return snapshot
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Insert logs in bulk, filling in `duration_seconds` as `save()` would.
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.set_duration()
+        return super().bulk_create(objs, *args, **kwargs)
+
 # Attendance Model
 # ----------------------------------
 class Attendance(models.Model):
@@ -15,20 +145,61 @@ class Attendance(models.Model):
         clock_in_time (DateTimeField): The date and time when the employee clocked in.
         clock_out_time (DateTimeField, optional): The date and time when the employee clocked out.
                                                  Can be null if the employee has not clocked out yet.
+                                                 An employee can have at most one such open session.
+        duration_seconds (FloatField, optional): Length of the session in seconds, stored so it can be
+                                                 filtered, sorted and aggregated in SQL. Maintained by
+                                                 `save()` and the manager's write paths; null while the
+                                                 session is open.
+        event_id (CharField, optional): Client-supplied identifier of the terminal event that
+                                        created the log, used to deduplicate bulk uploads.
 
     Methods:
         __str__(): Returns a string representation of the attendance log, 
                    including the employee's name and clock-in time.
+        set_duration(): Recomputes `duration_seconds` from the clock-in and clock-out times.
         duration (timedelta): A property that calculates the duration between 
                               clock-in and clock-out times. Returns None if the 
                               clock-out time is not set.
     """
-    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='attendance_logs')
+    # Covered by the (employee, clock_in_time) index below
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='attendance_logs', db_index=False)
     clock_in_time = models.DateTimeField()
     clock_out_time = models.DateTimeField(null=True, blank=True)
+    duration_seconds = models.FloatField(null=True, blank=True, editable=False)
+    event_id = models.CharField(max_length=64, unique=True, null=True, blank=True)
+
+    objects = AttendanceManager()
+
+    class Meta:
+        indexes = [
+            # Per-employee history and date-range reports
+            models.Index(fields=['employee', 'clock_in_time'], name='attendance_employee_time_idx'),
+            # Time-ordered scans and (clock_in_time, id) keyset pages
+            models.Index(fields=['clock_in_time', 'id'], name='attendance_time_idx'),
+            # Duration thresholds, e.g. sessions longer than 10 hours
+            models.Index(fields=['duration_seconds'], name='attendance_duration_idx'),
+        ]
+        # The partial unique constraint also indexes open sessions (clock_out_time IS NULL)
+        constraints = [
+            models.UniqueConstraint(
+                fields=['employee'],
+                condition=Q(clock_out_time__isnull=True),
+                name='unique_open_attendance_per_employee',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.employee.name} - {self.clock_in_time}'
+
+    def set_duration(self):
+        self.duration_seconds = self.duration.total_seconds() if self.clock_out_time else None
+
+    def save(self, *args, **kwargs):
+        self.set_duration()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'clock_in_time', 'clock_out_time'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'duration_seconds'}
+        super().save(*args, **kwargs)
     
     @property
     def duration(self):
@@ -43,3 +214,157 @@ class Attendance(models.Model):
         if self.clock_out_time:
             return self.clock_out_time - self.clock_in_time
         return None
+
+# Attendance Archive Model
+# ----------------------------------
+class AttendanceArchive(models.Model):
+    """
+    Cold storage for closed attendance sessions older than the archive horizon.
+
+    Rows are moved here from `Attendance` by the `archive_attendance` command
+    and keep their original primary key, so ids stay unique across both tables
+    and merged reads can order by `(clock_in_time, id)`. Only closed sessions
+    are archived; open sessions always stay in the hot table.
+
+    Attributes:
+        id (BigIntegerField): The primary key the session had in `Attendance`.
+        employee (ForeignKey): A reference to the Employee model.
+        clock_in_time (DateTimeField): The date and time when the employee clocked in.
+        clock_out_time (DateTimeField): The date and time when the employee clocked out.
+        duration_seconds (FloatField): Length of the session in seconds.
+        event_id (CharField, optional): Client-supplied identifier of the terminal event.
+        archived_at (DateTimeField): When the session was moved to the archive.
+
+    Methods:
+        __str__(): Returns a string representation of the archived log.
+        duration (timedelta): The time difference between clock-out and clock-in.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='archived_attendance_logs', db_index=False)
+    clock_in_time = models.DateTimeField()
+    clock_out_time = models.DateTimeField()
+    duration_seconds = models.FloatField()
+    event_id = models.CharField(max_length=64, null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'clock_in_time'], name='attendance_archive_emp_idx'),
+            models.Index(fields=['clock_in_time', 'id'], name='attendance_archive_time_idx'),
+            models.Index(fields=['event_id'], name='attendance_archive_event_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.employee.full_name} - {self.clock_in_time} (archived)'
+
+    @property
+    def duration(self):
+        return self.clock_out_time - self.clock_in_time
+
+
+# Shift Model
+# ----------------------------------
+class Shift(models.Model):
+    """
+    A named working-time template, such as 'Day' from 08:00 to 17:00.
+
+    Times are local wall-clock times in the project `TIME_ZONE`. A shift whose
+    end time is at or before its start time ends on the following day.
+
+    Attributes:
+        name (CharField): Unique name of the shift.
+        start_time (TimeField): Local time the shift starts.
+        end_time (TimeField): Local time the shift ends.
+        grace_minutes (PositiveIntegerField): Minutes after the start within
+                                              which a clock-in does not count as late.
+
+    Methods:
+        __str__(): Returns the shift name and its hours.
+        window(day): Returns the aware `(start, end)` datetimes of the shift on a day.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    grace_minutes = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f'{self.name} ({self.start_time:%H:%M}-{self.end_time:%H:%M})'
+
+    def window(self, day):
+        """
+        Return the scheduled `(start, end)` of this shift when assigned on `day`.
+
+        Args:
+            day (date): The local day the shift starts on.
+
+        Returns:
+            tuple: Two aware datetimes.
+        """
+        end_day = day + timedelta(days=1) if self.end_time <= self.start_time else day
+        return (
+            timezone.make_aware(datetime.combine(day, self.start_time)),
+            timezone.make_aware(datetime.combine(end_day, self.end_time)),
+        )
+
+# Shift Assignment Model
+# ----------------------------------
+class ShiftAssignment(models.Model):
+    """
+    Assigns a shift to an employee on one day; an employee has at most one shift per day.
+
+    Attributes:
+        employee (ForeignKey): The employee who is expected to work.
+        shift (ForeignKey): The shift worked; shifts in use cannot be deleted.
+        date (DateField): The local day the shift starts on.
+
+    Methods:
+        __str__(): Returns the employee, day and shift.
+    """
+    # Covered by the (employee, date) unique constraint below
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='shift_assignments', db_index=False)
+    shift = models.ForeignKey(Shift, on_delete=models.PROTECT, related_name='assignments')
+    date = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['employee', 'date'], name='unique_shift_assignment_per_day'),
+        ]
+        indexes = [
+            # Whole-workforce scans of a date range
+            models.Index(fields=['date'], name='shift_assignment_date_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.employee.full_name} - {self.date} - {self.shift.name}'
+
+
+# Attendance Import Checkpoint Model
+# ----------------------------------
+class AttendanceImportCheckpoint(models.Model):
+    """
+    Progress of an `import_attendance` run, saved in the same transaction as each batch.
+
+    Because the checkpoint commits together with the rows it counts, a crash
+    can never leave a committed batch that the checkpoint does not cover, so
+    a resumed import never writes a batch twice, with or without event ids.
+
+    Attributes:
+        name (CharField): Identifies the import; the absolute path of the file by default.
+        path (CharField): The absolute path of the file being imported.
+        rows (PositiveIntegerField): Data rows consumed so far, committed or rejected.
+        imported (PositiveIntegerField): Logs written so far.
+        duplicates (PositiveIntegerField): Rows skipped because their event id was already stored.
+        rejected (PositiveIntegerField): Malformed rows skipped so far.
+        updated_at (DateTimeField): When the last batch was committed.
+    """
+    name = models.CharField(max_length=1024, unique=True)
+    path = models.CharField(max_length=1024)
+    rows = models.PositiveIntegerField(default=0)
+    imported = models.PositiveIntegerField(default=0)
+    duplicates = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f'{self.name} - {self.rows} rows'
+
@@ -1,5 +1,8 @@
+from datetime import timedelta
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
+from applications.onboarding.models import Employee
+from core.serialization import ValuesSerializer
 from .models import Attendance
 
 # Attendance Serializer
@@ -20,12 +23,56 @@ class AttendanceSerializer(serializers.ModelSerializer):
         clock_out_time (datetime): The date - time when the employee clocks out.
         duration (timedelta): Read-only field representing the duration 
                               between clock-in and clock-out times.
+        duration_seconds (float): Read-only length of the session in seconds,
+                                  or null while the session is open.
     """
     @extend_schema_field(serializers.CharField())
     def get_duration(self, obj):
-        return str(obj.duration) if obj.duration else "Null"
+        duration = obj.duration
+        return str(duration) if duration else "Null"
+
+    def validate(self, data):
+        """
+        Reject a second open session for the same employee.
+
+        The partial unique constraint is the final guard; this check turns the
+        common case into a 400 instead of a database error.
+        """
+        employee = data.get('employee', getattr(self.instance, 'employee', None))
+        clock_out_time = data.get('clock_out_time', getattr(self.instance, 'clock_out_time', None))
+        if employee is not None and clock_out_time is None:
+            open_sessions = Attendance.objects.filter(employee=employee, clock_out_time__isnull=True)
+            if self.instance is not None:
+                open_sessions = open_sessions.exclude(pk=self.instance.pk)
+            if open_sessions.exists():
+                raise serializers.ValidationError({'clock_out_time': 'This employee already has an open attendance session.'})
+        return data
     
     class Meta:
         model = Attendance
-        fields = [ 'id', 'employee', 'clock_in_time', 'clock_out_time', 'duration' ]
-        read_only_fields = [ 'duration' ]
+        fields = [ 'id', 'employee', 'clock_in_time', 'clock_out_time', 'duration', 'duration_seconds' ]
+        read_only_fields = [ 'duration', 'duration_seconds' ]
+
+def session_duration(duration_seconds):
+    """
+    Rebuild the `duration` of a session from its stored `duration_seconds`.
+
+    `duration` is rendered from the model property, a timedelta or None, so
+    the list read path returns the same value without loading the instance.
+    """
+    return timedelta(seconds=duration_seconds) if duration_seconds is not None else None
+
+# Read path of the list endpoint; the duration comes from the stored column
+ATTENDANCE_VALUES = ValuesSerializer(AttendanceSerializer, computed={'duration': (('duration_seconds',), session_duration)})
+
+# Clock Serializer
+# --------------------------------------------------------
+class ClockSerializer(serializers.Serializer):
+    """
+    Serializer for clock-in and clock-out requests.
+
+    Fields:
+        employee (int): Primary key of the employee clocking in or out. The
+                        time is always taken from the server clock.
+    """
+    employee = serializers.PrimaryKeyRelatedField(queryset=Employee.objects.all())
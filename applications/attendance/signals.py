@@ -0,0 +1,8 @@
+from django.dispatch import Signal
+
+# Attendance Signals
+# ----------------------------------
+# Sent after attendance logs are written in bulk (e.g. with `bulk_create`),
+# which bypasses the per-row `post_save` signal. Receivers get the saved
+# logs as `instances` and should handle them as one batch.
+attendance_bulk_saved = Signal()
@@ -1,7 +1,18 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.utils import timezone as django_timezone
+from threading import Barrier
+from django.db import connection
 from applications.onboarding.models import Employee
-from applications.attendance.models import Attendance
-from datetime import datetime, timezone
+from applications.attendance.bulk import ingest_events
+from applications.attendance.models import Attendance, AttendanceArchive, AttendanceImportCheckpoint
+from applications.attendance.serializers import ATTENDANCE_VALUES, AttendanceSerializer
+from datetime import date, datetime, timezone
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
@@ -26,6 +37,356 @@ def test_create_attendance():
     assert attendance.employee.full_name == 'Tester test'
     assert attendance.duration.total_seconds() == 8 * 3600
 
+# Clock In / Clock Out Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_clock_in_and_clock_out(create_employee, authenticated_client):
+    employee = create_employee()
+    client = authenticated_client()
+
+    response = client.post('/api/attendance/clock-in/', {'employee': employee.id})
+    assert response.status_code == 201
+    assert response.data['clock_out_time'] is None
+
+    response = client.post('/api/attendance/clock-in/', {'employee': employee.id})
+    assert response.status_code == 409
+
+    response = client.post('/api/attendance/clock-out/', {'employee': employee.id})
+    assert response.status_code == 200
+    assert response.data['clock_out_time'] is not None
+    assert employee.daily_summaries.get().session_count == 1
+
+    # The session is already closed; a repeated clock-out must not move it
+    assert client.post('/api/attendance/clock-out/', {'employee': employee.id}).status_code == 409
+    assert client.post('/api/attendance/clock-in/', {'employee': 999}).status_code == 400
+
+@pytest.mark.django_db
+def test_second_open_session_is_rejected_by_serializer(create_employee, authenticated_client):
+    employee = create_employee()
+    Attendance.objects.clock_in(employee.id)
+    response = authenticated_client().post('/api/attendance/logs/', {
+        'employee': employee.id,
+        'clock_in_time': '2024-11-26T09:00:00Z',
+    })
+    assert response.status_code == 400
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_clock_ins_open_one_session(create_employee, staff_user, authenticated_client):
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        pytest.skip('Shared-cache in-memory SQLite fails concurrent writers instead of blocking them; set TEST_NAME to a file.')
+    employee = create_employee()
+    # Created up front so the workers do not race to create the user
+    staff_user()
+    workers = 8
+    barrier = Barrier(workers)
+
+    def clock_in():
+        client = authenticated_client()
+        barrier.wait()
+        try:
+            return client.post('/api/attendance/clock-in/', {'employee': employee.id}).status_code
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        codes = list(pool.map(lambda _: clock_in(), range(workers)))
+
+    assert sorted(codes) == [201] + [409] * (workers - 1)
+    assert Attendance.objects.filter(employee=employee, clock_out_time__isnull=True).count() == 1
+
+# Bulk Ingestion Tests
+# ------------------------------
+def bulk_events(employee, count):
+    return [
+        {
+            'event_id': f'terminal-1:{day}',
+            'employee': employee.id,
+            'clock_in_time': f'2024-11-{day + 1:02d}T09:00:00Z',
+            'clock_out_time': f'2024-11-{day + 1:02d}T17:00:00Z',
+        } for day in range(count)
+    ]
+
+@pytest.mark.django_db
+def test_bulk_ingestion_reports_per_item_results(settings, django_assert_max_num_queries, create_employee, authenticated_client):
+    settings.ATTENDANCE_BULK_BATCH_SIZE = 10
+    employee = create_employee()
+    client = authenticated_client()
+    events = bulk_events(employee, 25) + [
+        {'event_id': 'terminal-1:0', 'employee': employee.id, 'clock_in_time': '2024-11-01T09:00:00Z'},
+        {'event_id': 'terminal-1:bad', 'employee': 999, 'clock_in_time': '2024-11-30T09:00:00Z'},
+        {'event_id': 'terminal-1:late', 'employee': employee.id, 'clock_in_time': '2024-11-30T09:00:00Z', 'clock_out_time': '2024-11-30T08:00:00Z'},
+    ]
+
+    # 3 lookups, 3 batched inserts and the batched rollup refresh, not one round trip per event
+    with django_assert_max_num_queries(12):
+        response = client.post('/api/attendance/logs/bulk/', events, format='json')
+    assert response.status_code == 200
+    assert (response.data['created'], response.data['duplicate'], response.data['error']) == (25, 1, 2)
+    results = response.data['results']
+    assert results[25]['status'] == 'duplicate' and results[25]['id'] == results[0]['id']
+    assert results[26]['errors']['employee']
+    assert results[27]['errors']['clock_out_time']
+    assert Attendance.objects.count() == 25
+    assert employee.daily_summaries.count() == 25
+
+    # Re-sending the upload creates nothing new
+    response = client.post('/api/attendance/logs/bulk/', events[:25], format='json')
+    assert response.data['duplicate'] == 25
+    assert Attendance.objects.count() == 25
+
+@pytest.mark.django_db
+def test_bulk_ingestion_closes_sessions_with_clock_out_events(create_employee, authenticated_client):
+    employee = create_employee()
+    other = create_employee(1, full_name='Other')
+    stored = Attendance.objects.clock_in(employee.id, at=datetime(2024, 11, 26, 9, 0, tzinfo=timezone.utc))
+    events = [
+        {'event_id': 'in-other', 'employee': other.id, 'clock_in_time': '2024-11-26T08:00:00Z'},
+        {'event_id': 'out-1', 'employee': employee.id, 'clock_out_time': '2024-11-26T17:00:00Z'},
+        {'event_id': 'out-other', 'employee': other.id, 'clock_out_time': '2024-11-26T16:00:00Z'},
+        {'event_id': 'out-none', 'employee': employee.id, 'clock_out_time': '2024-11-26T18:00:00Z'},
+        {'event_id': 'empty', 'employee': employee.id},
+    ]
+    response = authenticated_client().post('/api/attendance/logs/bulk/', events, format='json')
+    assert (response.data['created'], response.data['closed'], response.data['error']) == (1, 2, 2)
+    results = response.data['results']
+    assert results[1]['id'] == stored.id
+    assert results[3]['errors']['clock_out_time'] and results[4]['errors']['clock_in_time']
+    assert Attendance.objects.get(pk=stored.id).duration_seconds == 8 * 3600
+    assert Attendance.objects.get(pk=results[2]['id']).duration_seconds == 8 * 3600
+    assert not Attendance.objects.filter(clock_out_time__isnull=True).exists()
+    assert employee.daily_summaries.get().worked_seconds == 8 * 3600
+
+    # Re-sent clock-outs are duplicates of the sessions they closed
+    response = authenticated_client().post('/api/attendance/logs/bulk/', events[1:3], format='json')
+    assert response.data['duplicate'] == 2
+    assert [result['id'] for result in response.data['results']] == [stored.id, results[2]['id']]
+
+@pytest.mark.django_db
+def test_bulk_ingestion_rejects_bad_payloads(settings, create_employee, authenticated_client):
+    settings.ATTENDANCE_BULK_MAX_EVENTS = 2
+    employee = create_employee()
+    client = authenticated_client()
+    assert client.post('/api/attendance/logs/bulk/', {'event_id': 'x'}, format='json').status_code == 400
+    assert client.post('/api/attendance/logs/bulk/', bulk_events(employee, 3), format='json').status_code == 400
+
+# Stored Duration Test
+# ------------------------------
+@pytest.mark.django_db
+def test_duration_seconds_is_maintained_on_every_write_path(create_employee, authenticated_client):
+    employee = create_employee()
+    log = Attendance.objects.create(employee=employee, clock_in_time=datetime(2024, 11, 26, 9, 0, tzinfo=timezone.utc))
+    assert log.duration_seconds is None
+
+    log.clock_out_time = datetime(2024, 11, 26, 20, 0, tzinfo=timezone.utc)
+    log.save(update_fields=['clock_out_time'])
+    Attendance.objects.bulk_create([Attendance(
+        employee=employee,
+        clock_in_time=datetime(2024, 11, 27, 9, 0, tzinfo=timezone.utc),
+        clock_out_time=datetime(2024, 11, 27, 13, 0, tzinfo=timezone.utc),
+    )])
+    Attendance.objects.clock_in(employee.id)
+    closed = Attendance.objects.clock_out(employee.id)
+
+    assert list(Attendance.objects.filter(duration_seconds__gt=10 * 3600).values_list('id', flat=True)) == [log.id]
+    assert Attendance.objects.get(pk=closed.pk).duration_seconds == closed.duration_seconds >= 0
+    response = authenticated_client().get(f'/api/attendance/logs/{log.id}/')
+    assert response.data['duration_seconds'] == 11 * 3600
+
+# Attendance List Filtering Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_attendance_list_filters_and_pages(settings, django_assert_num_queries, create_employee, authenticated_client):
+    settings.ATTENDANCE_PAGE_SIZE = 2
+    employee = create_employee()
+    other = create_employee(1, full_name='Other')
+    for day in range(1, 6):
+        Attendance.objects.create(
+            employee=employee,
+            clock_in_time=datetime(2024, 11, day, 9, 0, tzinfo=timezone.utc),
+            clock_out_time=datetime(2024, 11, day, 17, 0, tzinfo=timezone.utc),
+        )
+    Attendance.objects.create(employee=other, clock_in_time=datetime(2024, 11, 3, 9, 0, tzinfo=timezone.utc))
+    client = authenticated_client()
+
+    pages, cursor = [], None
+    while True:
+        params = {'employee': employee.id, 'from': '2024-11-02', 'to': '2024-11-05'}
+        if cursor:
+            params['cursor'] = cursor
+        with django_assert_num_queries(1):
+            response = client.get('/api/attendance/logs/', params)
+        assert response.status_code == 200
+        pages.append([log['clock_in_time'] for log in response.data])
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+    assert pages == [
+        ['2024-11-02T12:00:00+03:00', '2024-11-03T12:00:00+03:00'],
+        ['2024-11-04T12:00:00+03:00', '2024-11-05T12:00:00+03:00'],
+    ]
+
+    response = client.get('/api/attendance/logs/', {'open': 'true'})
+    assert [log['employee'] for log in response.data] == [other.id]
+    assert client.get('/api/attendance/logs/', {'from': '2024-12-01'}).status_code == 404
+    assert client.get('/api/attendance/logs/', {'limit': 5000}).status_code == 400
+    assert client.get('/api/attendance/logs/', {'open': 'maybe'}).status_code == 400
+
+# Values Serializer Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_attendance_values_serializer_matches_model_serializer(create_employee, authenticated_client):
+    employee = create_employee()
+    clock_in = datetime(2024, 11, 26, 6, 0, 0, 123456, tzinfo=timezone.utc)
+    Attendance.objects.create(employee=employee, clock_in_time=clock_in, clock_out_time=clock_in + timedelta(hours=8, microseconds=7))
+    Attendance.objects.create(employee=employee, clock_in_time=clock_in + timedelta(days=1), clock_out_time=clock_in + timedelta(days=1))
+    Attendance.objects.create(employee=employee, clock_in_time=clock_in + timedelta(days=2))
+
+    logs = Attendance.objects.order_by('id')
+    expected = AttendanceSerializer(logs, many=True).data
+    assert ATTENDANCE_VALUES.serialize(logs.values_list(*ATTENDANCE_VALUES.columns)) == expected
+    assert [log['duration'] for log in expected] == [timedelta(hours=8, microseconds=7), timedelta(0), None]
+    assert authenticated_client().get('/api/attendance/logs/').content == JSONRenderer().render(expected)
+
+# Presence Tests
+# ------------------------------
+@pytest.mark.django_db(transaction=True)
+def test_presence_is_cached_and_follows_badge_events(django_assert_num_queries, create_employee, authenticated_client):
+    cache.clear()
+    employee = create_employee()
+    other = create_employee(1000, full_name='Other', job_title='Nurse')
+    client = authenticated_client()
+    client.post('/api/attendance/clock-in/', {'employee': employee.id})
+    client.post('/api/attendance/clock-in/', {'employee': other.id})
+
+    response = client.get('/api/attendance/presence/')
+    assert response.data['headcount'] == 2
+    assert [entry['employee_id'] for entry in response.data['present']] == ['E1000', 'E2000']
+    # A hit only checks the attendance version marker
+    with django_assert_num_queries(1):
+        assert client.get('/api/attendance/presence/').data['headcount'] == 2
+
+    client.post('/api/attendance/clock-out/', {'employee': employee.id})
+    with django_assert_num_queries(2):
+        response = client.get('/api/attendance/presence/')
+    assert [entry['full_name'] for entry in response.data['present']] == ['Other']
+
+    ingest_events([{'event_id': 'presence-1', 'employee': employee.id, 'clock_in_time': '2030-01-01T08:00:00Z'}], batch_size=10)
+    assert client.get('/api/attendance/presence/').data['headcount'] == 2
+    Attendance.objects.filter(employee=other).delete()
+    assert client.get('/api/attendance/presence/').data['headcount'] == 1
+
+# Attendance Archive Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_archive_moves_old_sessions_and_reads_stay_transparent(settings, django_assert_num_queries, create_employee, authenticated_client):
+    settings.ATTENDANCE_ARCHIVE_AFTER_DAYS = 30
+    employee = create_employee()
+    client = authenticated_client()
+    now = django_timezone.now()
+    for days_ago in (90, 60, 45, 5, 2):
+        clock_in = now - timedelta(days=days_ago)
+        Attendance.objects.create(employee=employee, clock_in_time=clock_in, clock_out_time=clock_in + timedelta(hours=8))
+    before = list(client.get('/api/attendance/logs/').data)
+    summaries = list(employee.daily_summaries.order_by('date').values_list('date', 'session_count', 'worked_seconds'))
+
+    call_command('archive_attendance', chunk_size=2, stdout=StringIO())
+    assert AttendanceArchive.objects.count() == 3
+    assert Attendance.objects.count() == 2
+
+    # Archived sessions are merged back in, in order, and the rollups are untouched
+    assert list(client.get('/api/attendance/logs/').data) == before
+    assert list(employee.daily_summaries.order_by('date').values_list('date', 'session_count', 'worked_seconds')) == summaries
+    response = client.get('/api/attendance/logs/', {'from': (now - timedelta(days=70)).date(), 'limit': 2})
+    assert [log['id'] for log in response.data] == [before[1]['id'], before[2]['id']]
+
+    # Links from the list keep working once archived, read-only
+    assert client.get(f"/api/attendance/logs/{before[0]['id']}/").data == before[0]
+    assert client.delete(f"/api/attendance/logs/{before[0]['id']}/").status_code == 409
+    assert AttendanceArchive.objects.filter(pk=before[0]['id']).exists()
+
+    # Recent ranges never touch the archive
+    with django_assert_num_queries(1):
+        response = client.get('/api/attendance/logs/', {'from': (now - timedelta(days=10)).date()})
+    assert len(response.data) == 2
+
+    # A late upload for an archived day is summarised together with the archived session
+    archived_day = now - timedelta(days=45)
+    Attendance.objects.bulk_create([Attendance(employee=employee, clock_in_time=archived_day + timedelta(minutes=1), clock_out_time=archived_day + timedelta(hours=1))])
+    Attendance.objects.filter(clock_in_time=archived_day + timedelta(minutes=1)).get().save()
+    assert employee.daily_summaries.get(date=django_timezone.localtime(archived_day).date()).session_count == 2
+
+@pytest.mark.django_db
+def test_archive_command_requires_archiving_enabled(settings):
+    settings.ATTENDANCE_ARCHIVE_AFTER_DAYS = 0
+    with pytest.raises(CommandError):
+        call_command('archive_attendance', stdout=StringIO())
+    settings.ATTENDANCE_ARCHIVE_AFTER_DAYS = 30
+    with pytest.raises(CommandError):
+        call_command('archive_attendance', days=10, stdout=StringIO())
+
+# Attendance Import Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_import_attendance_streams_batches_and_resumes(tmp_path, create_employee):
+    employee = create_employee()
+    path = tmp_path / 'export.csv'
+    path.write_text(
+        'employee_id,clock_in_time,clock_out_time,event_id\n'
+        'E1000,2024-03-01 08:00:00,2024-03-01 17:00:00,old-1\n'
+        'E9999,2024-03-01 08:00:00,2024-03-01 17:00:00,old-2\n'
+        'E1000,2024-03-02 08:00:00,2024-03-02 12:30:00,old-3\n'
+        'E1000,not a date,,old-4\n'
+        'E1000,2024-03-03T08:00:00+03:00,,old-5\n'
+    )
+    # A previous run committed the first batch before failing
+    Attendance.objects.create(employee=employee, event_id='old-1', clock_in_time=datetime(2024, 3, 1, 5, 0, tzinfo=timezone.utc), clock_out_time=datetime(2024, 3, 1, 14, 0, tzinfo=timezone.utc))
+    AttendanceImportCheckpoint.objects.create(name=str(path), path=str(path), rows=2, imported=1, rejected=1)
+
+    stdout, stderr = StringIO(), StringIO()
+    call_command('import_attendance', str(path), batch_size=2, stdout=stdout, stderr=stderr)
+    assert '3 logs imported, 0 duplicates skipped, 2 rows rejected' in stdout.getvalue()
+    assert 'Row 5: clock_in_time is not a valid datetime' in stderr.getvalue()
+    assert not AttendanceImportCheckpoint.objects.exists()
+    assert Attendance.objects.get(event_id='old-3').duration_seconds == 4.5 * 3600
+    assert Attendance.objects.open_session(employee.id).event_id == 'old-5'
+    assert employee.daily_summaries.get(date=date(2024, 3, 2)).worked_seconds == 4.5 * 3600
+
+    # Re-importing a file whose rows carry event ids adds nothing
+    ndjson = tmp_path / 'export.ndjson'
+    ndjson.write_text('{"employee_id": "E1000", "clock_in_time": "2024-03-01T08:00:00", "event_id": "old-1"}\n\n')
+    stdout = StringIO()
+    call_command('import_attendance', str(ndjson), stdout=stdout, stderr=StringIO())
+    assert '0 logs imported, 1 duplicates skipped, 1 rows rejected' in stdout.getvalue()
+    assert Attendance.objects.count() == 3
+
+@pytest.mark.django_db
+def test_import_attendance_checkpoint_commits_with_each_batch(tmp_path, monkeypatch, create_employee):
+    employee = create_employee()
+    path = tmp_path / 'no-event-ids.csv'
+    path.write_text('employee_id,clock_in_time,clock_out_time\n' + ''.join(
+        f'E1000,2024-03-0{day} 08:00:00,2024-03-0{day} 17:00:00\n' for day in range(1, 5)
+    ))
+
+    # The process dies while checkpointing the second batch
+    save = AttendanceImportCheckpoint.objects.update_or_create
+    def crash_on_second_batch(**kwargs):
+        if kwargs['defaults']['rows'] > 2:
+            raise RuntimeError('killed')
+        return save(**kwargs)
+    monkeypatch.setattr(AttendanceImportCheckpoint.objects, 'update_or_create', crash_on_second_batch)
+    with pytest.raises(RuntimeError):
+        call_command('import_attendance', str(path), batch_size=2, stdout=StringIO(), stderr=StringIO())
+    assert Attendance.objects.count() == 2
+    assert AttendanceImportCheckpoint.objects.get().rows == 2
+
+    # Rows without event ids are not imported twice on resume
+    monkeypatch.undo()
+    stdout = StringIO()
+    call_command('import_attendance', str(path), batch_size=2, stdout=stdout, stderr=StringIO())
+    assert 'Resuming after row 2.' in stdout.getvalue()
+    assert '4 logs imported' in stdout.getvalue()
+    assert employee.attendance_logs.count() == 4
+
 # # Attendance API POST GET URL Test 
 # # -----------------------------------
 # @pytest.mark.django_db
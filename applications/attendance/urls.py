@@ -1,7 +1,11 @@
 from django.urls import path
-from .views import AttendanceLogDetailView, AttendanceLogListView
+from .views import AttendanceBulkView, AttendanceLogDetailView, AttendanceLogListView, ClockInView, ClockOutView, PresenceView
 
 urlpatterns = [
     path('logs/', AttendanceLogListView.as_view(), name='attendance-log'),
+    path('logs/bulk/', AttendanceBulkView.as_view(), name='attendance-bulk'),
     path('logs/<int:pk>/', AttendanceLogDetailView.as_view(), name='attendance-detail'),
+    path('clock-in/', ClockInView.as_view(), name='attendance-clock-in'),
+    path('clock-out/', ClockOutView.as_view(), name='attendance-clock-out'),
+    path('presence/', PresenceView.as_view(), name='attendance-presence'),
 ]
@@ -1,13 +1,17 @@
+from django.conf import settings
+from django.db import IntegrityError
 from django.shortcuts import get_list_or_404, get_object_or_404
 from rest_framework.permissions import IsAuthenticated
-from core.auth.permissions import IsAdmin, IsManager
+from core.auth.permissions import HasRole
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from .models import Attendance
-from .serializers import AttendanceSerializer
-from django.utils.decorators import method_decorator
-from rest_framework.decorators import permission_classes
+from .archive import attendance_history
+from .bulk import AttendanceEventSerializer, ingest_events
+from .models import Attendance, AttendanceArchive
+from .serializers import ATTENDANCE_VALUES, AttendanceSerializer, ClockSerializer
+from core.filters import filter_datetime_range, local_day_bounds, parse_bool_param, parse_date_range, parse_int_param
+from core.pagination import decode_cursor, encode_cursor, seek
 
 
 # Attendance List View
@@ -22,10 +26,20 @@ class AttendanceLogListView(APIView):
 
     Methods:
         get(request):
-            Retrieve a list of all attendance logs.
+            Retrieve one page of attendance logs ordered by clock-in time.
+            Query Parameters:
+                - employee (int, optional): Only logs of this employee.
+                - from, to (date, optional): Inclusive range of local clock-in days.
+                - open (bool, optional): 'true' for open sessions only, 'false' for closed ones.
+                - limit (int, optional): Page size, `ATTENDANCE_PAGE_SIZE` by default and
+                  at most `ATTENDANCE_MAX_PAGE_SIZE`.
+                - cursor (str, optional): Opaque keyset cursor from the `X-Next-Cursor`
+                  header of the previous page.
             Returns:
-                - HTTP 200: List of serialized attendance logs.
-                - HTTP 404: If no logs exist.
+                - HTTP 200: List of serialized attendance logs, with an `X-Next-Cursor`
+                  header when more logs follow.
+                - HTTP 400: If a query parameter is invalid.
+                - HTTP 404: If no logs match.
         post(request):
             Create a new attendance log.
             Payload:
@@ -36,22 +50,54 @@ class AttendanceLogListView(APIView):
                 - HTTP 201: The created attendance log.
                 - HTTP 400: Validation errors.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = AttendanceSerializer
 
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request):
         """
-        Retrieve a list of all attendance logs.
+        Retrieve one page of attendance logs.
+
+        All filters are applied in SQL on indexed columns, and pages are read by
+        keyset on `(clock_in_time, id)`, so the cost of a page does not grow with
+        the amount of history. Archived sessions are merged in only when the
+        range starts before the archive horizon. One extra row is fetched to
+        tell whether a next page exists. Rows are read as tuples and rendered
+        through `ATTENDANCE_VALUES`, with the same output as `AttendanceSerializer`.
 
         Returns:
             - HTTP 200: List of serialized attendance logs.
-            - HTTP 404: If no logs exist.
+            - HTTP 400: If a query parameter is invalid.
+            - HTTP 404: If no logs match.
         """
-        logs = get_list_or_404(Attendance)
-        serializer = AttendanceSerializer(logs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        start, end = parse_date_range(request)
+        is_open = parse_bool_param(request, 'open')
+        cursor = request.query_params.get('cursor')
+        cursor = decode_cursor(cursor) if cursor else None
+
+        # Only ranges reaching past the archive horizon read the archive table
+        lower, _ = local_day_bounds(start, end)
+        if cursor:
+            lower = max(lower, cursor[0]) if lower else cursor[0]
+        queryset = attendance_history(lower, include_archive=not is_open).order_by('clock_in_time', 'id')
+
+        employee = parse_int_param(request, 'employee')
+        if employee is not None:
+            queryset = queryset.filter(employee_id=employee)
+        queryset = filter_datetime_range(queryset, 'clock_in_time', start, end)
+        if is_open is not None:
+            queryset = queryset.filter(clock_out_time__isnull=is_open)
+        if cursor:
+            queryset = seek(queryset, cursor)
+
+        limit = parse_int_param(request, 'limit', max_value=settings.ATTENDANCE_MAX_PAGE_SIZE) or settings.ATTENDANCE_PAGE_SIZE
+        logs = get_list_or_404(queryset.values_list(*ATTENDANCE_VALUES.columns)[:limit + 1])
+        headers = {}
+        if len(logs) > limit:
+            logs = logs[:limit]
+            index = ATTENDANCE_VALUES.index
+            headers['X-Next-Cursor'] = encode_cursor(logs[-1][index['clock_in_time']], logs[-1][index['id']])
+        return Response(ATTENDANCE_VALUES.serialize(logs), status=status.HTTP_200_OK, headers=headers)
     
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def post(self, request):
         """
         Create a new attendance log.
@@ -83,9 +129,12 @@ class AttendanceLogDetailView(APIView):
         - Admin and Manager roles are required for GET and PUT methods.
         - Admin role is required for DELETE method.
 
+    Archived logs keep their id and are still returned by GET, so links taken
+    from the list stay valid after archiving; they are read-only.
+
     Methods:
         get(request, pk):
-            Retrieve an attendance log by primary key.
+            Retrieve an attendance log by primary key, archived or not.
             Returns:
                 - HTTP 200: Serialized attendance log.
                 - HTTP 404: If the log does not exist.
@@ -99,28 +148,37 @@ class AttendanceLogDetailView(APIView):
                 - HTTP 200: The updated attendance log.
                 - HTTP 400: Validation errors.
                 - HTTP 404: If the log does not exist.
+                - HTTP 409: If the log is archived.
         delete(request, pk):
             Delete an attendance log by primary key.
             Returns:
                 - HTTP 204: No content, log successfully deleted.
                 - HTTP 404: If the log does not exist.
+                - HTTP 409: If the log is archived.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager', methods={'DELETE': ('Admin',)})]
     serializer_class = AttendanceSerializer
     
     def get_object_helper(self, pk):
         """
         Helper method to retrieve an attendance log object by primary key.
 
+        The hot table is tried first; archived sessions keep their primary key,
+        so a miss falls back to the archive.
+
         Args:
             pk (int): The primary key of the attendance log.
 
         Returns:
-            Attendance instance if found, otherwise raises HTTP 404.
+            Attendance or AttendanceArchive instance if found, otherwise raises HTTP 404.
         """
-        return get_object_or_404(Attendance, pk=pk)
+        log = Attendance.objects.filter(pk=pk).first()
+        return log if log is not None else get_object_or_404(AttendanceArchive, pk=pk)
+
+    def archived_response(self):
+        return Response({'error': 'Archived attendance logs are read-only.'}, status=status.HTTP_409_CONFLICT)
     
     # Retrieve a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request, pk):
         """
         Retrieve an attendance log by primary key.
@@ -137,7 +195,6 @@ class AttendanceLogDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     # Update a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def put(self, request, pk):
         """
         Update an attendance log by primary key.
@@ -154,8 +211,11 @@ class AttendanceLogDetailView(APIView):
             - HTTP 200: The updated attendance log.
             - HTTP 400: Validation errors.
             - HTTP 404: If the log does not exist.
+            - HTTP 409: If the log is archived.
         """
-        log = self.get_object_helper(pk)        
+        log = self.get_object_helper(pk)
+        if isinstance(log, AttendanceArchive):
+            return self.archived_response()
         serializer = AttendanceSerializer(log, data=request.data)
         if serializer.is_valid():
             serializer.save()
@@ -163,7 +223,6 @@ class AttendanceLogDetailView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # Delete a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin]))
     def delete(self, request, pk):
         """
         Delete an attendance log by primary key.
@@ -174,7 +233,179 @@ class AttendanceLogDetailView(APIView):
         Returns:
             - HTTP 204: No content, log successfully deleted.
             - HTTP 404: If the log does not exist.
+            - HTTP 409: If the log is archived.
         """
         log = self.get_object_helper(pk)
+        if isinstance(log, AttendanceArchive):
+            return self.archived_response()
         log.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+# Clock In View
+# ----------------------------------------------------
+class ClockInView(APIView):
+    """
+    API view for opening an attendance session.
+
+    The session is inserted directly; the one-open-session-per-employee
+    constraint decides between concurrent requests, so no lock or prior read
+    is needed during the morning rush.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        post(request):
+            Clock an employee in at the current server time.
+            Payload:
+                - employee (int): The employee clocking in.
+            Returns:
+                - HTTP 201: The created attendance log.
+                - HTTP 400: Validation errors.
+                - HTTP 409: If the employee already has an open session.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = ClockSerializer
+
+    def post(self, request):
+        serializer = ClockSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        employee = serializer.validated_data['employee']
+        try:
+            log = Attendance.objects.clock_in(employee.pk)
+        except IntegrityError:
+            open_session = Attendance.objects.open_session(employee.pk)
+            return Response(
+                {'error': 'Employee is already clocked in.', 'session': open_session.pk if open_session else None},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(AttendanceSerializer(log).data, status=status.HTTP_201_CREATED)
+
+
+# Clock Out View
+# ----------------------------------------------------
+class ClockOutView(APIView):
+    """
+    API view for closing an employee's open attendance session.
+
+    The session is closed with a single conditional `UPDATE ... WHERE
+    clock_out_time IS NULL`, so a repeated or concurrent clock-out can never
+    overwrite an earlier clock-out time.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        post(request):
+            Clock an employee out at the current server time.
+            Payload:
+                - employee (int): The employee clocking out.
+            Returns:
+                - HTTP 200: The closed attendance log.
+                - HTTP 400: Validation errors.
+                - HTTP 409: If the employee has no open session.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = ClockSerializer
+
+    def post(self, request):
+        serializer = ClockSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        log = Attendance.objects.clock_out(serializer.validated_data['employee'].pk)
+        if log is None:
+            return Response({'error': 'Employee is not clocked in.'}, status=status.HTTP_409_CONFLICT)
+        return Response(AttendanceSerializer(log).data, status=status.HTTP_200_OK)
+
+
+# Presence View
+# ----------------------------------------------------
+class PresenceView(APIView):
+    """
+    API view listing the employees who are clocked in right now.
+
+    Meant for reception and muster screens that poll every few seconds. The
+    response comes from a cached snapshot of open sessions, checked against
+    the attendance version marker on every poll: a poll between badge events
+    runs that one version lookup, and a poll after one also runs a query over
+    open sessions only to rebuild the snapshot.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Return the current headcount and open sessions.
+            Returns:
+                - HTTP 200: `headcount`, `as_of` (when the snapshot was taken) and
+                  `present`, one entry per open session ordered by clock-in time.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    def get(self, request):
+        snapshot = Attendance.objects.presence()
+        present = [
+            {
+                'session': session['id'],
+                'employee': session['employee_id'],
+                'employee_id': session['employee__employee_id'],
+                'full_name': session['employee__full_name'],
+                'job_title': session['employee__job_title'],
+                'clock_in_time': session['clock_in_time'],
+            }
+            for session in snapshot['sessions']
+        ]
+        return Response({'headcount': len(present), 'as_of': snapshot['as_of'], 'present': present}, status=status.HTTP_200_OK)
+
+
+# Attendance Bulk Ingestion View
+# ----------------------------------------------------
+class AttendanceBulkView(APIView):
+    """
+    API view for uploading many buffered terminal events in one request.
+
+    Employee references, duplicate event ids and open sessions are each
+    resolved with one query for the whole upload, and new logs are written
+    with `bulk_create` in batches of `ATTENDANCE_BULK_BATCH_SIZE` inside one
+    transaction. Terminals that export separate clock-in and clock-out events
+    can upload them as they are: a clock-out closes the employee's open
+    session. Re-sending an upload is safe: events that were already
+    ingested are reported as duplicates.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        post(request):
+            Ingest a list of attendance events.
+            Payload:
+                - A list of events (at most `ATTENDANCE_BULK_MAX_EVENTS`), each with:
+                    - event_id (str): Client-supplied unique identifier of the event.
+                    - employee (int): The employee associated with the log.
+                    - clock_in_time (datetime, optional): The clock-in time.
+                    - clock_out_time (datetime, optional): The clock-out time; on its
+                      own it closes the employee's open session.
+            Returns:
+                - HTTP 200: Counts per status and one result per event, in upload order,
+                  with `status` 'created', 'closed', 'duplicate' or 'error' and the
+                  log `id` or the validation `errors`.
+                - HTTP 400: If the payload is not a list or is too large.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = AttendanceEventSerializer
+
+    def post(self, request):
+        events = request.data
+        if not isinstance(events, list) or not events:
+            return Response({'error': 'Expected a non-empty list of events.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(events) > settings.ATTENDANCE_BULK_MAX_EVENTS:
+            return Response({'error': f'At most {settings.ATTENDANCE_BULK_MAX_EVENTS} events can be uploaded at once.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = ingest_events(events, settings.ATTENDANCE_BULK_BATCH_SIZE)
+        counts = {'created': 0, 'closed': 0, 'duplicate': 0, 'error': 0}
+        for result in results:
+            counts[result['status']] += 1
+        return Response({**counts, 'results': results}, status=status.HTTP_200_OK)
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import LeaveRequest
+from .models import LeaveRequest, PublicHoliday
 
 # Register your models here.
 admin.site.register(LeaveRequest)
+admin.site.register(PublicHoliday)
@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+from .models import LeaveRequest
+from .signals import leave_bulk_decided
+
+# Leave Decision Serializer
+# --------------------------------------------------------
+class LeaveDecisionSerializer(serializers.Serializer):
+    """
+    Serializer for a bulk decision on leave requests.
+
+    Fields:
+        ids (list): Primary keys of the leave requests to decide.
+        status (str): The decision, 'Approved' or 'Rejected'.
+    """
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+    status = serializers.ChoiceField(choices=['Approved', 'Rejected'])
+
+    def validate_ids(self, value):
+        if len(value) > settings.LEAVE_BULK_MAX_DECISIONS:
+            raise serializers.ValidationError(f'At most {settings.LEAVE_BULK_MAX_DECISIONS} requests can be decided at once.')
+        return value
+
+# Bulk Decisions
+# --------------------------------------------------------
+def decide_requests(ids, status):
+    """
+    Move many pending leave requests to `status` in one transaction.
+
+    The requests are locked with one `SELECT ... FOR UPDATE`, in primary key
+    order so concurrent batches cannot deadlock, and the pending ones are
+    decided with a single `UPDATE ... WHERE id IN (...) AND status = 'Pending'`.
+    `leave_bulk_decided` is then sent once for the whole batch so the ledger
+    and reporting bookkeeping run as batches too, inside the same transaction.
+
+    Args:
+        ids (list): Primary keys of the leave requests; repeats are ignored.
+        status (str): 'Approved' or 'Rejected'.
+
+    Returns:
+        list: One result per distinct id, in request order, with `id`, `result`
+              ('updated', 'not_pending' or 'not_found') and the request's
+              `status` afterwards (None when not found).
+    """
+    ids = list(dict.fromkeys(ids))
+    with transaction.atomic():
+        rows = {
+            row[0]: row for row in
+            LeaveRequest.objects.select_for_update().filter(pk__in=ids).order_by('pk')
+            .values_list('id', 'status', 'employee_id', 'start_date', 'end_date')
+        }
+        pending = [pk for pk in ids if pk in rows and rows[pk][1] == 'Pending']
+        if pending:
+            # The rows are locked, so every pending row read above is updated
+            LeaveRequest.objects.filter(pk__in=pending, status='Pending').update(status=status)
+            leave_bulk_decided.send(
+                sender=LeaveRequest,
+                status=status,
+                requests=[(pk, *rows[pk][2:]) for pk in pending],
+            )
+    decided = set(pending)
+    results = []
+    for pk in ids:
+        if pk in decided:
+            results.append({'id': pk, 'result': 'updated', 'status': status})
+        elif pk in rows:
+            results.append({'id': pk, 'result': 'not_pending', 'status': rows[pk][1]})
+        else:
+            results.append({'id': pk, 'result': 'not_found', 'status': None})
+    return results
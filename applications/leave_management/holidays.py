@@ -0,0 +1,54 @@
+from datetime import date
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+
+# Per-process copy of the holiday calendar, reloaded when the holiday version marker changes
+_calendar = {'version': None, 'busdaycal': None}
+
+# Holiday Calendar
+# --------------------------------------------------------
+def holiday_calendar():
+    """
+    Return the working-day calendar: the configured work week minus public holidays.
+
+    Each process keeps the calendar in memory and checks the `PublicHoliday`
+    `DatasetVersion` marker on use; the holidays are read from the database
+    again only after a holiday was saved or deleted. The marker lives in the
+    database, so every process picks up a change as soon as it commits,
+    whatever the cache backend.
+
+    Returns:
+        numpy.busdaycalendar: The calendar to pass as `busdaycal` to NumPy's
+                              business-day functions.
+    """
+    PublicHoliday = apps.get_model('leave_management', 'PublicHoliday')
+    # Bumped by the reporting signals after every holiday change commits
+    version = apps.get_model('reporting', 'DatasetVersion').objects.state(PublicHoliday)[0]
+    if _calendar['version'] != version or _calendar['busdaycal'] is None:
+        holidays = PublicHoliday.objects.values_list('date', flat=True)
+        _calendar['busdaycal'] = np.busdaycalendar(weekmask=settings.LEAVE_WORKWEEK, holidays=np.array(list(holidays), dtype='datetime64[D]'))
+        _calendar['version'] = version
+    return _calendar['busdaycal']
+
+# Working Days
+# --------------------------------------------------------
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def as_days(dates):
+    # Going through ordinals is far faster than letting NumPy convert date objects
+    ordinals = np.fromiter((day.toordinal() for day in dates), dtype=np.int64, count=len(dates))
+    return (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+
+def working_days(start_dates, end_dates):
+    """
+    Count the working days of many inclusive date ranges in one vectorized call.
+
+    Args:
+        start_dates (sequence): First days of the ranges, as dates.
+        end_dates (sequence): Last days of the ranges, as dates, aligned with `start_dates`.
+
+    Returns:
+        numpy.ndarray: The number of working days of each range.
+    """
+    return np.busday_count(as_days(start_dates), as_days(end_dates) + 1, busdaycal=holiday_calendar())
@@ -0,0 +1,65 @@
+from decimal import Decimal, InvalidOperation
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from applications.onboarding.models import Employee
+from applications.leave_management.models import LeaveLedger
+
+# Accrue Leave Command
+# -------------------------------------------------------------
+class Command(BaseCommand):
+    """
+    Management command that credits every employee with leave days.
+
+    Employees are processed in batches, each in its own transaction: the
+    accrual entries are written with one `bulk_create` and the balances
+    incremented with one `UPDATE`. Every entry carries the accrual's
+    reference (by default the current month, e.g. "accrual:2026-10");
+    employees already credited under it are skipped, so an interrupted run
+    can simply be repeated.
+
+    Example:
+        python manage.py accrue_leave --days 1.75 --reference accrual:2026-10
+    """
+    help = 'Credit every employee with accrued leave days.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', required=True, help='Days credited to each employee, e.g. 1.75.')
+        parser.add_argument('--year', type=int, help='Leave year credited; defaults to the current year.')
+        parser.add_argument('--reference', help='Identifies this accrual; defaults to "accrual:<YYYY-MM>".')
+        parser.add_argument('--note', default='', help='Explanation stored on every entry.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of employees credited per batch.')
+
+    def handle(self, *args, **options):
+        try:
+            days = Decimal(options['days'])
+        except InvalidOperation:
+            raise CommandError('--days must be a number.')
+        if not days.is_finite() or days <= 0:
+            raise CommandError('--days must be a positive number.')
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+        today = timezone.localdate()
+        year = options['year'] or today.year
+        reference = options['reference'] or f'accrual:{today:%Y-%m}'
+        note = options['note'] or f'Accrual {reference}'
+
+        employee_ids = list(Employee.objects.order_by('id').values_list('id', flat=True))
+        credited = skipped = 0
+        for offset in range(0, len(employee_ids), batch_size):
+            batch = employee_ids[offset:offset + batch_size]
+            with transaction.atomic():
+                done = set(LeaveLedger.objects.filter(reference=reference, employee_id__in=batch).values_list('employee_id', flat=True))
+                entries = LeaveLedger.objects.record([
+                    LeaveLedger(employee_id=employee_id, year=year, kind='Accrual', days=days, reference=reference, note=note)
+                    for employee_id in batch if employee_id not in done
+                ])
+            credited += len(entries)
+            skipped += len(done)
+            self.stdout.write(f'Processed {min(offset + batch_size, len(employee_ids))}/{len(employee_ids)} employees.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Leave accrual {reference} complete: {credited} employees credited with {days} days for {year}, '
+            f'{skipped} already credited.'
+        ))
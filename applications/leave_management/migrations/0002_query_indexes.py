@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leave_management', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['status'], name='leave_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['employee', 'start_date', 'end_date'], name='leave_employee_dates_idx'),
+        ),
+        # The composite index now leads with the foreign key; drop its single-column index
+        migrations.AlterField(
+            model_name='leaverequest',
+            name='employee',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='leave_requests', to='onboarding.employee'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leave_management', '0002_query_indexes'),
+        ('onboarding', '0004_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['employee', 'end_date'], name='leave_employee_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['end_date', 'start_date'], name='leave_end_start_idx'),
+        ),
+    ]
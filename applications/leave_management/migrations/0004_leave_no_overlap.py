@@ -0,0 +1,47 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:49
+
+from django.db import migrations
+
+
+def add_exclusion_constraint(apps, schema_editor):
+    # Only PostgreSQL has exclusion constraints; elsewhere the serializer check stands alone
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    LeaveRequest = apps.get_model('leave_management', 'LeaveRequest')
+    table = schema_editor.quote_name(LeaveRequest._meta.db_table)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT a.id, b.id FROM {table} a JOIN {table} b ON a.employee_id = b.employee_id AND a.id < b.id "
+            f"AND a.start_date <= b.end_date AND a.end_date >= b.start_date "
+            f"WHERE a.status <> 'Rejected' AND b.status <> 'Rejected' LIMIT 20"
+        )
+        overlaps = cursor.fetchall()
+    if overlaps:
+        pairs = ', '.join(f'{first}/{second}' for first, second in overlaps)
+        raise RuntimeError(
+            f'Overlapping leave requests must be resolved before leave_no_overlap can be created: {pairs}. '
+            f'List them all with GET /api/leave_management/conflicts/.'
+        )
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT leave_no_overlap EXCLUDE USING gist "
+        f"(employee_id WITH =, daterange(start_date, end_date, '[]') WITH &&) WHERE (status <> 'Rejected')"
+    )
+
+
+def remove_exclusion_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    LeaveRequest = apps.get_model('leave_management', 'LeaveRequest')
+    schema_editor.execute(f'ALTER TABLE {schema_editor.quote_name(LeaveRequest._meta.db_table)} DROP CONSTRAINT IF EXISTS leave_no_overlap')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leave_management', '0003_overlap_checks'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_exclusion_constraint, remove_exclusion_constraint),
+    ]
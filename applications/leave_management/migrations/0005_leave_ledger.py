@@ -0,0 +1,48 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leave_management', '0004_leave_no_overlap'),
+        ('onboarding', '0004_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaveBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('accrued', models.DecimalField(decimal_places=2, default=0, max_digits=7)),
+                ('used', models.DecimalField(decimal_places=2, default=0, max_digits=7)),
+                ('adjusted', models.DecimalField(decimal_places=2, default=0, max_digits=7)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='leave_balances', to='onboarding.employee')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('employee', 'year'), name='unique_leave_balance_per_year')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LeaveLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('kind', models.CharField(choices=[('Accrual', 'Accrual'), ('Usage', 'Usage'), ('Adjustment', 'Adjustment')], max_length=10)),
+                ('days', models.DecimalField(decimal_places=2, max_digits=7)),
+                ('reference', models.CharField(blank=True, max_length=50, null=True)),
+                ('note', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='leave_ledger', to='onboarding.employee')),
+                ('leave_request', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='leave_management.leaverequest')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'year'], name='leave_ledger_employee_year_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('reference__isnull', False)), fields=('reference', 'employee'), name='unique_leave_ledger_reference')],
+            },
+        ),
+    ]
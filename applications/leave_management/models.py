@@ -1,5 +1,150 @@
-from django.db import models
+import heapq
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
 from applications.onboarding.models import Employee
+from .holidays import working_days
+from .signals import leave_bulk_decided
+
+
+def leave_year_segments(start_date, end_date):
+    """
+    Split an inclusive date range at New Year into one `(year, first_day, last_day)` segment per leave year.
+    """
+    return [
+        (year, max(start_date, date(year, 1, 1)), min(end_date, date(year, 12, 31)))
+        for year in range(start_date.year, end_date.year + 1)
+    ]
+
+
+# Leave Request Manager
+# ---------------------------------------
+class LeaveRequestManager(models.Manager):
+    """
+    Manager for LeaveRequest with the date overlap queries.
+
+    Two requests overlap when `start_date <= other.end_date` and
+    `end_date >= other.start_date`, both ends inclusive. Rejected requests
+    never conflict.
+
+    Methods:
+        overlapping(employee_id, start_date, end_date, exclude=None):
+            Requests of one employee that overlap a date range.
+        conflicts(start_date, end_date):
+            Every pair of overlapping requests in a date window.
+        calendar(start_date, end_date, job_title=None):
+            Who is on approved leave on each day of a date window.
+    """
+    def overlapping(self, employee_id, start_date, end_date, exclude=None):
+        """
+        Return the employee's active requests overlapping `[start_date, end_date]`.
+
+        The query seeks the `(employee, end_date)` index to the requests ending
+        on or after `start_date`, so its cost follows the employee's current
+        and future leave, not the length of their history.
+
+        Args:
+            employee_id (int): The primary key of the employee.
+            start_date (date): First day of the range.
+            end_date (date): Last day of the range, inclusive.
+            exclude (int, optional): A request to leave out, such as the one being edited.
+        """
+        queryset = self.filter(employee_id=employee_id, end_date__gte=start_date, start_date__lte=end_date).exclude(status='Rejected')
+        if exclude is not None:
+            queryset = queryset.exclude(pk=exclude)
+        return queryset
+
+    def conflicts(self, start_date, end_date):
+        """
+        List every pair of overlapping requests that touches a date window.
+
+        The requests in the window are read once, ordered by employee and start
+        date, and swept with a min-heap of end dates: a request overlaps exactly
+        the earlier requests of the same employee still on the heap once those
+        ending before its start are popped. This costs O(n log n) plus the
+        number of conflicts.
+
+        Args:
+            start_date (date): First day of the window.
+            end_date (date): Last day of the window, inclusive.
+
+        Returns:
+            list: One dict per conflicting pair with `employee`, `employee_name`,
+                  `first` and `second` (request ids, `first` starting earlier)
+                  and the overlapping days `overlap_start` and `overlap_end`.
+        """
+        rows = (
+            self.filter(end_date__gte=start_date, start_date__lte=end_date)
+            .exclude(status='Rejected')
+            .order_by('employee_id', 'start_date', 'id')
+            .values_list('id', 'employee_id', 'employee__full_name', 'start_date', 'end_date')
+        )
+        conflicts, active, current = [], [], None
+        for pk, employee_id, name, start, end in rows:
+            if employee_id != current:
+                active, current = [], employee_id
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for other_end, other_pk in sorted(active, key=lambda item: item[1]):
+                conflicts.append({
+                    'employee': employee_id,
+                    'employee_name': name,
+                    'first': other_pk,
+                    'second': pk,
+                    'overlap_start': start.isoformat(),
+                    'overlap_end': min(end, other_end).isoformat(),
+                })
+            heapq.heappush(active, (end, pk))
+        return conflicts
+
+    def calendar(self, start_date, end_date, job_title=None):
+        """
+        Build the day-by-day leave calendar of a date window.
+
+        The approved requests overlapping the window are read with one indexed
+        range query, clipped to the window and turned into start and end
+        events per day index. One pass over the days then applies the events
+        to the set of people on leave, so the cost is O(days + requests) plus
+        the size of the rosters, instead of a query or a scan per day.
+
+        Args:
+            start_date (date): First day of the window.
+            end_date (date): Last day of the window, inclusive.
+            job_title (str, optional): Only count employees with this job title.
+
+        Returns:
+            dict: `days`, one `{date, count, employees}` entry per day with the
+                  sorted ids of the employees on leave, and `employees`, mapping
+                  each of those ids to its `full_name` and `job_title`.
+        """
+        queryset = self.filter(status='Approved', end_date__gte=start_date, start_date__lte=end_date)
+        if job_title:
+            queryset = queryset.filter(employee__job_title=job_title)
+        first, length = start_date.toordinal(), (end_date - start_date).days + 1
+        starts, ends, employees = defaultdict(list), defaultdict(list), {}
+        rows = queryset.values_list('employee_id', 'employee__full_name', 'employee__job_title', 'start_date', 'end_date')
+        for employee_id, name, title, start, end in rows:
+            employees[employee_id] = {'full_name': name, 'job_title': title}
+            # Day indexes within the window, clipped to it
+            start, end = start.toordinal() - first, end.toordinal() - first + 1
+            starts[start if start > 0 else 0].append(employee_id)
+            ends[end if end < length else length].append(employee_id)
+
+        # Counts per employee, so overlapping requests of one person count once
+        on_leave, days = defaultdict(int), []
+        for index in range(length):
+            for employee_id in ends.get(index, ()):
+                on_leave[employee_id] -= 1
+                if not on_leave[employee_id]:
+                    del on_leave[employee_id]
+            for employee_id in starts.get(index, ()):
+                on_leave[employee_id] += 1
+            roster = sorted(on_leave)
+            days.append({'date': (start_date + timedelta(days=index)).isoformat(), 'count': len(roster), 'employees': roster})
+        return {'days': days, 'employees': employees}
 
 
 # Leave Request Model
@@ -19,6 +164,11 @@ class LeaveRequest(models.Model):
             - 'Rejected': Leave request has been rejected.
         created_at (DateTimeField): Timestamp indicating when the leave request was created.
 
+    Overlapping requests of the same employee are refused by the serializer;
+    on PostgreSQL an exclusion constraint (`leave_no_overlap`, added by a
+    migration) also holds against concurrent writes. Rejected requests are
+    exempt from both.
+
     Methods:
         __str__(): Returns a string representation of the leave request, including the employee's name and the request status.
     """
@@ -27,12 +177,380 @@ class LeaveRequest(models.Model):
         ('Approved', 'Approved'),
         ('Rejected', 'Rejected'),
     ]
-    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='leave_requests')
+    # Covered by the (employee, start_date, end_date) index below
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='leave_requests', db_index=False)
     start_date = models.DateField()
     end_date = models.DateField()
     reason = models.TextField()
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Pending')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = LeaveRequestManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status'], name='leave_status_idx'),
+            # Per-employee leave history and date overlap checks
+            models.Index(fields=['employee', 'start_date', 'end_date'], name='leave_employee_dates_idx'),
+            # Overlap checks only touch requests ending after the new start
+            models.Index(fields=['employee', 'end_date'], name='leave_employee_end_idx'),
+            # Conflict listings over a date window
+            models.Index(fields=['end_date', 'start_date'], name='leave_end_start_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The balance bookkeeping in the signal receivers commits or rolls back with the row
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
+    def __str__(self) -> str:
+        return f'{self.employee.full_name} - {self.status}'
+
+
+# Leave Ledger Manager
+# ---------------------------------------
+class LeaveLedgerManager(models.Manager):
+    """
+    Manager that writes ledger entries together with their balance updates.
+
+    Methods:
+        usage_entries(requests):
+            Build the usage entries of approved leave requests.
+        reversal_entries(leave_request_ids):
+            Build the entries giving back the usage booked for requests.
+        record(entries):
+            Save entries and apply them to the balances in one batch.
+    """
+    def usage_entries(self, requests):
+        """
+        Build unsaved usage entries for approved leave, one per request and leave year.
+
+        Days are working days, counted for all requests with one vectorized
+        `working_days` call; segments without working days get no entry.
+
+        Args:
+            requests (iterable): `(leave_request_id, employee_id, start_date, end_date)` tuples.
+
+        Returns:
+            list: Unsaved `LeaveLedger` entries with negative `days`.
+        """
+        segments = [
+            (leave_request_id, employee_id, year, first, last)
+            for leave_request_id, employee_id, start_date, end_date in requests
+            for year, first, last in leave_year_segments(start_date, end_date)
+        ]
+        days = working_days([segment[3] for segment in segments], [segment[4] for segment in segments]).tolist()
+        return [
+            self.model(employee_id=employee_id, year=year, kind='Usage', days=-Decimal(count), leave_request_id=leave_request_id, note='Approved leave')
+            for (leave_request_id, employee_id, year, _, _), count in zip(segments, days) if count
+        ]
+
+    def reversal_entries(self, leave_request_ids):
+        """
+        Build unsaved entries giving back the usage booked for leave requests.
+
+        The amounts are read from the ledger with one grouped query, so a
+        reversal returns exactly what was taken even if the holiday calendar
+        changed in between.
+
+        Args:
+            leave_request_ids (iterable): Requests that are no longer approved, have
+                                          moved or are being deleted.
+
+        Returns:
+            list: Unsaved `LeaveLedger` entries with positive `days`.
+        """
+        booked = (
+            self.filter(leave_request_id__in=leave_request_ids, kind='Usage')
+            .values('leave_request_id', 'employee_id', 'year').annotate(total=Sum('days')).order_by()
+        )
+        return [
+            self.model(employee_id=row['employee_id'], year=row['year'], kind='Usage', days=-row['total'], leave_request_id=row['leave_request_id'], note='Approval withdrawn')
+            for row in booked if row['total']
+        ]
+
+    def record(self, entries):
+        """
+        Save ledger entries and apply them to the balances in one transaction.
+
+        Entries are inserted with one `bulk_create` and the balances they touch
+        are updated with `LeaveBalanceManager.apply`, so the cost does not
+        depend on how many entries are recorded at once.
+
+        Args:
+            entries (list): Unsaved `LeaveLedger` entries.
+
+        Returns:
+            list: The saved entries.
+        """
+        if not entries:
+            return []
+        with transaction.atomic():
+            entries = self.bulk_create(entries)
+            LeaveBalance.objects.apply(entries)
+        return entries
+
+
+# Leave Ledger Model
+# ---------------------------------------
+class LeaveLedger(models.Model):
+    """
+    Append-only record of every change to an employee's leave entitlement.
+
+    The balance of an employee and leave year is always the sum of their
+    entries' `days`; `LeaveBalance` keeps that sum ready to read. Entries are
+    written through `LeaveLedger.objects.record()` so both stay in step.
+
+    Attributes:
+        employee (ForeignKey): The employee the entry belongs to.
+        year (PositiveSmallIntegerField): The leave year the days count against.
+        kind (CharField): 'Accrual', 'Usage' (approved leave and its reversals) or 'Adjustment'.
+        days (DecimalField): Days credited (positive) or debited (negative).
+        leave_request (ForeignKey): The leave request behind a usage entry, if any.
+        reference (CharField): Identifies a batch accrual, so re-running it credits nobody twice.
+        note (CharField): A free-text explanation.
+        created_at (DateTimeField): When the entry was recorded.
+    """
+    KIND_CHOICES = [
+        ('Accrual', 'Accrual'),
+        ('Usage', 'Usage'),
+        ('Adjustment', 'Adjustment'),
+    ]
+    # Covered by the (employee, year) index below
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='leave_ledger', db_index=False)
+    year = models.PositiveSmallIntegerField()
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    days = models.DecimalField(max_digits=7, decimal_places=2)
+    leave_request = models.ForeignKey(LeaveRequest, on_delete=models.SET_NULL, null=True, blank=True, related_name='ledger_entries')
+    reference = models.CharField(max_length=50, null=True, blank=True)
+    note = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = LeaveLedgerManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'year'], name='leave_ledger_employee_year_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['reference', 'employee'],
+                condition=Q(reference__isnull=False),
+                name='unique_leave_ledger_reference',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.employee_id} {self.year} {self.kind} {self.days}'
+
+
+# Leave Balance Manager
+# ---------------------------------------
+class LeaveBalanceManager(models.Manager):
+    """
+    Manager that keeps `LeaveBalance` rows in step with the ledger.
+
+    Methods:
+        apply(entries):
+            Add saved ledger entries to their balances.
+        lookup(employee_id, year):
+            Read one balance.
+    """
+    BALANCE_FIELDS = {'Accrual': 'accrued', 'Usage': 'used', 'Adjustment': 'adjusted'}
+
+    def apply(self, entries):
+        """
+        Add ledger entries to the balances of their `(employee, year)` keys.
+
+        Missing balance rows are created with one `bulk_create`. Keys that
+        change by the same amounts are then incremented together by one
+        `UPDATE ... WHERE employee_id IN (...)`, so a batch accrual is a single
+        statement and a batch of decisions needs one per distinct leave length.
+        Increments are applied by the database, so concurrent writers never
+        overwrite each other's totals.
+
+        Args:
+            entries (iterable): Saved `LeaveLedger` entries.
+        """
+        deltas = defaultdict(lambda: dict.fromkeys(self.BALANCE_FIELDS.values(), Decimal(0)))
+        for entry in entries:
+            field = self.BALANCE_FIELDS[entry.kind]
+            # Usage entries are negative; `used` counts the days taken
+            deltas[entry.employee_id, entry.year][field] += -entry.days if field == 'used' else entry.days
+        if not deltas:
+            return
+        self.bulk_create([self.model(employee_id=employee_id, year=year) for employee_id, year in deltas], ignore_conflicts=True)
+        groups = defaultdict(list)
+        for (employee_id, year), amounts in deltas.items():
+            groups[year, tuple(sorted(amounts.items()))].append(employee_id)
+        now = timezone.now()
+        for (year, amounts), employee_ids in groups.items():
+            updates = {field: F(field) + amount for field, amount in amounts if amount}
+            if updates:
+                self.filter(year=year, employee_id__in=employee_ids).update(**updates, updated_at=now)
+
+    def lookup(self, employee_id, year):
+        """
+        Return the balance of an employee and leave year with one unique-index lookup.
+
+        Returns:
+            LeaveBalance: The stored balance, or an unsaved zero balance if the
+                          employee has no entries for that year.
+        """
+        return self.filter(employee_id=employee_id, year=year).first() or self.model(employee_id=employee_id, year=year)
+
+
+# Leave Balance Model
+# ---------------------------------------
+class LeaveBalance(models.Model):
+    """
+    Denormalized leave balance of one employee and leave year.
+
+    Each column is the sum of the matching ledger entries, maintained by
+    `LeaveBalanceManager.apply`, so reading a balance never scans the ledger
+    or the leave history.
+
+    Attributes:
+        employee (ForeignKey): The employee the balance belongs to.
+        year (PositiveSmallIntegerField): The leave year.
+        accrued (DecimalField): Days credited by accruals.
+        used (DecimalField): Days taken by approved leave.
+        adjusted (DecimalField): Net days of manual adjustments.
+        updated_at (DateTimeField): When the balance last changed.
+
+    Properties:
+        available: Days left, `accrued + adjusted - used`.
+    """
+    # Covered by the (employee, year) unique constraint below
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='leave_balances', db_index=False)
+    year = models.PositiveSmallIntegerField()
+    accrued = models.DecimalField(max_digits=7, decimal_places=2, default=0)
+    used = models.DecimalField(max_digits=7, decimal_places=2, default=0)
+    adjusted = models.DecimalField(max_digits=7, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = LeaveBalanceManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['employee', 'year'], name='unique_leave_balance_per_year'),
+        ]
+
+    @property
+    def available(self):
+        return Decimal(self.accrued) + Decimal(self.adjusted) - Decimal(self.used)
+
+    def __str__(self) -> str:
+        return f'{self.employee_id} {self.year}: {self.available}'
+
+
+# Public Holiday Model
+# ---------------------------------------
+class PublicHoliday(models.Model):
+    """
+    A public holiday, excluded from leave working-day counts.
+
+    Every process caches the holiday calendar; saving or deleting a holiday
+    bumps its dataset version, which invalidates it (see `holidays.holiday_calendar`). Usage already booked in
+    the leave ledger is not recounted.
+
+    Attributes:
+        date (DateField): The day of the holiday.
+        name (CharField): The name of the holiday.
+    """
+    date = models.DateField(unique=True)
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ['date']
+
     def __str__(self) -> str:
-        return f'{self.employee.full_name} - {self.status}'
\ No newline at end of file
+        return f'{self.date} {self.name}'
+
+
+# Leave Balance Signals
+# ---------------------------------------
+from django.db.models.signals import pre_save, post_save, pre_delete
+from django.dispatch import receiver
+
+def approved_usage(instance):
+    # Model fields accept date strings on assignment; normalise before counting days
+    start_date = LeaveRequest._meta.get_field('start_date').to_python(instance.start_date)
+    end_date = LeaveRequest._meta.get_field('end_date').to_python(instance.end_date)
+    return instance.pk, instance.employee_id, start_date, end_date
+
+@receiver(pre_save, sender=LeaveRequest)
+def remember_approved_usage(sender, instance, **kwargs):
+    """
+    Signal to remember the days an existing request used while approved, before it is updated.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`LeaveRequest`).
+        instance (LeaveRequest): The leave request being saved.
+        kwargs (dict): Additional keyword arguments.
+    """
+    instance._previous_usage = None
+    if instance.pk:
+        instance._previous_usage = (
+            LeaveRequest.objects.filter(pk=instance.pk, status='Approved')
+            .values_list('id', 'employee_id', 'start_date', 'end_date').first()
+        )
+
+@receiver(post_save, sender=LeaveRequest)
+def record_usage_on_save(sender, instance, **kwargs):
+    """
+    Signal to book the leave usage of a request whose status changed to or from Approved.
+
+    Moving the dates of an approved request gives the booked days back and
+    takes the new ones. Runs inside the transaction of `LeaveRequest.save()`.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`LeaveRequest`).
+        instance (LeaveRequest): The leave request that was saved.
+        kwargs (dict): Additional keyword arguments.
+    """
+    previous = getattr(instance, '_previous_usage', None)
+    current = approved_usage(instance) if instance.status == 'Approved' else None
+    if previous == current:
+        return
+    entries = LeaveLedger.objects.reversal_entries([instance.pk]) if previous else []
+    if current:
+        entries += LeaveLedger.objects.usage_entries([current])
+    LeaveLedger.objects.record(entries)
+
+@receiver(pre_delete, sender=LeaveRequest)
+def record_usage_on_delete(sender, instance, **kwargs):
+    """
+    Signal to give back the days booked for an approved request that is being deleted.
+
+    Runs before the row is gone so the booked usage can still be found; the
+    ledger keeps the entries with their request reference cleared.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`LeaveRequest`).
+        instance (LeaveRequest): The leave request being deleted.
+        kwargs (dict): Additional keyword arguments.
+    """
+    # When the employee is deleted, their ledger and balances go with them
+    origin = kwargs.get('origin')
+    if getattr(origin, 'model', type(origin)) is not LeaveRequest:
+        return
+    LeaveLedger.objects.record(LeaveLedger.objects.reversal_entries([instance.pk]))
+
+@receiver(leave_bulk_decided, sender=LeaveRequest)
+def record_usage_on_bulk_decision(sender, status, requests, **kwargs):
+    """
+    Signal to book the usage of requests approved in bulk with one batch of ledger writes.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`LeaveRequest`).
+        status (str): The decision applied to the requests.
+        requests (list): `(id, employee_id, start_date, end_date)` tuples of the decided requests.
+        kwargs (dict): Additional keyword arguments.
+    """
+    if status == 'Approved':
+        LeaveLedger.objects.record(LeaveLedger.objects.usage_entries(requests))
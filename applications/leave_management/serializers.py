@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import LeaveRequest
+from core.serialization import ValuesSerializer
+from .models import LeaveBalance, LeaveRequest
 
 
 # Leave Request Serializer
@@ -18,9 +19,69 @@ class LeaveRequestSerializer(serializers.ModelSerializer):
             - status: The status of the leave request is set as 'Pending' by default 
                       and can only be updated by specific endpoints.
             - created_at: The creation timestamp is automatically generated and not editable.
+
+    Validation:
+        - end_date must not be before start_date.
+        - The dates must not overlap another request of the same employee that
+          is not rejected; one indexed interval query decides. Partial updates
+          are checked against the stored values of the omitted fields.
     """
     class Meta:
         model = LeaveRequest
         fields = '__all__'
         read_only_fields = [ 'status', 'created_at' ]
-    
\ No newline at end of file
+
+    def validate(self, attrs):
+        instance = self.instance
+        employee = attrs.get('employee', getattr(instance, 'employee', None))
+        start_date = attrs.get('start_date', getattr(instance, 'start_date', None))
+        end_date = attrs.get('end_date', getattr(instance, 'end_date', None))
+        if start_date > end_date:
+            raise serializers.ValidationError({'end_date': 'end_date must not be before start_date.'})
+        if instance is not None and instance.status == 'Rejected':
+            return attrs
+        overlap = (
+            LeaveRequest.objects.overlapping(employee.pk, start_date, end_date, exclude=getattr(instance, 'pk', None))
+            .order_by('start_date').values_list('id', 'start_date', 'end_date').first()
+        )
+        if overlap:
+            raise serializers.ValidationError(
+                f'Overlaps leave request {overlap[0]} ({overlap[1].isoformat()} to {overlap[2].isoformat()}).'
+            )
+        return attrs
+
+# Read path of the list endpoint
+LEAVE_REQUEST_VALUES = ValuesSerializer(LeaveRequestSerializer)
+
+# Leave Balance Serializer
+# ------------------------------------------------------------
+class LeaveBalanceSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for the LeaveBalance model, with the days still available.
+    """
+    available = serializers.DecimalField(max_digits=9, decimal_places=2, read_only=True)
+
+    class Meta:
+        model = LeaveBalance
+        fields = [ 'employee', 'year', 'accrued', 'used', 'adjusted', 'available', 'updated_at' ]
+        read_only_fields = fields
+
+# Leave Adjustment Serializer
+# ------------------------------------------------------------
+class LeaveAdjustmentSerializer(serializers.Serializer):
+    """
+    Validates a manual balance adjustment.
+
+    Fields:
+        year (int): The leave year to adjust.
+        days (decimal): Days to credit (positive) or debit (negative).
+        note (str, optional): Why the balance is adjusted.
+    """
+    year = serializers.IntegerField(min_value=1900, max_value=9999)
+    days = serializers.DecimalField(max_digits=7, decimal_places=2)
+    note = serializers.CharField(max_length=255, required=False, allow_blank=True, default='')
+
+    def validate_days(self, value):
+        if not value:
+            raise serializers.ValidationError('days must not be zero.')
+        return value
@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Leave Signals
+# ----------------------------------
+# Sent after leave requests are decided in bulk with `QuerySet.update()`,
+# which bypasses the per-row `post_save` signal. Receivers get the new
+# `status` and the decided requests as `requests`, a list of
+# `(id, employee_id, start_date, end_date)` tuples, and should handle them
+# as one batch.
+leave_bulk_decided = Signal()
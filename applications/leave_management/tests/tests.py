@@ -1,6 +1,12 @@
 import pytest
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
 from applications.onboarding.models import Employee
-from applications.leave_management.models import LeaveRequest
+from applications.leave_management import holidays
+from applications.leave_management.holidays import working_days
+from applications.leave_management.models import LeaveBalance, LeaveLedger, LeaveRequest, PublicHoliday
 
 # Leave Request Test 
 # ------------------------------
@@ -23,3 +29,201 @@ def test_create_leave_request():
     assert leave_request.employee.full_name == 'Tester test'
     assert leave_request.reason == 'Vacation'
     assert leave_request.status == 'Pending'
+
+# Overlap Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_leave_request_dates_are_validated(django_assert_max_num_queries, create_employee, authenticated_client):
+    employee = create_employee()
+    other = create_employee(1)
+    client = authenticated_client()
+    existing = LeaveRequest.objects.create(employee=employee, start_date='2024-12-01', end_date='2024-12-05', reason='Vacation')
+    LeaveRequest.objects.create(employee=employee, start_date='2024-12-10', end_date='2024-12-12', reason='Rejected', status='Rejected')
+
+    payload = {'employee': employee.pk, 'start_date': '2024-12-06', 'end_date': '2024-12-04', 'reason': 'Backwards'}
+    response = client.post('/api/leave_management/requests/', payload, format='json')
+    assert response.status_code == 400 and 'end_date' in response.json()
+
+    payload.update(start_date='2024-12-05', end_date='2024-12-08')
+    response = client.post('/api/leave_management/requests/', payload, format='json')
+    assert response.status_code == 400
+    assert f'Overlaps leave request {existing.pk}' in response.json()['non_field_errors'][0]
+
+    # Rejected requests and other employees do not conflict; touching days are fine
+    for employee_pk, start_date, end_date in ((employee.pk, '2024-12-06', '2024-12-12'), (other.pk, '2024-12-01', '2024-12-05')):
+        payload.update(employee=employee_pk, start_date=start_date, end_date=end_date)
+        with django_assert_max_num_queries(7):
+            response = client.post('/api/leave_management/requests/', payload, format='json')
+        assert response.status_code == 201
+
+    # A partial update is checked with the stored dates, excluding the request itself
+    response = client.put(f'/api/leave_management/requests/{existing.pk}/', {'end_date': '2024-12-06'}, format='json')
+    assert response.status_code == 400
+    response = client.put(f'/api/leave_management/requests/{existing.pk}/', {'start_date': '2024-11-30'}, format='json')
+    assert response.status_code == 200
+
+@pytest.mark.django_db
+def test_leave_conflicts_are_listed_by_sweep(django_assert_num_queries, create_employee, authenticated_client):
+    first, second = create_employee(), create_employee(1)
+    # Bulk writes skip the serializer, so conflicts can still exist
+    a, b, c, d, e = LeaveRequest.objects.bulk_create([
+        LeaveRequest(employee=first, start_date='2024-12-01', end_date='2024-12-10', reason='a'),
+        LeaveRequest(employee=first, start_date='2024-12-03', end_date='2024-12-04', reason='b'),
+        LeaveRequest(employee=first, start_date='2024-12-08', end_date='2024-12-12', reason='c'),
+        LeaveRequest(employee=first, start_date='2024-12-09', end_date='2024-12-09', reason='d', status='Rejected'),
+        LeaveRequest(employee=second, start_date='2024-12-05', end_date='2024-12-06', reason='e'),
+    ])
+    client = authenticated_client()
+    with django_assert_num_queries(1):
+        response = client.get('/api/leave_management/conflicts/', {'from': '2024-12-01', 'to': '2024-12-31'})
+    assert response.status_code == 200
+    assert [(row['first'], row['second'], row['overlap_start'], row['overlap_end']) for row in response.json()] == [
+        (a.pk, b.pk, '2024-12-03', '2024-12-04'),
+        (a.pk, c.pk, '2024-12-08', '2024-12-10'),
+    ]
+    assert client.get('/api/leave_management/conflicts/', {'from': '2024-12-11', 'to': '2024-12-31'}).json() == []
+
+# Leave Balance Tests
+# ------------------------------
+@pytest.fixture
+def holiday_cache():
+    # Holiday calendars outlive the test transaction in the process
+    holidays._calendar.update(version=None, busdaycal=None)
+    yield
+    holidays._calendar.update(version=None, busdaycal=None)
+
+@pytest.mark.django_db
+def test_leave_balance_follows_approval_transitions(holiday_cache, create_employee):
+    employee = create_employee()
+    leave = LeaveRequest.objects.create(employee=employee, start_date='2024-12-30', end_date='2025-01-02', reason='New year')
+    assert not LeaveLedger.objects.exists()
+
+    leave.status = 'Approved'
+    leave.save()
+    assert (LeaveBalance.objects.lookup(employee.pk, 2024).used, LeaveBalance.objects.lookup(employee.pk, 2025).used) == (2, 2)
+
+    # Moving an approved request gives the old days back and takes the new ones; weekends are free
+    leave.refresh_from_db()
+    leave.end_date = '2025-01-05'
+    leave.save()
+    assert LeaveBalance.objects.lookup(employee.pk, 2025).used == 3
+
+    leave.status = 'Rejected'
+    leave.save()
+    assert LeaveBalance.objects.lookup(employee.pk, 2025).used == 0
+
+    leave.status = 'Approved'
+    leave.save()
+    leave.delete()
+    balance = LeaveBalance.objects.lookup(employee.pk, 2025)
+    assert (balance.used, balance.available) == (0, 0)
+    # The balance is always the sum of the ledger
+    assert sum(LeaveLedger.objects.filter(year=2025).values_list('days', flat=True)) == 0
+
+@pytest.mark.django_db
+def test_accrue_leave_credits_every_employee_once(django_assert_num_queries, create_employee, authenticated_client):
+    employees = [create_employee(index) for index in range(3)]
+    LeaveBalance.objects.create(employee=employees[0], year=2026, used=Decimal('2'))
+
+    call_command('accrue_leave', '--days', '1.75', '--year', '2026', '--reference', 'accrual:2026-10', '--batch-size', '2', stdout=StringIO())
+    out = StringIO()
+    call_command('accrue_leave', '--days', '1.75', '--year', '2026', '--reference', 'accrual:2026-10', stdout=out)
+    assert '0 employees credited' in out.getvalue() and '3 already credited' in out.getvalue()
+    assert list(LeaveBalance.objects.order_by('employee_id').values_list('accrued', flat=True)) == [Decimal('1.75')] * 3
+
+    client = authenticated_client()
+    with django_assert_num_queries(1):
+        response = client.get(f'/api/leave_management/balances/{employees[0].pk}/', {'year': 2026})
+    assert response.json()['available'] == '-0.25'
+
+    response = client.post(f'/api/leave_management/balances/{employees[0].pk}/', {'year': 2026, 'days': '3', 'note': 'Carry-over'}, format='json')
+    assert response.status_code == 201
+    assert (response.json()['adjusted'], response.json()['available']) == ('3.00', '2.75')
+    assert client.get(f'/api/leave_management/balances/{employees[1].pk}/', {'year': 2030}).json()['available'] == '0.00'
+
+# Bulk Decision Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_bulk_decisions_update_pending_requests_in_one_batch(holiday_cache, django_assert_max_num_queries, create_employee, authenticated_client):
+    employees = [create_employee(index) for index in range(30)]
+    leaves = LeaveRequest.objects.bulk_create([
+        LeaveRequest(employee=employee, start_date='2026-03-02', end_date='2026-03-04', reason='Batch') for employee in employees
+    ])
+    decided = LeaveRequest.objects.create(employee=employees[0], start_date='2026-04-01', end_date='2026-04-01', reason='Done', status='Rejected')
+    ids = [leave.pk for leave in leaves]
+    client = authenticated_client()
+
+    with django_assert_max_num_queries(13):
+        response = client.post('/api/leave_management/requests/decisions/', {'ids': [*ids, ids[0], decided.pk, 999999], 'status': 'Approved'}, format='json')
+    assert response.status_code == 200
+    body = response.json()
+    assert (body['updated'], body['not_pending'], body['not_found']) == (30, 1, 1)
+    assert body['results'][-2:] == [{'id': decided.pk, 'result': 'not_pending', 'status': 'Rejected'}, {'id': 999999, 'result': 'not_found', 'status': None}]
+    assert LeaveRequest.objects.filter(status='Approved').count() == 30
+    assert set(LeaveBalance.objects.filter(year=2026).values_list('used', flat=True)) == {3}
+
+    # Deciding again changes nothing
+    body = client.post('/api/leave_management/requests/decisions/', {'ids': ids[:2], 'status': 'Rejected'}, format='json').json()
+    assert [result['result'] for result in body['results']] == ['not_pending', 'not_pending']
+    assert client.post('/api/leave_management/requests/decisions/', {'ids': [], 'status': 'Approved'}, format='json').status_code == 400
+
+# Leave Calendar Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_leave_calendar_counts_people_per_day(django_assert_num_queries, create_employee, authenticated_client):
+    first, second, third = create_employee(), create_employee(1), create_employee(2)
+    Employee.objects.filter(pk=third.pk).update(job_title='Driver')
+    LeaveRequest.objects.bulk_create([
+        LeaveRequest(employee=first, start_date='2024-11-28', end_date='2024-12-02', reason='a', status='Approved'),
+        # Overlaps the first request of the same employee: still one person
+        LeaveRequest(employee=first, start_date='2024-12-02', end_date='2024-12-03', reason='b', status='Approved'),
+        LeaveRequest(employee=second, start_date='2024-12-02', end_date='2024-12-02', reason='c', status='Approved'),
+        LeaveRequest(employee=second, start_date='2024-12-01', end_date='2024-12-04', reason='d'),
+        LeaveRequest(employee=third, start_date='2024-12-03', end_date='2024-12-10', reason='e', status='Approved'),
+    ])
+    client = authenticated_client()
+    with django_assert_num_queries(1):
+        response = client.get('/api/leave_management/calendar/', {'from': '2024-12-01', 'to': '2024-12-04'})
+    body = response.json()
+    assert [(day['date'], day['count'], day['employees']) for day in body['days']] == [
+        ('2024-12-01', 1, [first.pk]),
+        ('2024-12-02', 2, [first.pk, second.pk]),
+        ('2024-12-03', 2, [first.pk, third.pk]),
+        ('2024-12-04', 1, [third.pk]),
+    ]
+    assert body['employees'][str(third.pk)] == {'full_name': 'Tester test', 'job_title': 'Driver'}
+
+    body = client.get('/api/leave_management/calendar/', {'from': '2024-12-01', 'to': '2024-12-04', 'job_title': 'Driver'}).json()
+    assert [day['count'] for day in body['days']] == [0, 0, 1, 1]
+    assert client.get('/api/leave_management/calendar/', {'from': '2024-01-01', 'to': '2025-12-31'}).status_code == 400
+
+# Public Holiday Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_working_days_skip_weekends_and_cached_holidays(holiday_cache, django_assert_num_queries, django_capture_on_commit_callbacks, create_employee, authenticated_client):
+    employee = create_employee()
+    starts = [date(2025, 12, 22), date(2025, 12, 27), date(2025, 12, 29)]
+    ends = [date(2025, 12, 26), date(2025, 12, 28), date(2026, 1, 2)]
+    with django_assert_num_queries(2):
+        assert working_days(starts, ends).tolist() == [5, 0, 5]
+    # The calendar is cached in the process; a hit only checks the holiday version marker
+    with django_assert_num_queries(1):
+        working_days(starts, ends)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        PublicHoliday.objects.create(date='2025-12-25', name='Christmas Day')
+        PublicHoliday.objects.create(date='2026-01-01', name="New Year's Day")
+    assert working_days(starts, ends).tolist() == [4, 0, 4]
+
+    leave = LeaveRequest.objects.create(employee=employee, start_date='2025-12-29', end_date='2026-01-02', reason='Holidays', status='Approved')
+    assert (LeaveBalance.objects.lookup(employee.pk, 2025).used, LeaveBalance.objects.lookup(employee.pk, 2026).used) == (3, 1)
+
+    # A later calendar change leaves booked usage alone; the reversal gives back what was taken
+    with django_capture_on_commit_callbacks(execute=True):
+        PublicHoliday.objects.filter(date='2026-01-01').delete()
+    leave.delete()
+    assert (LeaveBalance.objects.lookup(employee.pk, 2025).used, LeaveBalance.objects.lookup(employee.pk, 2026).used) == (0, 0)
+
+    client = authenticated_client()
+    LeaveRequest.objects.create(employee=employee, start_date='2025-12-24', end_date='2025-12-26', reason='Christmas')
+    assert client.get('/api/reporting/leaves/').json()[0]['working_days'] == 2
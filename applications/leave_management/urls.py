@@ -1,7 +1,11 @@
 from django.urls import path
-from .views import LeaveRequestListView, LeaveRequestDetailView
+from .views import LeaveRequestListView, LeaveRequestDetailView, LeaveConflictView, LeaveBalanceView, LeaveDecisionView, LeaveCalendarView
 
 urlpatterns = [
     path('requests/', LeaveRequestListView.as_view(), name='leave-request-list'),
+    path('requests/decisions/', LeaveDecisionView.as_view(), name='leave-request-decisions'),
     path('requests/<int:pk>/', LeaveRequestDetailView.as_view(), name='leave-request-detail'),
+    path('conflicts/', LeaveConflictView.as_view(), name='leave-conflicts'),
+    path('calendar/', LeaveCalendarView.as_view(), name='leave-calendar'),
+    path('balances/<int:employee>/', LeaveBalanceView.as_view(), name='leave-balance'),
 ]
\ No newline at end of file
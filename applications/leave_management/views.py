@@ -1,13 +1,33 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_list_or_404, get_object_or_404
+from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
-from core.auth.permissions import IsAdmin, IsManager
+from core.auth.permissions import HasRole
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from .models import LeaveRequest
-from .serializers import LeaveRequestSerializer
-from django.utils.decorators import method_decorator
-from rest_framework.decorators import permission_classes
+from applications.onboarding.models import Employee
+from .bulk import LeaveDecisionSerializer, decide_requests
+from .models import LeaveBalance, LeaveLedger, LeaveRequest
+from .serializers import LEAVE_REQUEST_VALUES, LeaveAdjustmentSerializer, LeaveBalanceSerializer, LeaveRequestSerializer
+from core.filters import parse_date_range, parse_int_param
+
+
+def save_leave_request(serializer, success_status):
+    """
+    Save a validated leave request serializer and build the response.
+
+    The serializer's overlap check and the save are not atomic; on
+    PostgreSQL the `leave_no_overlap` exclusion constraint rejects the loser
+    of two concurrent overlapping writes, reported here as HTTP 409.
+    """
+    try:
+        with transaction.atomic():
+            serializer.save()
+    except IntegrityError:
+        return Response({'error': 'Leave request overlaps another leave request of the employee.'}, status=status.HTTP_409_CONFLICT)
+    return Response(serializer.data, status=success_status)
 
 
 # Leave Request List
@@ -35,11 +55,13 @@ class LeaveRequestListView(APIView):
                 - reason (str): The reason for requesting leave.
             Returns:
                 - HTTP 201: The created leave request.
-                - HTTP 400: Validation errors.
+                - HTTP 400: Validation errors, including dates that overlap another
+                  request of the employee.
+                - HTTP 409: If a concurrent request created an overlapping leave first.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = LeaveRequestSerializer
     
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request):
         """
         Retrieve a list of all leave requests.
@@ -48,11 +70,9 @@ class LeaveRequestListView(APIView):
             - HTTP 200: List of serialized leave requests.
             - HTTP 404: If no leave requests exist.
         """
-        leaves = get_list_or_404(LeaveRequest)
-        serializer = LeaveRequestSerializer(leaves, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        leaves = get_list_or_404(LeaveRequest.objects.values_list(*LEAVE_REQUEST_VALUES.columns))
+        return Response(LEAVE_REQUEST_VALUES.serialize(leaves), status=status.HTTP_200_OK)
 
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def post(self, request):
         """
         Create a new leave request.
@@ -66,11 +86,11 @@ class LeaveRequestListView(APIView):
         Returns:
             - HTTP 201: The created leave request.
             - HTTP 400: Validation errors.
+            - HTTP 409: If a concurrent request created an overlapping leave first.
         """
         serializer = LeaveRequestSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            return save_leave_request(serializer, status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 # Leave Request Detail
@@ -98,14 +118,17 @@ class LeaveRequestDetailView(APIView):
                 - reason (str): The updated reason for requesting leave.
             Returns:
                 - HTTP 200: The updated leave request.
-                - HTTP 400: Validation errors.
+                - HTTP 400: Validation errors, including dates that overlap another
+                  request of the employee.
                 - HTTP 404: If the leave request does not exist.
+                - HTTP 409: If a concurrent request created an overlapping leave first.
         delete(request, pk):
             Delete a leave request by primary key.
             Returns:
                 - HTTP 204: No content, leave request successfully deleted.
                 - HTTP 404: If the leave request does not exist.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager', methods={'DELETE': ('Admin',)})]
     serializer_class = LeaveRequestSerializer
 
     def get_object_helper(self, pk):
@@ -121,7 +144,6 @@ class LeaveRequestDetailView(APIView):
         return get_object_or_404(LeaveRequest, pk=pk)
     
     # Retrieve a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request, pk):
         """
         Retrieve a leave request by primary key.
@@ -138,7 +160,6 @@ class LeaveRequestDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     # Update a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def put(self, request, pk):
         """
         Update a leave request by primary key.
@@ -155,16 +176,15 @@ class LeaveRequestDetailView(APIView):
             - HTTP 200: The updated leave request.
             - HTTP 400: Validation errors.
             - HTTP 404: If the leave request does not exist.
+            - HTTP 409: If a concurrent request created an overlapping leave first.
         """
         leave = self.get_object_helper(pk)        
         serializer = LeaveRequestSerializer(leave, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return save_leave_request(serializer, status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # Delete a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin]))
     def delete(self, request, pk):
         """
         Delete a leave request by primary key.
@@ -179,3 +199,170 @@ class LeaveRequestDetailView(APIView):
         leave = self.get_object_helper(pk)
         leave.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+# Leave Conflicts
+# ------------------------------------------------------ 
+class LeaveConflictView(APIView):
+    """
+    API view listing the overlapping leave requests in a date window.
+
+    Requests are read once with an indexed range query and matched with a
+    sweep over their start dates, so the cost grows with the requests in the
+    window rather than with every pair of them. Rejected requests are ignored.
+    Overlaps can predate the validation or come from bulk writes.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Retrieve one row per pair of overlapping requests, ordered by employee, including:
+                - employee, employee_name: The employee whose requests overlap.
+                - first, second: The ids of the two requests; `first` starts earlier.
+                - overlap_start, overlap_end: The days both requests cover.
+            Query Parameters:
+                - from, to (date, optional): Inclusive window; a single bound selects
+                  that day, and both default to today.
+            Returns:
+                - HTTP 200: List of conflicts, possibly empty.
+                - HTTP 400: If a query parameter is invalid.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    def get(self, request):
+        start, end = parse_date_range(request)
+        today = timezone.localdate()
+        start, end = start or end or today, end or start or today
+        return Response(LeaveRequest.objects.conflicts(start, end), status=status.HTTP_200_OK)
+
+# Leave Balance
+# ------------------------------------------------------ 
+class LeaveBalanceView(APIView):
+    """
+    API view for reading and adjusting an employee's leave balance.
+
+    Balances are kept up to date by the leave ledger as requests are approved
+    and days accrue, so reading one is a single lookup on its
+    `(employee, year)` key.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required for GET.
+        - Admin role is required for POST.
+
+    Methods:
+        get(request, employee):
+            Retrieve the balance of an employee for a leave year.
+            Query Parameters:
+                - year (int, optional): The leave year; defaults to the current year.
+            Returns:
+                - HTTP 200: accrued, used, adjusted and available days; all zero
+                  when nothing was recorded for that year.
+                - HTTP 400: If a query parameter is invalid.
+        post(request, employee):
+            Record a manual adjustment in the ledger.
+            Payload:
+                - year (int): The leave year to adjust.
+                - days (decimal): Days to credit (positive) or debit (negative).
+                - note (str, optional): Why the balance is adjusted.
+            Returns:
+                - HTTP 201: The updated balance.
+                - HTTP 400: Validation errors.
+                - HTTP 404: If the employee does not exist.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager', methods={'POST': ('Admin',)})]
+    serializer_class = LeaveBalanceSerializer
+
+    def get(self, request, employee):
+        year = parse_int_param(request, 'year', max_value=9999) or timezone.localdate().year
+        return Response(LeaveBalanceSerializer(LeaveBalance.objects.lookup(employee, year)).data, status=status.HTTP_200_OK)
+
+    def post(self, request, employee):
+        employee = get_object_or_404(Employee, pk=employee)
+        serializer = LeaveAdjustmentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        LeaveLedger.objects.record([LeaveLedger(employee=employee, kind='Adjustment', **serializer.validated_data)])
+        balance = LeaveBalance.objects.lookup(employee.pk, serializer.validated_data['year'])
+        return Response(LeaveBalanceSerializer(balance).data, status=status.HTTP_201_CREATED)
+
+# Leave Bulk Decisions
+# ------------------------------------------------------ 
+class LeaveDecisionView(APIView):
+    """
+    API view for approving or rejecting many pending leave requests at once.
+
+    All requests are decided in one transaction: the rows are locked with one
+    `SELECT ... FOR UPDATE`, the pending ones are moved with a single
+    conditional `UPDATE`, and the balance and reporting bookkeeping runs once
+    for the whole batch. Requests that are no longer pending are left as
+    they are, so a decision that raced with another manager's is reported
+    rather than overwritten.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        post(request):
+            Decide a batch of leave requests.
+            Payload:
+                - ids (list): Primary keys of the requests (at most `LEAVE_BULK_MAX_DECISIONS`).
+                - status (str): 'Approved' or 'Rejected'.
+            Returns:
+                - HTTP 200: Counts per result and one result per id, in request order,
+                  with `result` 'updated', 'not_pending' or 'not_found' and the
+                  request's `status` afterwards.
+                - HTTP 400: Validation errors.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = LeaveDecisionSerializer
+
+    def post(self, request):
+        serializer = LeaveDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = decide_requests(serializer.validated_data['ids'], serializer.validated_data['status'])
+        counts = {'updated': 0, 'not_pending': 0, 'not_found': 0}
+        for result in results:
+            counts[result['result']] += 1
+        return Response({**counts, 'results': results}, status=status.HTTP_200_OK)
+
+# Leave Calendar
+# ------------------------------------------------------ 
+class LeaveCalendarView(APIView):
+    """
+    API view for the number of people on approved leave, and who they are, on each day of a window.
+
+    The approved requests overlapping the window are loaded with one indexed
+    query and swept day by day, so a year over the whole workforce is built
+    in a single pass.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Retrieve the leave calendar, including:
+                - days: One entry per day with `date`, `count` and the sorted ids of
+                  the `employees` on leave.
+                - employees: The `full_name` and `job_title` of every employee listed.
+            Query Parameters:
+                - from, to (date, optional): Inclusive window of at most
+                  `LEAVE_CALENDAR_MAX_DAYS` days; a single bound selects that day,
+                  and both default to today.
+                - job_title (str, optional): Only count employees with this job title.
+            Returns:
+                - HTTP 200: The calendar.
+                - HTTP 400: If a query parameter is invalid or the window is too long.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    def get(self, request):
+        start, end = parse_date_range(request)
+        today = timezone.localdate()
+        start, end = start or end or today, end or start or today
+        if (end - start).days >= settings.LEAVE_CALENDAR_MAX_DAYS:
+            return Response({'error': f'The window must not exceed {settings.LEAVE_CALENDAR_MAX_DAYS} days.'}, status=status.HTTP_400_BAD_REQUEST)
+        calendar = LeaveRequest.objects.calendar(start, end, job_title=request.query_params.get('job_title'))
+        return Response({'from': start.isoformat(), 'to': end.isoformat(), **calendar}, status=status.HTTP_200_OK)
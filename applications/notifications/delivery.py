@@ -0,0 +1,136 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import OutboundEmail
+
+# Claiming
+# --------------------------------------------------------
+def lease_expiry():
+    """
+    The `next_attempt_at` of an email claimed now: `NOTIFICATIONS_LEASE_SECONDS` from now.
+    """
+    return timezone.now() + timedelta(seconds=settings.NOTIFICATIONS_LEASE_SECONDS)
+
+def claim_batch(size):
+    """
+    Claim up to `size` due emails for this worker.
+
+    The rows are locked with `SELECT ... FOR UPDATE SKIP LOCKED` where the
+    database supports it and marked 'Sending' with a lease of
+    `NOTIFICATIONS_LEASE_SECONDS`, so concurrent workers never claim the same
+    email and an email claimed by a worker that died is retried after the
+    lease runs out.
+
+    Every claim counts as an attempt, reclaiming an expired lease included,
+    so an email that kills the worker each time it is sent is marked 'Failed'
+    once it has used up `NOTIFICATIONS_MAX_ATTEMPTS` instead of being retried
+    forever.
+
+    Returns:
+        list: The claimed `OutboundEmail` rows, with the `attempts` and
+              `next_attempt_at` lease they were claimed with.
+    """
+    now = timezone.now()
+    lease = lease_expiry()
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status__in=['Pending', 'Sending'], next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:size]
+        )
+        exhausted = [email.pk for email in emails if email.attempts >= settings.NOTIFICATIONS_MAX_ATTEMPTS]
+        if exhausted:
+            OutboundEmail.objects.filter(pk__in=exhausted).update(status='Failed', last_error='Lease expired: the worker sending it stopped.')
+        emails = [email for email in emails if email.attempts < settings.NOTIFICATIONS_MAX_ATTEMPTS]
+        if emails:
+            OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+                status='Sending', attempts=F('attempts') + 1, next_attempt_at=lease,
+            )
+    for email in emails:
+        email.status, email.attempts, email.next_attempt_at = 'Sending', email.attempts + 1, lease
+    return emails
+
+def leased(email):
+    """
+    Queryset matching `email` only while this worker's lease on it still holds.
+    """
+    return OutboundEmail.objects.filter(pk=email.pk, status='Sending', next_attempt_at=email.next_attempt_at)
+
+# Delivery
+# --------------------------------------------------------
+def retry_delay(attempts):
+    """
+    Exponential backoff before the next attempt: `NOTIFICATIONS_RETRY_SECONDS * 2 ** (attempts - 1)`, capped at a day.
+    """
+    return timedelta(seconds=min(settings.NOTIFICATIONS_RETRY_SECONDS * 2 ** (attempts - 1), 86400))
+
+def deliver_batch(size=None):
+    """
+    Claim a batch of due emails and send them over a single mail connection.
+
+    The connection from `get_connection()` is opened once for the batch; if
+    sending raises, it is closed and reopened for the next email. Right
+    before each email is sent its lease is renewed, and right after, its
+    result is written; both writes only match while the row is still
+    'Sending' under this worker's lease. An email whose lease ran out while
+    the batch worked through earlier emails has been reclaimed by another
+    worker and is skipped, and a crash mid-batch only retries the emails
+    that were not sent yet. Failed emails are retried with exponential
+    backoff until `NOTIFICATIONS_MAX_ATTEMPTS` is reached.
+
+    Args:
+        size (int, optional): Emails per batch; defaults to `NOTIFICATIONS_BATCH_SIZE`.
+
+    Returns:
+        tuple: `(sent, failed)` counts of the results this worker wrote.
+    """
+    emails = claim_batch(size or settings.NOTIFICATIONS_BATCH_SIZE)
+    if not emails:
+        return 0, 0
+    sent = failed = 0
+    connection = get_connection()
+    try:
+        for email in emails:
+            lease = lease_expiry()
+            if not leased(email).update(next_attempt_at=lease):
+                continue
+            email.next_attempt_at = lease
+            message = EmailMessage(email.subject, email.body, email.from_email or settings.DEFAULT_FROM_EMAIL, email.recipients, connection=connection)
+            try:
+                # A no-op while the connection is open; reconnects after a failure
+                connection.open()
+                message.send()
+            except Exception as error:
+                connection.close()
+                if email.attempts >= settings.NOTIFICATIONS_MAX_ATTEMPTS:
+                    result = {'status': 'Failed'}
+                else:
+                    result = {'status': 'Pending', 'next_attempt_at': timezone.now() + retry_delay(email.attempts)}
+                failed += leased(email).update(last_error=f'{type(error).__name__}: {error}', **result)
+            else:
+                sent += leased(email).update(status='Sent', sent_at=timezone.now(), last_error='')
+    finally:
+        connection.close()
+    return sent, failed
+
+def deliver_pending(size=None):
+    """
+    Deliver batches until no due email is left or a whole batch fails.
+
+    A batch where nothing was sent usually means the mail server is down;
+    the failed emails are already rescheduled, so stopping there leaves the
+    retry to the backoff instead of hammering the server.
+
+    Returns:
+        tuple: `(sent, failed)` totals.
+    """
+    totals = [0, 0]
+    while True:
+        sent, failed = deliver_batch(size)
+        totals[0] += sent
+        totals[1] += failed
+        if not sent:
+            return tuple(totals)
@@ -0,0 +1,36 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from applications.notifications.delivery import deliver_pending
+
+# Deliver Emails Command
+# -------------------------------------------------------------
+class Command(BaseCommand):
+    """
+    Management command that sends the emails queued in the `OutboundEmail` outbox.
+
+    Emails are claimed in batches and each batch is sent over one mail
+    connection; failures are retried with exponential backoff. Several
+    copies of the command can run side by side without sending an email
+    twice.
+
+    Example:
+        python manage.py deliver_emails --poll-interval 5
+        python manage.py deliver_emails --once
+    """
+    help = 'Send queued outbound emails.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the outbox once and exit.')
+        parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds to sleep when the outbox is empty.')
+        parser.add_argument('--batch-size', type=int, help='Emails sent per connection; defaults to NOTIFICATIONS_BATCH_SIZE.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+        while True:
+            sent, failed = deliver_pending(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(f'Sent {sent} email(s), {failed} failed.')
+            if options['once']:
+                break
+            time.sleep(options['poll_interval'])
@@ -0,0 +1,126 @@
+from django.db import models
+from django.utils import timezone
+from applications.onboarding.models import Employee
+from applications.leave_management.models import LeaveRequest
+from applications.leave_management.signals import leave_bulk_decided
+
+
+# Outbound Email Manager
+# ---------------------------------------
+class OutboundEmailManager(models.Manager):
+    """
+    Manager for queueing emails in the outbox.
+
+    Methods:
+        enqueue(subject, body, recipients, from_email=None):
+            Queue one email.
+        enqueue_many(emails):
+            Queue many emails with one insert.
+    """
+    def enqueue(self, subject, body, recipients, from_email=None):
+        """
+        Queue an email for the delivery worker.
+
+        The row is written in the caller's transaction, so the email is only
+        sent if the change it reports is committed, and the request never
+        waits on the mail server.
+
+        Args:
+            subject (str): The subject line.
+            body (str): The plain-text body.
+            recipients (list): The recipient addresses.
+            from_email (str, optional): The sender; defaults to `DEFAULT_FROM_EMAIL`.
+
+        Returns:
+            OutboundEmail: The queued email.
+        """
+        return self.create(subject=subject, body=body, recipients=list(recipients), from_email=from_email or '')
+
+    def enqueue_many(self, emails):
+        """
+        Queue unsaved `OutboundEmail` instances with one `bulk_create`.
+        """
+        return self.bulk_create(emails)
+
+
+# Outbound Email Model
+# ---------------------------------------
+class OutboundEmail(models.Model):
+    """
+    An email waiting in, or delivered from, the transactional outbox.
+
+    Attributes:
+        subject (CharField): The subject line.
+        body (TextField): The plain-text body.
+        from_email (CharField): The sender; blank means `DEFAULT_FROM_EMAIL`.
+        recipients (JSONField): The recipient addresses.
+        status (CharField): The delivery status, with choices:
+            - 'Pending' (default): Waiting for its next delivery attempt.
+            - 'Sending': Claimed by a worker until its lease, `next_attempt_at`, passes.
+            - 'Sent': Accepted by the mail server.
+            - 'Failed': Gave up after `NOTIFICATIONS_MAX_ATTEMPTS` attempts.
+        attempts (PositiveSmallIntegerField): Delivery attempts made so far; every claim counts as one.
+        next_attempt_at (DateTimeField): When the email may next be claimed.
+        last_error (TextField): The error of the last failed attempt.
+        created_at (DateTimeField): When the email was queued.
+        sent_at (DateTimeField, optional): When the email was delivered.
+    """
+    STATUS_CHOICES = [
+        ('Pending', 'Pending'),
+        ('Sending', 'Sending'),
+        ('Sent', 'Sent'),
+        ('Failed', 'Failed'),
+    ]
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    objects = OutboundEmailManager()
+
+    class Meta:
+        indexes = [
+            # Claiming the next batch of due emails
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_email_queue_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.subject} - {self.status}'
+
+
+# Leave Decision Signals
+# ---------------------------------------
+from django.dispatch import receiver
+
+@receiver(leave_bulk_decided, sender=LeaveRequest)
+def notify_leave_decisions(sender, status, requests, **kwargs):
+    """
+    Signal to queue one email per decided leave request, with one lookup and one insert.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`LeaveRequest`).
+        status (str): The decision applied to the requests.
+        requests (list): `(id, employee_id, start_date, end_date)` tuples of the decided requests.
+        kwargs (dict): Additional keyword arguments.
+    """
+    employees = {
+        pk: (name, email) for pk, name, email in
+        Employee.objects.filter(pk__in={employee_id for _, employee_id, _, _ in requests}).values_list('id', 'full_name', 'email')
+    }
+    OutboundEmail.objects.enqueue_many([
+        OutboundEmail(
+            subject=f'Leave request {status.lower()}',
+            body=(
+                f'Dear {employees[employee_id][0]},\n\n'
+                f'Your leave request from {start_date.isoformat()} to {end_date.isoformat()} has been {status.lower()}.'
+            ),
+            recipients=[employees[employee_id][1]],
+        )
+        for _, employee_id, start_date, end_date in requests if employees[employee_id][1]
+    ])
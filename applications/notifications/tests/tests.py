@@ -0,0 +1,134 @@
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from applications.leave_management.models import LeaveRequest
+from applications.notifications.delivery import claim_batch, deliver_batch
+from applications.notifications.models import OutboundEmail
+
+# Test Mail Backends
+# ------------------------------
+class CountingBackend(EmailBackend):
+    connections = 0
+
+    def __init__(self, *args, **kwargs):
+        CountingBackend.connections += 1
+        super().__init__(*args, **kwargs)
+
+class FlakyBackend(EmailBackend):
+    def send_messages(self, messages):
+        if any('down@example.com' in message.to for message in messages):
+            raise ConnectionError('Mail server unavailable')
+        return super().send_messages(messages)
+
+class SlowBackend(EmailBackend):
+    # Each send takes 200 seconds on the clock; during the second, another worker runs
+    clock = None
+    other_worker = None
+
+    def send_messages(self, messages):
+        SlowBackend.clock[0] += timedelta(seconds=200)
+        if 'second@example.com' in messages[0].to and SlowBackend.other_worker is None:
+            # Set before the other worker sends, so its own sends do not start a third one
+            SlowBackend.other_worker = ()
+            SlowBackend.other_worker = deliver_batch()
+        return super().send_messages(messages)
+
+# Outbox Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_password_reset_is_queued_and_delivered(settings):
+    settings.EMAIL_BACKEND = 'applications.notifications.tests.tests.CountingBackend'
+    user = User.objects.create_user(username='tester', email='tester@example.com', password='secret')
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.post('/password-reset/', {'email': 'tester@example.com'}, format='json')
+    assert response.status_code == 200
+    # Nothing is sent inside the request
+    assert mail.outbox == []
+    assert OutboundEmail.objects.get().status == 'Pending'
+
+    OutboundEmail.objects.enqueue('Second', 'Body', ['other@example.com'])
+    CountingBackend.connections = 0
+    out = StringIO()
+    call_command('deliver_emails', '--once', stdout=out)
+    assert 'Sent 2 email(s), 0 failed.' in out.getvalue()
+    # One connection for the whole batch
+    assert CountingBackend.connections == 1
+    assert [message.to for message in mail.outbox] == [['tester@example.com'], ['other@example.com']]
+    assert mail.outbox[0].from_email == settings.DEFAULT_FROM_EMAIL
+    assert set(OutboundEmail.objects.values_list('status', flat=True)) == {'Sent'}
+
+@pytest.mark.django_db
+def test_failed_emails_back_off_and_give_up(settings):
+    settings.EMAIL_BACKEND = 'applications.notifications.tests.tests.FlakyBackend'
+    settings.NOTIFICATIONS_MAX_ATTEMPTS = 2
+    down = OutboundEmail.objects.enqueue('Down', 'Body', ['down@example.com'])
+    up = OutboundEmail.objects.enqueue('Up', 'Body', ['up@example.com'])
+
+    assert deliver_batch() == (1, 1)
+    down.refresh_from_db()
+    assert (down.status, down.attempts, down.last_error) == ('Pending', 1, 'ConnectionError: Mail server unavailable')
+    assert down.next_attempt_at > timezone.now() + timedelta(seconds=settings.NOTIFICATIONS_RETRY_SECONDS - 5)
+    assert OutboundEmail.objects.get(pk=up.pk).status == 'Sent'
+    # Not due yet
+    assert deliver_batch() == (0, 0)
+
+    OutboundEmail.objects.filter(pk=down.pk).update(next_attempt_at=timezone.now())
+    assert deliver_batch() == (0, 1)
+    assert OutboundEmail.objects.get(pk=down.pk).status == 'Failed'
+    assert [message.to for message in mail.outbox] == [['up@example.com']]
+
+@pytest.mark.django_db
+def test_email_reclaimed_mid_batch_is_sent_once(settings, monkeypatch):
+    settings.EMAIL_BACKEND = 'applications.notifications.tests.tests.SlowBackend'
+    settings.NOTIFICATIONS_LEASE_SECONDS = 300
+    SlowBackend.clock, SlowBackend.other_worker = [timezone.now()], None
+    monkeypatch.setattr('applications.notifications.delivery.timezone.now', lambda: SlowBackend.clock[0])
+    emails = [OutboundEmail.objects.enqueue(name, 'Body', [f'{name}@example.com']) for name in ('first', 'second', 'third')]
+    OutboundEmail.objects.update(next_attempt_at=SlowBackend.clock[0])
+
+    # The third email's lease runs out while the second is being sent and the other worker takes it over
+    assert deliver_batch() == (2, 0)
+    assert SlowBackend.other_worker == (1, 0)
+    assert sorted(message.to[0] for message in mail.outbox) == ['first@example.com', 'second@example.com', 'third@example.com']
+    assert list(OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).order_by('id').values_list('status', 'attempts')) == [
+        ('Sent', 1), ('Sent', 1), ('Sent', 2),
+    ]
+
+@pytest.mark.django_db
+def test_reclaimed_emails_count_as_attempts(settings, monkeypatch):
+    settings.NOTIFICATIONS_MAX_ATTEMPTS = 2
+    clock = [timezone.now()]
+    monkeypatch.setattr('applications.notifications.delivery.timezone.now', lambda: clock[0])
+    email = OutboundEmail.objects.enqueue('Crash', 'Body', ['crash@example.com'])
+    OutboundEmail.objects.update(next_attempt_at=clock[0])
+
+    # Each claim dies with the worker before a result is written
+    for attempt in (1, 2):
+        assert [claimed.attempts for claimed in claim_batch(10)] == [attempt]
+        clock[0] += timedelta(seconds=settings.NOTIFICATIONS_LEASE_SECONDS + 1)
+    assert claim_batch(10) == []
+    email.refresh_from_db()
+    assert (email.status, email.attempts) == ('Failed', 2)
+
+@pytest.mark.django_db
+def test_bulk_leave_decisions_queue_one_email_each(create_employee, authenticated_client):
+    employee = create_employee(email='testertest@gmail.com')
+    leaves = LeaveRequest.objects.bulk_create([
+        LeaveRequest(employee=employee, start_date='2024-12-02', end_date='2024-12-03', reason='a'),
+        LeaveRequest(employee=employee, start_date='2024-12-09', end_date='2024-12-10', reason='b'),
+    ])
+    client = authenticated_client('manager', 'Manager')
+    response = client.post('/api/leave_management/requests/decisions/', {'ids': [leave.pk for leave in leaves], 'status': 'Rejected'}, format='json')
+    assert response.json()['updated'] == 2
+    emails = list(OutboundEmail.objects.order_by('id').values_list('subject', 'recipients', 'body'))
+    assert [(subject, recipients) for subject, recipients, _ in emails] == [('Leave request rejected', ['testertest@gmail.com'])] * 2
+    assert 'from 2024-12-09 to 2024-12-10 has been rejected' in emails[1][2]
+    assert mail.outbox == []
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onboarding', '0003_userdevice'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userdevice',
+            index=models.Index(fields=['user', 'created_at'], name='user_device_user_created_idx'),
+        ),
+        # The composite index now leads with the foreign key; drop its single-column index
+        migrations.AlterField(
+            model_name='userdevice',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='devices', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
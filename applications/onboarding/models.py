@@ -52,11 +52,17 @@ class UserDevice(models.Model):
         __str__(): Returns a string representation of the user device, 
                    displaying the username and device name.
     """
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='devices')
+    # Covered by the (user, created_at) index below
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='devices', db_index=False)
     device_name = models.CharField(max_length=255)
     refresh_token = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='user_device_user_created_idx'),
+        ]
+
     def __str__(self):
         """
         Returns:
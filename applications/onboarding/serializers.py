@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.serialization import ValuesSerializer
 from .models import Employee, Profile
 from django.contrib.auth.models import User
 
@@ -75,4 +76,8 @@ class EmployeeSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Employee
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+
+# Read paths of the list endpoints; the profile role is read through a join
+USER_VALUES = ValuesSerializer(UserSerializer)
+EMPLOYEE_VALUES = ValuesSerializer(EmployeeSerializer)
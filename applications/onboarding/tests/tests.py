@@ -1,8 +1,13 @@
 from applications.onboarding.models import Employee
+from applications.onboarding.serializers import EMPLOYEE_VALUES, USER_VALUES, EmployeeSerializer, UserSerializer
 import pytest
-from rest_framework.test import APIClient
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
+from core.auth.permissions import HasRole, IsAdmin, IsManager, get_role
+from core.auth.token_serializer import CustomTokenObtainPairSerializer
 
 # Employee Model Test 
 # ------------------------------
@@ -19,6 +24,65 @@ def test_create_employee():
     assert employee.full_name == 'Tester test'
     assert employee.email == 'testertest@gmail.com'
 
+# Values Serializer Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_values_serializers_match_model_serializers(django_assert_num_queries):
+    test_create_employee()
+    User.objects.create_user(username='manager', email='manager@example.com', first_name='Man', password='secret')
+    User.objects.create_user(username='plain', password='secret').profile.delete()
+
+    users = User.objects.order_by('id')
+    with django_assert_num_queries(1):
+        rows = USER_VALUES.serialize(users.values_list(*USER_VALUES.columns))
+    assert rows == UserSerializer(users, many=True).data
+    assert rows[1]['profile'] is None
+    employees = Employee.objects.order_by('id')
+    assert EMPLOYEE_VALUES.serialize(employees.values_list(*EMPLOYEE_VALUES.columns)) == EmployeeSerializer(employees, many=True).data
+
+
+# Role Permission Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_role_permissions_decode_the_token_once(monkeypatch):
+    user = User.objects.create_user(username='manager', password='secret')
+    user.profile.role = 'Manager'
+    user.profile.save()
+    token = CustomTokenObtainPairSerializer.get_token(user).access_token
+
+    validations = []
+    validate = JWTAuthentication.get_validated_token
+    monkeypatch.setattr(JWTAuthentication, 'get_validated_token', lambda self, raw: validations.append(raw) or validate(self, raw))
+    request = Request(APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'), authenticators=[JWTAuthentication()])
+    assert request.user == user
+    assert not IsAdmin().has_permission(request, None)
+    assert IsManager().has_permission(request, None)
+    assert HasRole('Admin', 'Manager')().has_permission(request, None)
+    assert not HasRole('Admin', 'Employee')().has_permission(request, None)
+    assert len(validations) == 1
+
+    # Without a JWT the role comes from the profile; anonymous users have none
+    delete = Request(APIRequestFactory().delete('/'), authenticators=[])
+    delete.user, delete.auth = user, None
+    assert get_role(delete) == 'Manager'
+    assert not HasRole('Admin', 'Manager', methods={'DELETE': ('Admin',)})().has_permission(delete, None)
+    anonymous = Request(APIRequestFactory().get('/'))
+    assert get_role(anonymous) is None
+    assert not HasRole('Admin', 'Manager')().has_permission(anonymous, None)
+
+@pytest.mark.django_db
+def test_views_enforce_roles():
+    client = APIClient()
+    user = User.objects.create_user(username='staff', password='secret')
+    client.force_authenticate(user=user)
+    assert client.get('/api/onboarding/employees/').status_code == 403
+
+    user.profile.role = 'Manager'
+    user.profile.save()
+    client.force_authenticate(user=User.objects.get(pk=user.pk))
+    assert client.get('/api/onboarding/employees/').status_code == 404
+    assert client.delete(f'/api/onboarding/users/{user.pk}/').status_code == 403
+
 
 # # Employee API POST GET URL Test 
 # # -------------------------------------
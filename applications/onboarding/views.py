@@ -1,14 +1,12 @@
 from django.shortcuts import get_object_or_404, get_list_or_404
-from django.utils.decorators import method_decorator
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.decorators import permission_classes
-from core.auth.permissions import IsAdmin, IsManager
+from core.auth.permissions import HasRole
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth.models import User
 from .models import Employee
-from .serializers import EmployeeSerializer, UserSerializer
+from .serializers import EMPLOYEE_VALUES, USER_VALUES, EmployeeSerializer, UserSerializer
 
 
 # User List API View
@@ -36,9 +34,9 @@ class UserListView(APIView):
                 - HTTP 201: The created user account.
                 - HTTP 400: Validation errors.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = UserSerializer
 
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request):
         """
         Retrieve a list of all user accounts.
@@ -46,11 +44,9 @@ class UserListView(APIView):
         Returns:
             - HTTP 200: List of serialized user accounts.
         """
-        users = User.objects.all()
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        users = User.objects.values_list(*USER_VALUES.columns)
+        return Response(USER_VALUES.serialize(users), status=status.HTTP_200_OK)
 
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def post(self, request):
         """
         Create a new user account.
@@ -102,6 +98,7 @@ class UserDetailView(APIView):
                 - HTTP 204: No content, user successfully deleted.
                 - HTTP 404: If the user does not exist.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager', methods={'DELETE': ('Admin',)})]
     serializer_class = UserSerializer
 
     def get_object_helper(self, pk):
@@ -117,7 +114,6 @@ class UserDetailView(APIView):
         return get_object_or_404(User, pk=pk)
     
     # Retrieve a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request, pk):
         """
         Retrieve a user account by primary key.
@@ -134,7 +130,6 @@ class UserDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     # Update a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def put(self, request, pk):
         """
         Update a user account by primary key.
@@ -159,7 +154,6 @@ class UserDetailView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # Delete a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin]))
     def delete(self, request, pk):
         """
         Delete a user account by primary key.
@@ -198,9 +192,9 @@ class EmployeeListView(APIView):
                 - HTTP 201: The created employee record.
                 - HTTP 400: Validation errors.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = EmployeeSerializer
 
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request):
         """
         Retrieve a list of all employee records.
@@ -208,11 +202,9 @@ class EmployeeListView(APIView):
         Returns:
             - HTTP 200: List of serialized employee records.
         """
-        employees = get_list_or_404(Employee)
-        serializer = EmployeeSerializer(employees, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        employees = get_list_or_404(Employee.objects.values_list(*EMPLOYEE_VALUES.columns))
+        return Response(EMPLOYEE_VALUES.serialize(employees), status=status.HTTP_200_OK)
     
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def post(self, request):
         """
         Create a new employee record.
@@ -260,6 +252,7 @@ class EmployeeDetailView(APIView):
                 - HTTP 204: No content, employee successfully deleted.
                 - HTTP 404: If the employee does not exist.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = EmployeeSerializer
     
     def get_object_helper(self, pk):
@@ -276,7 +269,6 @@ class EmployeeDetailView(APIView):
         return get_object_or_404(Employee, pk=pk)
 
     # Retrieve a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def get(self, request, pk):
         """
         Retrieve an employee record by primary key.
@@ -293,7 +285,6 @@ class EmployeeDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     # Update a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def put(self, request, pk):
         """
         Update an employee record by primary key.
@@ -314,7 +305,6 @@ class EmployeeDetailView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # Delete a single object by pk
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
     def delete(self, request, pk):
         """
         Delete an employee record by primary key.
@@ -0,0 +1,95 @@
+from collections import Counter
+from django.db.models import Count, Sum
+from applications.attendance.archive import attendance_history
+from applications.leave_management.models import LeaveRequest
+from core.filters import filter_datetime_range, local_day_bounds
+from .models import AttendanceDailySummary
+
+# Attendance Frequency Aggregation
+# -------------------------------------------------------------
+def attendance_frequency(start=None, end=None, top=None, source='logs'):
+    """
+    Count attendance sessions per employee in a single grouped query.
+
+    Sessions are grouped by the employee primary key, so two employees who
+    share a full name are reported separately. Date filtering, ordering and the
+    top-N cut are all applied in SQL.
+
+    Args:
+        start (date, optional): First local day to include.
+        end (date, optional): Last local day to include.
+        top (int, optional): Only return the `top` most frequent employees.
+        source (str): 'logs' to count raw attendance logs, or 'summary' to sum
+                      the session counts of the daily summary table.
+
+    Returns:
+        list: Dicts with `employee_id`, `employee__employee_id`,
+              `employee__full_name` and `count`, most frequent first.
+    """
+    if source == 'summary':
+        queryset = AttendanceDailySummary.objects.all()
+        if start:
+            queryset = queryset.filter(date__gte=start)
+        if end:
+            queryset = queryset.filter(date__lte=end)
+        count = Sum('session_count')
+    else:
+        history = filter_datetime_range(attendance_history(local_day_bounds(start, end)[0]), 'clock_in_time', start, end)
+        if len(history.querysets) > 1:
+            return merge_frequencies(history.querysets, top)
+        queryset, count = history.querysets[0], Count('id')
+    rows = (
+        queryset
+        .values('employee_id', 'employee__employee_id', 'employee__full_name')
+        .annotate(count=count)
+        .order_by('-count', 'employee__full_name', 'employee_id')
+    )
+    if top:
+        rows = rows[:top]
+    return list(rows)
+
+def merge_frequencies(querysets, top=None):
+    """
+    Add up per-employee session counts of the hot and archive tables.
+
+    Each table is grouped in SQL; only one row per employee and table reaches
+    Python, where the counts are summed, ordered and cut to `top`.
+    """
+    totals = {}
+    for queryset in querysets:
+        for row in queryset.values('employee_id', 'employee__employee_id', 'employee__full_name').annotate(count=Count('id')).order_by():
+            if row['employee_id'] in totals:
+                totals[row['employee_id']]['count'] += row['count']
+            else:
+                totals[row['employee_id']] = row
+    rows = sorted(totals.values(), key=lambda row: (-row['count'], row['employee__full_name'], row['employee_id']))
+    return rows[:top] if top else rows
+
+def frequency_labels(rows):
+    """
+    Build chart labels for `attendance_frequency` rows.
+
+    Employees whose full names collide are disambiguated with their employee ID.
+
+    Returns:
+        list: One label per row.
+    """
+    names = Counter(row['employee__full_name'] for row in rows)
+    return [
+        f"{row['employee__full_name']} ({row['employee__employee_id']})" if names[row['employee__full_name']] > 1 else row['employee__full_name']
+        for row in rows
+    ]
+
+# Leave Status Aggregation
+# -------------------------------------------------------------
+def leave_status_counts():
+    """
+    Count leave requests per status in a single grouped query.
+
+    Returns:
+        tuple: `(labels, counts)` covering every status choice, including
+               statuses with no requests.
+    """
+    labels = [value for value, _ in LeaveRequest.STATUS_CHOICES]
+    totals = dict(LeaveRequest.objects.values_list('status').annotate(total=Count('id')).order_by())
+    return labels, [totals.get(label, 0) for label in labels]
@@ -0,0 +1,158 @@
+from itertools import islice
+import numpy as np
+from django.conf import settings
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from applications.onboarding.models import Employee
+from applications.attendance.archive import attendance_history
+from core.filters import filter_datetime_range, local_day_bounds
+
+# Working Time Analytics
+# -------------------------------------------------------------
+def load_sessions(start=None, end=None, chunk_size=None):
+    """
+    Load closed attendance sessions as flat NumPy arrays.
+
+    Only `(employee_id, local day, duration_seconds)` tuples are fetched; no
+    model instances are built. Archived sessions are included when the range
+    reaches past the archive horizon. The arrays are sized from a prior
+    `count()` and filled from a streamed cursor one chunk at a time, so peak
+    memory is the arrays plus one chunk of tuples, not a tuple per session.
+
+    Args:
+        start (date, optional): First local day to include.
+        end (date, optional): Last local day to include.
+        chunk_size (int, optional): Rows fetched per chunk; defaults to
+                                    `REPORTING_STREAM_CHUNK_SIZE`.
+
+    Returns:
+        tuple: `(employee_ids, days, durations)` arrays, where `days` are date
+               ordinals in the project `TIME_ZONE` and `durations` are seconds.
+    """
+    chunk_size = chunk_size or settings.REPORTING_STREAM_CHUNK_SIZE
+    history = attendance_history(local_day_bounds(start, end)[0]).filter(clock_out_time__isnull=False)
+    queryset = filter_datetime_range(history, 'clock_in_time', start, end)
+    size = queryset.count()
+    employee_ids = np.empty(size, dtype=np.int64)
+    days = np.empty(size, dtype=np.int64)
+    durations = np.empty(size, dtype=np.float64)
+
+    rows = (
+        queryset
+        .annotate(day=TruncDate('clock_in_time', tzinfo=timezone.get_current_timezone()))
+        .values_list('employee_id', 'day', 'duration_seconds')
+        .iterator(chunk_size=chunk_size)
+    )
+    filled = 0
+    while chunk := list(islice(rows, chunk_size)):
+        end_index = filled + len(chunk)
+        if end_index > len(employee_ids):
+            # Sessions closed after the count; grow instead of failing
+            extra = max(end_index - len(employee_ids), chunk_size)
+            employee_ids = np.concatenate((employee_ids, np.empty(extra, dtype=np.int64)))
+            days = np.concatenate((days, np.empty(extra, dtype=np.int64)))
+            durations = np.concatenate((durations, np.empty(extra, dtype=np.float64)))
+        chunk_ids, chunk_days, chunk_durations = zip(*chunk)
+        employee_ids[filled:end_index] = chunk_ids
+        days[filled:end_index] = [day.toordinal() for day in chunk_days]
+        durations[filled:end_index] = chunk_durations
+        filled = end_index
+    return employee_ids[:filled], days[:filled], durations[:filled]
+
+def group_percentile(sorted_values, starts, counts, q):
+    """
+    Linearly interpolated percentile of each group of a grouped, sorted array.
+
+    Args:
+        sorted_values (ndarray): Values sorted by group, then by value.
+        starts (ndarray): Index of the first element of each group.
+        counts (ndarray): Number of elements in each group.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        ndarray: One percentile per group, matching `numpy.percentile`.
+    """
+    position = starts + (counts - 1) * (q / 100.0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+def working_time_stats(employee_ids, days, durations, overtime_seconds, short_seconds):
+    """
+    Compute per-employee working time statistics with vectorized group-bys.
+
+    Sessions are sorted once by `(employee, duration)`; each employee is then a
+    contiguous slice, so totals come from `np.add.reduceat`, percentiles from
+    direct indexing and counts from `np.bincount`. Overtime is the time worked
+    beyond `overtime_seconds` on each local day.
+
+    Args:
+        employee_ids (ndarray): Employee primary key of each session.
+        days (ndarray): Local day ordinal of each session's clock-in.
+        durations (ndarray): Session lengths in seconds.
+        overtime_seconds (float): Daily working time above which hours count as overtime.
+        short_seconds (float): Sessions shorter than this are counted as short.
+
+    Returns:
+        dict: Arrays keyed by `employee_id`, `sessions`, `total`, `mean`, `p50`,
+              `p95`, `overtime` and `short_sessions`; durations are in seconds.
+    """
+    order = np.lexsort((durations, employee_ids))
+    employee_ids, days, durations = employee_ids[order], days[order], durations[order]
+    unique_ids, starts, counts = np.unique(employee_ids, return_index=True, return_counts=True)
+    group = np.repeat(np.arange(len(unique_ids)), counts)
+
+    totals = np.add.reduceat(durations, starts)
+
+    # Overtime is assessed on each employee's daily total, not per session
+    first_day, span = days.min(), days.max() - days.min() + 1
+    day_keys, day_index = np.unique(group * span + (days - first_day), return_inverse=True)
+    daily_totals = np.bincount(day_index, weights=durations)
+    daily_overtime = np.maximum(daily_totals - overtime_seconds, 0)
+    overtime = np.bincount(day_keys // span, weights=daily_overtime, minlength=len(unique_ids))
+
+    return {
+        'employee_id': unique_ids,
+        'sessions': counts,
+        'total': totals,
+        'mean': totals / counts,
+        'p50': group_percentile(durations, starts, counts, 50),
+        'p95': group_percentile(durations, starts, counts, 95),
+        'overtime': overtime,
+        'short_sessions': np.bincount(group, weights=durations < short_seconds, minlength=len(unique_ids)).astype(np.int64),
+    }
+
+def working_time_report(start=None, end=None, overtime_hours=8, short_minutes=30):
+    """
+    Build the per-employee working time report for a date range.
+
+    Returns:
+        list: One JSON-ready dict per employee with session count, total, mean,
+              p50 and p95 session length, overtime (all in hours) and the number
+              of short sessions.
+    """
+    employee_ids, days, durations = load_sessions(start, end)
+    if not len(durations):
+        return []
+    stats = working_time_stats(employee_ids, days, durations, overtime_hours * 3600, short_minutes * 60)
+    employees = {
+        pk: (code, name)
+        for pk, code, name in Employee.objects.filter(pk__in=stats['employee_id'].tolist()).values_list('id', 'employee_id', 'full_name')
+    }
+
+    hours = {key: np.round(stats[key] / 3600, 2).tolist() for key in ('total', 'mean', 'p50', 'p95', 'overtime')}
+    return [
+        {
+            'employee_id': employees[pk][0],
+            'employee_name': employees[pk][1],
+            'sessions': sessions,
+            'total_hours': hours['total'][index],
+            'mean_hours': hours['mean'][index],
+            'p50_hours': hours['p50'][index],
+            'p95_hours': hours['p95'][index],
+            'overtime_hours': hours['overtime'][index],
+            'short_sessions': short,
+        }
+        for index, (pk, sessions, short) in enumerate(zip(stats['employee_id'].tolist(), stats['sessions'].tolist(), stats['short_sessions'].tolist()))
+    ]
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from django.conf import settings
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Chart Renderers
+# -------------------------------------------------------------
+# Renderers build their own `Figure` and attach an Agg canvas directly, so they
+# never touch the global `matplotlib.pyplot` state machine and are safe to run
+# from any thread or worker process.
+def render_bar_chart(labels, values, title, xlabel, ylabel):
+    """
+    Render a bar chart as PNG bytes.
+    """
+    figure = Figure(figsize=(12, 6))
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.bar(labels, values, color='blue')
+    axes.set_xlabel(xlabel, color='purple')
+    axes.set_ylabel(ylabel, color='purple')
+    axes.set_title(title, color='purple')
+    axes.tick_params(axis='x', labelrotation=45)
+    figure.tight_layout()
+    buffer = BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+def render_pie_chart(labels, values, title):
+    """
+    Render a pie chart as PNG bytes.
+    """
+    figure = Figure(figsize=(6, 6))
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.pie(values, labels=labels, autopct='%1.1f%%', startangle=140)
+    axes.axis('equal')  # Equal aspect ratio ensures the pie is drawn as a circle
+    axes.set_title(title)
+    figure.tight_layout()
+    buffer = BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+RENDERERS = {
+    'bar': render_bar_chart,
+    'pie': render_pie_chart,
+}
+
+def render(kind, spec):
+    """
+    Render a chart by kind. Module level so it can be pickled into worker processes.
+    """
+    return RENDERERS[kind](**spec)
+
+# PNG Cache
+# -------------------------------------------------------------
+class PNGCache:
+    """
+    Thread-safe, size-bounded LRU cache of rendered charts.
+
+    Attributes:
+        max_entries (int): Number of PNGs kept before the least recently used is evicted.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+            return png
+
+    def set(self, key, png):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = png
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+# Chart Service
+# -------------------------------------------------------------
+class ChartUnavailable(Exception):
+    """
+    Raised when a chart cannot be rendered in time or the worker pool keeps failing.
+    """
+
+class ChartService:
+    """
+    Renders charts off the request thread and caches the resulting PNGs.
+
+    Charts are rendered in a bounded pool of worker processes, so CPU-heavy
+    rendering neither holds the GIL of the web worker nor shares matplotlib
+    state between threads. Results are cached under a fingerprint of the chart
+    kind and input series, so an unchanged dashboard costs a dict lookup.
+
+    Attributes:
+        max_workers (int): Size of the process pool. 0 renders in the calling thread.
+        timeout (float): Seconds to wait for a worker before giving up.
+        cache (PNGCache): The LRU cache of rendered charts.
+
+    Methods:
+        fingerprint(kind, spec):
+            Return the cache key for a chart.
+        render(kind, **spec):
+            Return PNG bytes for the chart, rendering it if it is not cached.
+        shutdown():
+            Stop the worker pool.
+    """
+    def __init__(self, max_workers, cache_size, timeout=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = PNGCache(cache_size)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(kind, spec):
+        payload = json.dumps([kind, spec], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                # Spawned (not forked) workers do not inherit the web server's threads or DB connections.
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+            return self._pool
+
+    def _discard_pool(self, pool):
+        # Only the pool that broke is dropped; another thread may already have replaced it
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _render_in_pool(self, kind, spec):
+        for attempt in range(2):
+            pool = self._get_pool()
+            try:
+                future = pool.submit(render, kind, spec)
+                return future.result(timeout=self.timeout)
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                if attempt:
+                    raise ChartUnavailable('The chart workers crashed.')
+            except FutureTimeoutError:
+                future.cancel()
+                raise ChartUnavailable(f'The chart was not rendered within {self.timeout} seconds.')
+
+    def render(self, kind, **spec):
+        """
+        Return the PNG for a chart, rendering it only on a cache miss.
+
+        Args:
+            kind (str): The chart kind, one of `RENDERERS`.
+            spec: Keyword arguments passed to the renderer (labels, values, titles).
+
+        Returns:
+            bytes: The rendered PNG image.
+
+        Raises:
+            ChartUnavailable: If the render timed out or the pool broke twice.
+        """
+        key = self.fingerprint(kind, spec)
+        png = self.cache.get(key)
+        if png is None:
+            if self.max_workers > 0:
+                png = self._render_in_pool(kind, spec)
+            else:
+                png = render(kind, spec)
+            self.cache.set(key, png)
+        return png
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+_chart_service = None
+_chart_service_lock = threading.Lock()
+
+def get_chart_service():
+    """
+    Return the process-wide `ChartService`, configured from settings on first use.
+    """
+    global _chart_service
+    with _chart_service_lock:
+        if _chart_service is None:
+            _chart_service = ChartService(
+                max_workers=settings.REPORTING_CHART_WORKERS,
+                cache_size=settings.REPORTING_CHART_CACHE_SIZE,
+                timeout=settings.REPORTING_CHART_TIMEOUT,
+            )
+        return _chart_service
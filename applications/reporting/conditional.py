@@ -0,0 +1,60 @@
+import hashlib
+from functools import wraps
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from .models import DatasetVersion
+
+# Conditional Report Responses
+# -------------------------------------------------------------
+def report_validators(request, models):
+    """
+    Compute the `ETag` and `Last-Modified` validators of a report request.
+
+    The ETag combines the versions of every table the report reads with the
+    full request path, so different filters or formats of the same report get
+    distinct tags. Both values come from a single lookup on `DatasetVersion`.
+
+    Args:
+        request (Request): The incoming request.
+        models (tuple): The model classes the report is built from.
+
+    Returns:
+        tuple: `(etag, last_modified)` where `etag` is a quoted strong ETag and
+               `last_modified` is a Unix timestamp or None.
+    """
+    token, updated_at = DatasetVersion.objects.state(*models)
+    digest = hashlib.sha256(f'{token}|{request.get_full_path()}'.encode()).hexdigest()[:32]
+    return quote_etag(digest), int(updated_at.timestamp()) if updated_at else None
+
+def conditional_report(*models):
+    """
+    Decorate a report handler with conditional GET support.
+
+    Before the handler runs, the request's `If-None-Match` / `If-Modified-Since`
+    headers are compared with the current dataset versions; when nothing has
+    changed a 304 is returned without running any report query. Otherwise the
+    handler runs. Successful and 304 responses carry `ETag`, `Last-Modified`
+    and `Cache-Control: private, no-cache` so clients revalidate every time.
+
+    Args:
+        models (Model): The model classes the report is built from. When omitted,
+                        the view's `dataset_models` attribute is used instead.
+
+    Returns:
+        callable: A decorator for `APIView` handler methods.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            etag, last_modified = report_validators(request, models or self.dataset_models)
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = handler(self, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response.headers.setdefault('ETag', etag)
+                if last_modified is not None:
+                    response.headers.setdefault('Last-Modified', http_date(last_modified))
+                response.headers.setdefault('Cache-Control', 'private, no-cache')
+            return response
+        return wrapper
+    return decorator
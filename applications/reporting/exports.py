@@ -0,0 +1,192 @@
+import csv
+import zlib
+from applications.leave_management.holidays import working_days
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+# Pseudo Buffer
+# -------------------------------------------------------------
+class Echo:
+    """
+    File-like object that hands back whatever is written to it.
+
+    `csv.writer` only needs a `write` method, so pointing it at an `Echo` turns
+    `writer.writerow(...)` into a function that returns the encoded line
+    without ever accumulating the file in memory.
+    """
+    def write(self, value):
+        return value
+
+# Column Formatters
+# -------------------------------------------------------------
+def local_datetime(value):
+    """
+    Format an aware datetime in the project `TIME_ZONE`, leaving empty values blank.
+    """
+    return timezone.localtime(value).isoformat() if value else ''
+
+# CSV Export Engine
+# -------------------------------------------------------------
+class CSVExport:
+    """
+    Declarative, constant-memory CSV export of a queryset.
+
+    Rows are read with `values_list(...).iterator(chunk_size=...)`, encoded
+    through an `Echo` pseudo-buffer and yielded in batches, so an export of any
+    size keeps a flat memory profile and the header row is sent immediately.
+
+    Attributes:
+        filename (str): Download name of the file, without the extension.
+        columns (list): `(header, field)` pairs; `field` is a `values_list` lookup.
+        formatters (dict): Optional mapping of field lookup to a callable applied
+                           to each value before it is written.
+        computed (list): Optional `(header, fields, function)` columns appended
+                         after `columns`. `function` receives one list of values
+                         per lookup in `fields` for a whole batch of rows and
+                         returns the column's values, so it can be vectorized.
+
+    Methods:
+        iter_rows(queryset, chunk_size, progress=None):
+            Yield CSV text chunks for the queryset.
+        iter_gzip(chunks):
+            Compress an iterable of text chunks on the fly.
+        response(queryset, chunk_size, compress=False):
+            Build a `StreamingHttpResponse` for the export.
+    """
+    def __init__(self, filename, columns, formatters=None, computed=None):
+        self.filename = filename
+        self.columns = columns
+        self.formatters = formatters or {}
+        self.computed = computed or []
+
+    @property
+    def fields(self):
+        # Lookups only read by computed columns are fetched after the exported ones
+        fields = [field for _, field in self.columns]
+        return fields + [field for _, lookups, _ in self.computed for field in lookups if field not in fields]
+
+    def write_batch(self, writer, rows, formatters):
+        """
+        Encode a batch of `values_list` rows, computing the extra columns for the whole batch.
+        """
+        width = len(self.columns)
+        if self.computed:
+            position = {field: index for index, field in enumerate(self.fields)}
+            extra = [function(*([row[position[field]] for row in rows] for field in lookups)) for _, lookups, function in self.computed]
+            rows = [row[:width] + tuple(values) for row, *values in zip(rows, *extra)]
+        if any(formatters):
+            rows = [[fmt(value) if fmt else value for fmt, value in zip(formatters, row)] for row in rows]
+        return ''.join(writer.writerow(row) for row in rows)
+
+    def iter_rows(self, queryset, chunk_size, progress=None):
+        """
+        Yield the CSV header followed by the queryset rows in batches.
+
+        Args:
+            queryset (QuerySet): The queryset to export.
+            chunk_size (int): Rows fetched per database round trip and per yielded chunk.
+            progress (callable, optional): Called with the number of rows written
+                                           so far after each batch.
+
+        Yields:
+            str: CSV encoded text.
+        """
+        writer = csv.writer(Echo())
+        yield writer.writerow([header for header, _ in self.columns] + [header for header, _, _ in self.computed])
+
+        formatters = [self.formatters.get(field) for _, field in self.columns] + [None] * len(self.computed)
+        batch = []
+        written = 0
+        for row in queryset.values_list(*self.fields).iterator(chunk_size=chunk_size):
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                written += len(batch)
+                yield self.write_batch(writer, batch, formatters)
+                batch = []
+                if progress:
+                    progress(written)
+        if batch:
+            written += len(batch)
+            yield self.write_batch(writer, batch, formatters)
+            if progress:
+                progress(written)
+
+    @staticmethod
+    def iter_gzip(chunks):
+        """
+        Gzip-compress text chunks as they are produced.
+
+        Each chunk is followed by a sync flush so the client receives data as soon
+        as it is generated rather than when the compressor's window fills.
+
+        Args:
+            chunks (iterable): Iterable of text chunks.
+
+        Yields:
+            bytes: Gzip stream fragments.
+        """
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def response(self, queryset, chunk_size, compress=False):
+        """
+        Build a streaming download for the queryset.
+
+        Args:
+            queryset (QuerySet): The queryset to export.
+            chunk_size (int): Rows per database round trip and per chunk.
+            compress (bool): Whether to serve a gzip-compressed `.csv.gz` file.
+
+        Returns:
+            StreamingHttpResponse: The CSV (or gzipped CSV) attachment.
+        """
+        chunks = self.iter_rows(queryset, chunk_size)
+        if compress:
+            return StreamingHttpResponse(
+                self.iter_gzip(chunks),
+                content_type='application/gzip',
+                headers={'Content-Disposition': f'attachment; filename="{self.filename}.csv.gz"'},
+            )
+        return StreamingHttpResponse(
+            chunks,
+            content_type='text/csv',
+            headers={'Content-Disposition': f'attachment; filename="{self.filename}.csv"'},
+        )
+
+# Export Definitions
+# -------------------------------------------------------------
+EMPLOYEE_EXPORT = CSVExport('employees', [
+    ('Employee ID', 'employee_id'),
+    ('Full Name', 'full_name'),
+    ('Email', 'email'),
+    ('Job Title', 'job_title'),
+    ('Date Joined', 'date_joined'),
+])
+
+ATTENDANCE_EXPORT = CSVExport('attendance', [
+    ('Employee ID', 'employee__employee_id'),
+    ('Full Name', 'employee__full_name'),
+    ('Clock In Time', 'clock_in_time'),
+    ('Clock Out Time', 'clock_out_time'),
+], formatters={
+    'clock_in_time': local_datetime,
+    'clock_out_time': local_datetime,
+})
+
+LEAVE_EXPORT = CSVExport('leaves', [
+    ('Employee ID', 'employee__employee_id'),
+    ('Full Name', 'employee__full_name'),
+    ('Start Date', 'start_date'),
+    ('End Date', 'end_date'),
+    ('Reason', 'reason'),
+    ('Status', 'status'),
+    ('Created At', 'created_at'),
+], formatters={
+    'created_at': local_datetime,
+}, computed=[
+    ('Working Days', ('start_date', 'end_date'), lambda starts, ends: working_days(starts, ends).tolist()),
+])
@@ -0,0 +1,228 @@
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.core.files import File
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from applications.onboarding.models import Employee
+from applications.attendance.archive import attendance_history
+from applications.leave_management.models import LeaveRequest
+from core.filters import filter_datetime_range, local_day_bounds
+from .aggregations import attendance_frequency, frequency_labels, leave_status_counts
+from .charts import get_chart_service
+from .exports import ATTENDANCE_EXPORT, EMPLOYEE_EXPORT, LEAVE_EXPORT
+from .models import ReportJob
+from .streaming import attendance_report_rows, iter_json_chunks
+
+# Report Generators
+# -------------------------------------------------------------
+# A generator receives the job and a progress callback and returns
+# `(filename, chunks, total_rows)`, where `chunks` is an iterable of str/bytes.
+def job_date_range(job):
+    """
+    Return the `(from, to)` dates stored in a job's params, either of which may be None.
+    """
+    return parse_date(job.params.get('from') or ''), parse_date(job.params.get('to') or '')
+
+def attendance_queryset(job):
+    start, end = job_date_range(job)
+    history = attendance_history(local_day_bounds(start, end)[0]).order_by('clock_in_time', 'id')
+    return filter_datetime_range(history, 'clock_in_time', start, end)
+
+def csv_artifact(export, queryset, progress):
+    return f'{export.filename}.csv', export.iter_rows(queryset, settings.REPORTING_EXPORT_CHUNK_SIZE, progress), queryset.count()
+
+def generate_employees_csv(job, progress):
+    return csv_artifact(EMPLOYEE_EXPORT, Employee.objects.order_by('id'), progress)
+
+def generate_attendance_csv(job, progress):
+    return csv_artifact(ATTENDANCE_EXPORT, attendance_queryset(job), progress)
+
+def generate_leaves_csv(job, progress):
+    return csv_artifact(LEAVE_EXPORT, LeaveRequest.objects.order_by('id'), progress)
+
+def generate_attendance_report(job, progress):
+    queryset = attendance_queryset(job)
+    chunk_size = settings.REPORTING_STREAM_CHUNK_SIZE
+    rows = attendance_report_rows(queryset, chunk_size)
+    return 'attendance.ndjson', iter_json_chunks(rows, 'ndjson', chunk_size, progress), queryset.count()
+
+def generate_attendance_graph(job, progress):
+    start, end = job_date_range(job)
+    rows = attendance_frequency(start, end, top=job.params.get('top'))
+    png = get_chart_service().render(
+        'bar',
+        labels=frequency_labels(rows),
+        values=[row['count'] for row in rows],
+        title='Employee Attendance Frequency Bar Graph',
+        xlabel='Employee Full Name',
+        ylabel='Attendance Count',
+    )
+    return 'attendance_frequency.png', [png], None
+
+def generate_leave_status_graph(job, progress):
+    labels, counts = leave_status_counts()
+    png = get_chart_service().render('pie', labels=labels, values=counts, title='Leave Request Status Distribution')
+    return 'leave_status.png', [png], None
+
+GENERATORS = {
+    'employees_csv': generate_employees_csv,
+    'attendance_csv': generate_attendance_csv,
+    'leaves_csv': generate_leaves_csv,
+    'attendance_report': generate_attendance_report,
+    'attendance_graph': generate_attendance_graph,
+    'leave_status_graph': generate_leave_status_graph,
+}
+
+# Job Runner
+# -------------------------------------------------------------
+class LeaseLost(Exception):
+    """
+    Raised inside a running job once its lease was recovered by another worker.
+    """
+
+def claim_job(job_id):
+    """
+    Atomically move a job from Pending to Running and start its lease.
+
+    Returns:
+        int: The attempt number this caller claimed, or None if another worker
+             already claimed the job.
+    """
+    now = timezone.now()
+    claimed = ReportJob.objects.filter(pk=job_id, status='Pending').update(
+        status='Running', started_at=now, heartbeat_at=now, attempts=F('attempts') + 1,
+    )
+    if not claimed:
+        return None
+    return ReportJob.objects.filter(pk=job_id).values_list('attempts', flat=True).get()
+
+def run_job(job_id):
+    """
+    Execute a pending report job and store its artifact.
+
+    The artifact is spooled to a temporary file chunk by chunk and then saved
+    to file storage, so memory use does not depend on the report size.
+    Progress is written back to the job after every chunk, which also renews
+    the job's lease, and the lease is renewed once more before the artifact
+    is saved. Every write is conditional on the claimed attempt, so a worker
+    whose job was recovered meanwhile stops at its next chunk instead of
+    overwriting the new attempt; if that happens while the artifact is being
+    saved, the stored file is deleted again.
+
+    Args:
+        job_id (int): The primary key of the job.
+
+    Returns:
+        bool: True if the job was claimed and executed, False otherwise.
+    """
+    attempt = claim_job(job_id)
+    if attempt is None:
+        return False
+    job = ReportJob.objects.get(pk=job_id)
+    lease = ReportJob.objects.filter(pk=job_id, status='Running', attempts=attempt)
+
+    def renew(**update):
+        if not lease.update(heartbeat_at=timezone.now(), **update):
+            raise LeaseLost(f'Report job {job_id} was recovered by another worker.')
+
+    def progress(rows):
+        update = {'rows_processed': rows}
+        if job.total_rows:
+            update['progress'] = min(99, rows * 100 // job.total_rows)
+        renew(**update)
+
+    try:
+        filename, chunks, job.total_rows = GENERATORS[job.kind](job, progress)
+        renew(total_rows=job.total_rows)
+        with tempfile.TemporaryFile() as artifact:
+            for chunk in chunks:
+                artifact.write(chunk.encode() if isinstance(chunk, str) else chunk)
+            artifact.seek(0)
+            # Saving a large artifact to remote storage can take a while
+            renew()
+            job.result.save(f'{job.pk}_{filename}', File(artifact), save=False)
+        if not lease.update(status='Completed', progress=100, result=job.result.name, finished_at=timezone.now()):
+            # Recovered while the file was saved; no job points to it
+            job.result.delete(save=False)
+    except LeaseLost:
+        pass
+    except Exception as exc:
+        lease.update(status='Failed', error=str(exc), finished_at=timezone.now())
+    return True
+
+def recover_stale_jobs():
+    """
+    Recover Running jobs whose worker stopped renewing the lease.
+
+    A job claimed by a worker that died or restarted would otherwise stay
+    Running forever. Jobs whose last heartbeat is older than
+    `REPORTING_JOB_LEASE_SECONDS` go back to Pending, or to Failed once they
+    have been claimed `REPORTING_JOB_MAX_ATTEMPTS` times.
+
+    Returns:
+        tuple: `(requeued, failed)` job counts.
+    """
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=settings.REPORTING_JOB_LEASE_SECONDS)
+    expired = ReportJob.objects.filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff), status='Running',
+    )
+    failed = expired.filter(attempts__gte=settings.REPORTING_JOB_MAX_ATTEMPTS).update(
+        status='Failed', error='The worker running this job stopped responding.', finished_at=now,
+    )
+    requeued = expired.update(status='Pending', progress=0, rows_processed=0)
+    return requeued, failed
+
+def run_pending_jobs(limit=None):
+    """
+    Run pending jobs in submission order.
+
+    Args:
+        limit (int, optional): Stop after this many jobs.
+
+    Returns:
+        int: The number of jobs executed.
+    """
+    executed = 0
+    while limit is None or executed < limit:
+        job_id = ReportJob.objects.filter(status='Pending').order_by('created_at', 'id').values_list('id', flat=True).first()
+        if job_id is None:
+            break
+        if run_job(job_id):
+            executed += 1
+    return executed
+
+# In-Process Worker Pool
+# -------------------------------------------------------------
+_executor = None
+_executor_lock = threading.Lock()
+
+def _run_in_worker(job_id):
+    try:
+        run_job(job_id)
+    finally:
+        # Worker threads own their database connections; release them between jobs
+        connections.close_all()
+
+def submit_job(job):
+    """
+    Hand a saved job to the in-process worker pool once the transaction commits.
+
+    When `REPORTING_JOB_WORKERS` is 0 the job is left Pending for the
+    `run_report_jobs` management command to pick up.
+
+    Args:
+        job (ReportJob): The job to run.
+    """
+    global _executor
+    if settings.REPORTING_JOB_WORKERS <= 0:
+        return
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.REPORTING_JOB_WORKERS, thread_name_prefix='report-job')
+    transaction.on_commit(lambda: _executor.submit(_run_in_worker, job.pk))
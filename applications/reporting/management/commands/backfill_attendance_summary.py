@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from applications.onboarding.models import Employee
+from applications.attendance.archive import attendance_history
+from applications.attendance.models import Attendance
+from applications.reporting.models import AttendanceDailySummary, DatasetVersion
+from core.filters import filter_datetime_range, local_day_bounds
+
+# Backfill Attendance Summary Command
+# -------------------------------------------------------------
+class Command(BaseCommand):
+    """
+    Management command that rebuilds `AttendanceDailySummary` from raw attendance logs,
+    including archived ones.
+
+    Employees are processed in batches; each batch is aggregated with one
+    grouped query, written with one upsert and committed on its own, so the
+    command can be interrupted and re-run safely.
+
+    Example:
+        python manage.py backfill_attendance_summary --batch-size 500 --from 2024-01-01
+    """
+    help = 'Rebuild the attendance daily summary table from raw attendance logs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of employees aggregated per batch.')
+        parser.add_argument('--from', dest='start', help='First local day to rebuild (YYYY-MM-DD).')
+        parser.add_argument('--to', dest='end', help='Last local day to rebuild (YYYY-MM-DD).')
+
+    def parse_day(self, value, name):
+        if value is None:
+            return None
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f'--{name} must be a date in YYYY-MM-DD format.')
+        return day
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+        start = self.parse_day(options['start'], 'from')
+        end = self.parse_day(options['end'], 'to')
+
+        lower, _ = local_day_bounds(start, end)
+        employee_ids = list(Employee.objects.order_by('id').values_list('id', flat=True))
+        written = 0
+        for offset in range(0, len(employee_ids), batch_size):
+            batch = employee_ids[offset:offset + batch_size]
+            with transaction.atomic():
+                started = timezone.now()
+                logs = filter_datetime_range(attendance_history(lower).filter(employee_id__in=batch), 'clock_in_time', start, end)
+                keys = AttendanceDailySummary.objects.upsert(AttendanceDailySummary.objects.aggregate_sessions(logs))
+
+                # Every summary that still has sessions was just touched; older rows are stale
+                stale = AttendanceDailySummary.objects.filter(employee_id__in=batch, updated_at__lt=started)
+                if start:
+                    stale = stale.filter(date__gte=start)
+                if end:
+                    stale = stale.filter(date__lte=end)
+                stale.delete()
+            written += len(keys)
+            self.stdout.write(f'Processed {min(offset + batch_size, len(employee_ids))}/{len(employee_ids)} employees, {written} summaries written.')
+
+        # Summary-backed reports are validated against the attendance version
+        DatasetVersion.objects.bump(Attendance)
+        self.stdout.write(self.style.SUCCESS(f'Attendance summary backfill complete: {written} summaries written.'))
@@ -0,0 +1,36 @@
+import time
+from django.core.management.base import BaseCommand
+from applications.reporting.jobs import recover_stale_jobs, run_pending_jobs
+
+# Run Report Jobs Command
+# -------------------------------------------------------------
+class Command(BaseCommand):
+    """
+    Management command that executes pending `ReportJob`s outside the web workers.
+
+    Jobs are claimed with a conditional update, so several copies of this
+    command (and the in-process pool) can run side by side without running a
+    job twice. Before every pass, Running jobs whose worker stopped renewing
+    its lease are re-queued, or failed after `REPORTING_JOB_MAX_ATTEMPTS`.
+
+    Example:
+        python manage.py run_report_jobs --poll-interval 5
+        python manage.py run_report_jobs --once
+    """
+    help = 'Execute pending background report jobs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit.')
+        parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds to sleep when the queue is empty.')
+
+    def handle(self, *args, **options):
+        while True:
+            requeued, failed = recover_stale_jobs()
+            if requeued or failed:
+                self.stdout.write(f'Recovered stale report jobs: {requeued} re-queued, {failed} failed.')
+            executed = run_pending_jobs()
+            if executed:
+                self.stdout.write(f'Executed {executed} report job(s).')
+            if options['once']:
+                break
+            time.sleep(options['poll_interval'])
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('onboarding', '0003_userdevice'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('session_count', models.PositiveIntegerField(default=0)),
+                ('worked_seconds', models.BigIntegerField(default=0)),
+                ('first_clock_in', models.DateTimeField()),
+                ('last_clock_out', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_summaries', to='onboarding.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date'], name='attendance_summary_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('employee', 'date'), name='unique_attendance_summary_per_day')],
+            },
+        ),
+    ]
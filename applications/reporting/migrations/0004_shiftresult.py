@@ -0,0 +1,39 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0008_shifts'),
+        ('onboarding', '0004_query_indexes'),
+        ('reporting', '0003_datasetversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShiftResult',
+            fields=[
+                ('assignment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='result', serialize=False, to='attendance.shiftassignment')),
+                ('date', models.DateField()),
+                ('scheduled_start', models.DateTimeField()),
+                ('scheduled_end', models.DateTimeField()),
+                ('first_clock_in', models.DateTimeField(blank=True, null=True)),
+                ('last_clock_out', models.DateTimeField(blank=True, null=True)),
+                ('sessions', models.PositiveIntegerField(default=0)),
+                ('worked_seconds', models.FloatField(default=0)),
+                ('late_seconds', models.FloatField(default=0)),
+                ('early_leave_seconds', models.FloatField(default=0)),
+                ('overtime_seconds', models.FloatField(default=0)),
+                ('status', models.CharField(choices=[('Present', 'Present'), ('Open', 'Open'), ('Absent', 'Absent')], max_length=10)),
+                ('final', models.BooleanField(default=False)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='shift_results', to='onboarding.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'date'], name='shift_result_employee_idx'), models.Index(fields=['date', 'employee'], name='shift_result_date_idx')],
+            },
+        ),
+    ]
@@ -1,3 +1,647 @@
-from django.db import models
+from datetime import timedelta
+from itertools import chain
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from applications.onboarding.models import Employee
+from applications.attendance.archive import MergedQuerySet, attendance_history
+from applications.attendance.models import Attendance, Shift, ShiftAssignment
+from applications.attendance.signals import attendance_bulk_saved
+from applications.leave_management.models import LeaveRequest, PublicHoliday
+from applications.leave_management.signals import leave_bulk_decided
+from core.filters import local_day_bounds
+from .shifts import compute_shift_results
 
-# Create your models here.
+# Attendance Daily Summary Manager
+# ----------------------------------
+class AttendanceDailySummaryManager(models.Manager):
+    """
+    Manager that rebuilds `AttendanceDailySummary` rows from raw attendance logs.
+
+    Methods:
+        summary_key(employee_id, clock_in_time):
+            Return the `(employee_id, local date)` key a session is summarised under.
+        aggregate_sessions(queryset):
+            Group attendance logs by employee and local day in a single query.
+        upsert(rows):
+            Write aggregated rows back in a single statement.
+        refresh(keys):
+            Recompute the summaries for the given keys.
+    """
+    @staticmethod
+    def summary_key(employee_id, clock_in_time):
+        return employee_id, timezone.localtime(clock_in_time).date()
+
+    @classmethod
+    def aggregate_sessions(cls, queryset):
+        """
+        Group attendance logs by employee and local clock-in day.
+
+        Args:
+            queryset (QuerySet): The `Attendance` rows to aggregate, or an
+                                 `attendance_history()` spanning the hot and
+                                 archive tables, whose groups are combined.
+
+        Returns:
+            iterable: Dicts with `employee_id`, `day`, `session_count`,
+                      `worked` (seconds of the closed sessions), `first_clock_in`
+                      and `last_clock_out`.
+        """
+        if isinstance(queryset, MergedQuerySet):
+            if len(queryset.querysets) == 1:
+                return cls.aggregate_sessions(queryset.querysets[0])
+            return cls.combine_aggregates(chain.from_iterable(cls.aggregate_sessions(part) for part in queryset.querysets))
+        return (
+            queryset
+            .annotate(day=TruncDate('clock_in_time', tzinfo=timezone.get_current_timezone()))
+            .values('employee_id', 'day')
+            .annotate(
+                session_count=Count('id'),
+                worked=Sum('duration_seconds'),
+                first_clock_in=Min('clock_in_time'),
+                last_clock_out=Max('clock_out_time'),
+            )
+            .order_by()
+        )
+
+    @staticmethod
+    def combine_aggregates(rows):
+        """
+        Merge `aggregate_sessions` rows that share an `(employee_id, day)` key.
+        """
+        combined = {}
+        for row in rows:
+            key = (row['employee_id'], row['day'])
+            if key not in combined:
+                combined[key] = dict(row)
+                continue
+            total = combined[key]
+            total['session_count'] += row['session_count']
+            total['worked'] = (total['worked'] or 0) + (row['worked'] or 0)
+            total['first_clock_in'] = min(total['first_clock_in'], row['first_clock_in'])
+            total['last_clock_out'] = max(filter(None, (total['last_clock_out'], row['last_clock_out'])), default=None)
+        return list(combined.values())
+
+    def upsert(self, rows):
+        """
+        Insert or update summaries from `aggregate_sessions` rows in one statement.
+
+        Args:
+            rows (iterable): Aggregated rows as returned by `aggregate_sessions`.
+
+        Returns:
+            list: The `(employee_id, date)` keys that were written.
+        """
+        summaries = [
+            self.model(
+                employee_id=row['employee_id'],
+                date=row['day'],
+                session_count=row['session_count'],
+                worked_seconds=int(row['worked'] or 0),
+                first_clock_in=row['first_clock_in'],
+                last_clock_out=row['last_clock_out'],
+            ) for row in rows
+        ]
+        self.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=['employee', 'date'],
+            update_fields=['session_count', 'worked_seconds', 'first_clock_in', 'last_clock_out', 'updated_at'],
+        )
+        return [(summary.employee_id, summary.date) for summary in summaries]
+
+    def refresh(self, keys):
+        """
+        Recompute the summaries for a set of `(employee_id, date)` keys.
+
+        The affected days are re-aggregated from the raw logs in one grouped
+        query (one per table when archived days are involved) and written back
+        in one upsert; days that no longer have any sessions are deleted.
+
+        Args:
+            keys (iterable): `(employee_id, date)` pairs to refresh.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+        lower, upper = local_day_bounds(min(day for _, day in keys), max(day for _, day in keys))
+        queryset = attendance_history(lower).filter(
+            employee_id__in={employee_id for employee_id, _ in keys},
+            clock_in_time__gte=lower,
+            clock_in_time__lt=upper,
+        )
+        rows = [row for row in self.aggregate_sessions(queryset) if (row['employee_id'], row['day']) in keys]
+        stale = keys - set(self.upsert(rows))
+        if stale:
+            condition = Q()
+            for employee_id, day in stale:
+                condition |= Q(employee_id=employee_id, date=day)
+            self.filter(condition).delete()
+
+# Attendance Daily Summary Model
+# ----------------------------------
+class AttendanceDailySummary(models.Model):
+    """
+    Per-employee, per-day rollup of attendance sessions.
+
+    One row summarises every session an employee clocked in on a given local
+    day (in the project `TIME_ZONE`). Rows are maintained incrementally from
+    `Attendance` signals and can be rebuilt with the
+    `backfill_attendance_summary` management command, so reports over months
+    or years read thousands of summary rows instead of millions of raw logs.
+
+    Attributes:
+        employee (ForeignKey): The employee the summary belongs to.
+        date (DateField): The local day of the sessions' clock-in times.
+        session_count (PositiveIntegerField): Number of sessions started that day.
+        worked_seconds (BigIntegerField): Total duration of the closed sessions, in seconds.
+        first_clock_in (DateTimeField): Earliest clock-in time of the day.
+        last_clock_out (DateTimeField, optional): Latest clock-out time of the day's closed sessions.
+        updated_at (DateTimeField): Timestamp of the last refresh.
+
+    Methods:
+        __str__(): Returns a string representation of the summary, including
+                   the employee's name and the day.
+    """
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='daily_summaries')
+    date = models.DateField()
+    session_count = models.PositiveIntegerField(default=0)
+    worked_seconds = models.BigIntegerField(default=0)
+    first_clock_in = models.DateTimeField()
+    last_clock_out = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = AttendanceDailySummaryManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['employee', 'date'], name='unique_attendance_summary_per_day'),
+        ]
+        indexes = [
+            models.Index(fields=['date'], name='attendance_summary_date_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.employee.full_name} - {self.date}'
+
+
+# Shift Result Manager
+# ----------------------------------
+class ShiftResultManager(models.Manager):
+    """
+    Manager that computes, stores and invalidates shift results.
+
+    Methods:
+        refresh_range(start, end, force=False):
+            Compute the results that are missing or not final in a date range.
+        invalidate(employee_ids, first_day, last_day):
+            Drop the stored results a change of attendance may affect.
+    """
+    def refresh_range(self, start, end, force=False):
+        """
+        Compute and store the results of every assignment from `start` to `end`.
+
+        Only assignments without a final result are computed, all together in
+        one batch; stored final results are reused. Results of shifts that have
+        not ended yet are stored as not final and recomputed on the next call.
+
+        Args:
+            start (date): First assignment day.
+            end (date): Last assignment day.
+            force (bool): Recompute final results as well.
+
+        Returns:
+            int: The number of results computed.
+        """
+        assignments = ShiftAssignment.objects.filter(date__gte=start, date__lte=end)
+        if not force:
+            assignments = assignments.filter(Q(result__isnull=True) | Q(result__final=False))
+        rows = compute_shift_results(
+            list(assignments.values_list('id', 'employee_id', 'date', 'shift_id')),
+            settings.REPORTING_SHIFT_EARLY_MINUTES * 60,
+            timezone.now(),
+        )
+        if rows:
+            self.bulk_create(
+                [self.model(**row) for row in rows],
+                update_conflicts=True,
+                unique_fields=['assignment'],
+                update_fields=[field.name for field in self.model._meta.concrete_fields if not field.primary_key],
+            )
+        return len(rows)
+
+    def invalidate(self, employee_ids, first_day, last_day):
+        """
+        Delete the results of the given employees whose assignment day lies within
+        one day of the range, since shifts may cross midnight.
+        """
+        self.filter(employee_id__in=employee_ids, date__gte=first_day - timedelta(days=1), date__lte=last_day + timedelta(days=1)).delete()
+
+# Shift Result Model
+# ----------------------------------
+class ShiftResult(models.Model):
+    """
+    Stored outcome of one shift assignment: when the employee actually worked
+    compared with the schedule.
+
+    Results are computed in batches by `ShiftResult.objects.refresh_range` and
+    dropped by signals whenever the attendance, assignment or shift they were
+    computed from changes, so reads of past periods are a single query.
+
+    Attributes:
+        assignment (OneToOneField): The shift assignment, also the primary key.
+        employee (ForeignKey): The employee, copied from the assignment.
+        date (DateField): The assignment day, copied from the assignment.
+        scheduled_start (DateTimeField): When the shift was scheduled to start.
+        scheduled_end (DateTimeField): When the shift was scheduled to end.
+        first_clock_in (DateTimeField, optional): Earliest matched clock-in.
+        last_clock_out (DateTimeField, optional): Latest matched clock-out.
+        sessions (PositiveIntegerField): Number of matched attendance sessions.
+        worked_seconds (FloatField): Total length of the matched closed sessions.
+        late_seconds (FloatField): Time between the scheduled start and the first
+                                   clock-in, when it is past the grace period.
+        early_leave_seconds (FloatField): Time between the last clock-out and the scheduled end.
+        overtime_seconds (FloatField): Time worked beyond the scheduled length.
+        status (CharField): 'Present', 'Open' (a session is still open) or 'Absent'.
+        final (BooleanField): Whether the shift had ended when the result was computed.
+        computed_at (DateTimeField): Timestamp of the computation.
+
+    Methods:
+        __str__(): Returns the employee, day and status.
+    """
+    STATUS_CHOICES = [
+        ('Present', 'Present'),
+        ('Open', 'Open'),
+        ('Absent', 'Absent'),
+    ]
+    assignment = models.OneToOneField(ShiftAssignment, on_delete=models.CASCADE, primary_key=True, related_name='result')
+    # Covered by the (employee, date) index below
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='shift_results', db_index=False)
+    date = models.DateField()
+    scheduled_start = models.DateTimeField()
+    scheduled_end = models.DateTimeField()
+    first_clock_in = models.DateTimeField(null=True, blank=True)
+    last_clock_out = models.DateTimeField(null=True, blank=True)
+    sessions = models.PositiveIntegerField(default=0)
+    worked_seconds = models.FloatField(default=0)
+    late_seconds = models.FloatField(default=0)
+    early_leave_seconds = models.FloatField(default=0)
+    overtime_seconds = models.FloatField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    final = models.BooleanField(default=False)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    objects = ShiftResultManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'date'], name='shift_result_employee_idx'),
+            models.Index(fields=['date', 'employee'], name='shift_result_date_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.employee.full_name} - {self.date} - {self.status}'
+
+
+# Report Job Model
+# ----------------------------------
+class ReportJob(models.Model):
+    """
+    Represents a report generated in the background instead of inside the request.
+
+    Jobs are created by the submit endpoint, executed by the in-process worker
+    pool or the `run_report_jobs` management command, and their finished
+    artifact is written to file storage for download.
+
+    Attributes:
+        kind (CharField): The report generator to run, one of `KIND_CHOICES`.
+        params (JSONField): Generator parameters, such as a `from`/`to` date range.
+        status (CharField): The job status, with choices:
+            - 'Pending' (default): Waiting for a worker.
+            - 'Running': Being generated.
+            - 'Completed': The artifact is ready for download.
+            - 'Failed': Generation raised an error, see `error`.
+        progress (PositiveSmallIntegerField): Completion percentage, 0 to 100.
+        rows_processed (PositiveIntegerField): Number of rows written so far.
+        total_rows (PositiveIntegerField, optional): Number of rows expected, when known.
+        result (FileField, optional): The generated artifact.
+        error (TextField): The error message of a failed job.
+        requested_by (ForeignKey, optional): The user who submitted the job.
+        created_at (DateTimeField): Timestamp of submission.
+        started_at (DateTimeField, optional): Timestamp a worker picked the job up.
+        heartbeat_at (DateTimeField, optional): Last time the running worker reported
+                                                progress; Running jobs whose heartbeat is
+                                                older than the lease are recovered.
+        attempts (PositiveSmallIntegerField): Number of times a worker claimed the job.
+        finished_at (DateTimeField, optional): Timestamp the job completed or failed.
+
+    Methods:
+        __str__(): Returns a string representation of the job, including its kind and status.
+    """
+    KIND_CHOICES = [
+        ('employees_csv', 'Employees CSV'),
+        ('attendance_csv', 'Attendance CSV'),
+        ('leaves_csv', 'Leaves CSV'),
+        ('attendance_report', 'Attendance Report (NDJSON)'),
+        ('attendance_graph', 'Attendance Frequency Graph'),
+        ('leave_status_graph', 'Leave Status Graph'),
+    ]
+    STATUS_CHOICES = [
+        ('Pending', 'Pending'),
+        ('Running', 'Running'),
+        ('Completed', 'Completed'),
+        ('Failed', 'Failed'),
+    ]
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Pending')
+    progress = models.PositiveSmallIntegerField(default=0)
+    rows_processed = models.PositiveIntegerField(default=0)
+    total_rows = models.PositiveIntegerField(null=True, blank=True)
+    result = models.FileField(upload_to='reports/', null=True, blank=True)
+    error = models.TextField(blank=True)
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='report_jobs')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='report_job_queue_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.kind} - {self.status}'
+
+
+# Dataset Version Manager
+# ----------------------------------
+class PendingVersionBump:
+    """
+    The one version bump queued for the current transaction.
+
+    Every write of the transaction adds its models and registers `run` with
+    `on_commit`; the first call bumps each model once and the others do
+    nothing, so a transaction that saves many rows updates each version row
+    once, and a write whose savepoint rolls back never loses the bump of the
+    writes around it.
+
+    Methods:
+        add(*models):
+            Include the models in the bump.
+        run():
+            Bump the versions, once.
+    """
+    def __init__(self, manager):
+        self.manager = manager
+        self.models = {}
+        self.done = False
+
+    def add(self, *models):
+        self.models.update((model._meta.label_lower, model) for model in models)
+
+    def run(self):
+        if not self.done:
+            self.done = True
+            self.manager.bump(*self.models.values())
+
+class DatasetVersionManager(models.Manager):
+    """
+    Manager for reading and bumping per-table version markers.
+
+    Methods:
+        bump(*models):
+            Increment the version of each model's table.
+        bump_on_commit(*models):
+            Increment the versions once the current transaction commits.
+        state(*models):
+            Return the combined `(etag, last_modified)` of the given tables.
+    """
+    def bump(self, *models):
+        now = timezone.now()
+        # A fixed order, so two writers bumping several tables never wait on each other in a cycle
+        for name in sorted({model._meta.label_lower for model in models}):
+            if not self.filter(name=name).update(version=F('version') + 1, updated_at=now):
+                self.get_or_create(name=name, defaults={'version': 1, 'updated_at': now})
+
+    def bump_on_commit(self, *models):
+        """
+        Increment the versions once the current transaction commits.
+
+        At most one bump is queued per transaction (see `PendingVersionBump`):
+        it is shared by every write of the transaction and bumps each model
+        once, so a bulk write or an import batch costs one `UPDATE` per
+        version row rather than one per row saved. Outside a transaction the
+        bump runs at once.
+
+        The bump runs after the data is committed, in its own statement, and
+        may still fail there (e.g. a lock timeout on the version row). Such an
+        error is logged by Django's `on_commit` and not raised: the write is
+        kept and the request succeeds, and the version catches up with the
+        next bump of the table.
+
+        Args:
+            models (Model): The model classes whose tables changed.
+        """
+        connection = transaction.get_connection(self.db)
+        # Callbacks of rolled-back savepoints are dropped from `run_on_commit`; the latest is usually the bump
+        pending = next((
+            func.__self__ for _, func, _ in reversed(connection.run_on_commit)
+            if isinstance(getattr(func, '__self__', None), PendingVersionBump) and func.__self__.manager is self and not func.__self__.done
+        ), None) or PendingVersionBump(self)
+        pending.add(*models)
+        transaction.on_commit(pending.run, using=self.db, robust=True)
+
+    def state(self, *models):
+        """
+        Return the combined version marker of several tables in one query.
+
+        Args:
+            models (Model): The model classes a response is built from.
+
+        Returns:
+            tuple: `(token, last_modified)` where `token` is a string that
+                   changes whenever any of the tables change, and
+                   `last_modified` is the latest change as a datetime or None.
+        """
+        names = sorted(model._meta.label_lower for model in models)
+        versions = {name: (version, updated_at) for name, version, updated_at in self.filter(name__in=names).values_list('name', 'version', 'updated_at')}
+        token = ';'.join(f'{name}:{versions.get(name, (0, None))[0]}' for name in names)
+        timestamps = [updated_at for _, updated_at in versions.values()]
+        return token, max(timestamps) if timestamps else None
+
+# Dataset Version Model
+# ----------------------------------
+class DatasetVersion(models.Model):
+    """
+    Cheap version marker of a table that reports are built from.
+
+    The version is bumped by signals whenever an `Employee`, `Attendance` or
+    `LeaveRequest` row is saved or deleted, and explicitly by bulk operations
+    that bypass signals. Reporting endpoints compare it with the client's
+    `If-None-Match` / `If-Modified-Since` headers and answer 304 before running
+    any report query.
+
+    Attributes:
+        name (CharField): The model label of the table, e.g. 'attendance.attendance'.
+        version (BigIntegerField): Monotonic counter incremented on every change.
+        updated_at (DateTimeField): Timestamp of the latest change.
+
+    Methods:
+        __str__(): Returns a string representation of the marker, including its version.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    objects = DatasetVersionManager()
+
+    def __str__(self) -> str:
+        return f'{self.name} - v{self.version}'
+
+
+# Attendance Rollup Signals
+# ---------------------------------------
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+@receiver(pre_save, sender=Attendance)
+def remember_summary_key(sender, instance, **kwargs):
+    """
+    Signal to remember which daily summary an existing `Attendance` row belonged to
+    before it is updated, so moving a session to another day refreshes both days.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`Attendance`).
+        instance (Attendance): The attendance log being saved.
+        kwargs (dict): Additional keyword arguments.
+    """
+    instance._previous_summary_key = None
+    if instance.pk:
+        previous = Attendance.objects.filter(pk=instance.pk).values_list('employee_id', 'clock_in_time').first()
+        if previous:
+            instance._previous_summary_key = AttendanceDailySummary.objects.summary_key(*previous)
+
+@receiver(post_save, sender=Attendance)
+def update_summary_on_save(sender, instance, **kwargs):
+    """
+    Signal to refresh the daily summary of a saved `Attendance` row.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`Attendance`).
+        instance (Attendance): The attendance log that was saved.
+        kwargs (dict): Additional keyword arguments.
+    """
+    keys = {AttendanceDailySummary.objects.summary_key(instance.employee_id, instance.clock_in_time)}
+    previous = getattr(instance, '_previous_summary_key', None)
+    if previous:
+        keys.add(previous)
+    AttendanceDailySummary.objects.refresh(keys)
+
+@receiver(post_delete, sender=Attendance)
+def update_summary_on_delete(sender, instance, **kwargs):
+    """
+    Signal to refresh the daily summary of a deleted `Attendance` row.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`Attendance`).
+        instance (Attendance): The attendance log that was deleted.
+        kwargs (dict): Additional keyword arguments.
+    """
+    AttendanceDailySummary.objects.refresh({AttendanceDailySummary.objects.summary_key(instance.employee_id, instance.clock_in_time)})
+
+
+@receiver(attendance_bulk_saved, sender=Attendance)
+def update_summary_on_bulk_save(sender, instances, **kwargs):
+    """
+    Signal to refresh the daily summaries touched by a bulk attendance write
+    with one aggregate query and one upsert, and to bump the attendance version.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`Attendance`).
+        instances (list): The attendance logs that were written.
+        kwargs (dict): Additional keyword arguments.
+    """
+    AttendanceDailySummary.objects.refresh({AttendanceDailySummary.objects.summary_key(log.employee_id, log.clock_in_time) for log in instances})
+    DatasetVersion.objects.bump_on_commit(sender)
+
+
+# Shift Result Signals
+# ---------------------------------------
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def invalidate_shift_results(sender, instance, **kwargs):
+    """
+    Signal to drop the shift results a saved or deleted `Attendance` row may have counted towards.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`Attendance`).
+        instance (Attendance): The attendance log that was saved or deleted.
+        kwargs (dict): Additional keyword arguments.
+    """
+    keys = {AttendanceDailySummary.objects.summary_key(instance.employee_id, instance.clock_in_time)}
+    previous = getattr(instance, '_previous_summary_key', None)
+    if previous:
+        keys.add(previous)
+    for employee_id, day in keys:
+        ShiftResult.objects.invalidate([employee_id], day, day)
+
+@receiver(attendance_bulk_saved, sender=Attendance)
+def invalidate_shift_results_on_bulk_save(sender, instances, **kwargs):
+    """
+    Signal to drop the shift results a bulk attendance write may affect, in one query.
+
+    Args:
+        sender (Model): The model class that triggered the signal (`Attendance`).
+        instances (list): The attendance logs that were written.
+        kwargs (dict): Additional keyword arguments.
+    """
+    keys = {AttendanceDailySummary.objects.summary_key(log.employee_id, log.clock_in_time) for log in instances}
+    if keys:
+        days = [day for _, day in keys]
+        ShiftResult.objects.invalidate({employee_id for employee_id, _ in keys}, min(days), max(days))
+
+@receiver(post_save, sender=ShiftAssignment)
+def invalidate_assignment_result(sender, instance, **kwargs):
+    """
+    Signal to drop the result of a changed shift assignment; deleted ones cascade.
+    """
+    ShiftResult.objects.filter(assignment=instance).delete()
+
+@receiver(post_save, sender=Shift)
+def invalidate_shift_result_schedule(sender, instance, **kwargs):
+    """
+    Signal to drop every result of a shift whose hours or grace period changed.
+    """
+    ShiftResult.objects.filter(assignment__shift=instance).delete()
+
+
+# Dataset Version Signals
+# ---------------------------------------
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+@receiver(post_save, sender=LeaveRequest)
+@receiver(post_delete, sender=LeaveRequest)
+@receiver(leave_bulk_decided, sender=LeaveRequest)
+@receiver(post_save, sender=PublicHoliday)
+@receiver(post_delete, sender=PublicHoliday)
+def bump_dataset_version(sender, **kwargs):
+    """
+    Signal to bump the version marker of a reporting table after any row changes.
+
+    The bump runs once the transaction commits, at most once per table and
+    transaction, so the shared counter row is never locked for the duration
+    of the writer's transaction and a batch of writes takes its lock once.
+
+    Args:
+        sender (Model): The model class that triggered the signal.
+        kwargs (dict): Additional keyword arguments.
+    """
+    DatasetVersion.objects.bump_on_commit(sender)
@@ -0,0 +1,102 @@
+from datetime import timedelta
+from django.urls import reverse
+from rest_framework import serializers
+from drf_spectacular.utils import extend_schema_field
+from core.serialization import ValuesSerializer
+from .models import ReportJob
+
+# Attendance Report Serializers
+# -------------------------------------------------------------
+class AttendanceReportSerializer(serializers.Serializer):
+    employee_name = serializers.CharField()
+    clock_in_time = serializers.DateTimeField()
+    clock_out_time = serializers.DateTimeField(allow_null=True)
+    duration = serializers.CharField()
+    duration_seconds = serializers.FloatField(allow_null=True)
+
+class AttendanceSummaryReportSerializer(serializers.Serializer):
+    employee_id = serializers.CharField(source='employee__employee_id')
+    employee_name = serializers.CharField(source='employee__full_name')
+    date = serializers.DateField()
+    session_count = serializers.IntegerField()
+    worked_seconds = serializers.IntegerField()
+    first_clock_in = serializers.DateTimeField()
+    last_clock_out = serializers.DateTimeField(allow_null=True)
+
+def format_report_duration(duration_seconds):
+    """
+    Render a stored session duration for the attendance report; open sessions read 'Empty'.
+    """
+    return str(timedelta(seconds=duration_seconds)) if duration_seconds is not None else 'Empty'
+
+# Read paths of the attendance reports; rows are our own data and never re-validated
+ATTENDANCE_REPORT_VALUES = ValuesSerializer(
+    AttendanceReportSerializer,
+    sources={'employee_name': 'employee__full_name'},
+    computed={'duration': (('duration_seconds',), format_report_duration)},
+)
+ATTENDANCE_SUMMARY_VALUES = ValuesSerializer(AttendanceSummaryReportSerializer)
+
+# Shift Report Serializer
+# -------------------------------------------------------------
+class ShiftReportSerializer(serializers.Serializer):
+    employee_id = serializers.CharField(source='employee__employee_id')
+    employee_name = serializers.CharField(source='employee__full_name')
+    shift = serializers.CharField(source='assignment__shift__name')
+    date = serializers.DateField()
+    scheduled_start = serializers.DateTimeField()
+    scheduled_end = serializers.DateTimeField()
+    first_clock_in = serializers.DateTimeField(allow_null=True)
+    last_clock_out = serializers.DateTimeField(allow_null=True)
+    sessions = serializers.IntegerField()
+    worked_seconds = serializers.FloatField()
+    late_seconds = serializers.FloatField()
+    early_leave_seconds = serializers.FloatField()
+    overtime_seconds = serializers.FloatField()
+    status = serializers.CharField()
+
+SHIFT_REPORT_VALUES = ValuesSerializer(ShiftReportSerializer)
+
+# Report Job Serializer
+# -------------------------------------------------------------
+class ReportJobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the ReportJob model.
+
+    Clients only choose the report `kind` and its `params`; everything else is
+    maintained by the worker. Supported params are `from` and `to` (YYYY-MM-DD)
+    for attendance reports and `top` for the attendance graph.
+
+    Meta:
+        model (ReportJob): The model being serialized.
+        fields (list): The job id, request, status and progress fields.
+        read_only_fields (list): Fields maintained by the worker.
+    """
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            'id', 'kind', 'params', 'status', 'progress', 'rows_processed', 'total_rows',
+            'error', 'created_at', 'started_at', 'finished_at', 'download_url',
+        ]
+        read_only_fields = [
+            'status', 'progress', 'rows_processed', 'total_rows', 'error', 'created_at', 'started_at', 'finished_at',
+        ]
+
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_download_url(self, obj):
+        if obj.status != 'Completed':
+            return None
+        return reverse('report-job-download', kwargs={'pk': obj.pk})
+
+    def validate_params(self, params):
+        if not isinstance(params, dict):
+            raise serializers.ValidationError('Params must be an object.')
+        start = serializers.DateField(allow_null=True).run_validation(params.get('from'))
+        end = serializers.DateField(allow_null=True).run_validation(params.get('to'))
+        if start and end and start > end:
+            raise serializers.ValidationError("'to' must not be before 'from'.")
+        if params.get('top') is not None:
+            serializers.IntegerField(min_value=1).run_validation(params['top'])
+        return params
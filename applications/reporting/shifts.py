@@ -0,0 +1,151 @@
+from datetime import datetime, timezone as dt_timezone
+import numpy as np
+from applications.attendance.archive import attendance_history
+from applications.attendance.models import Shift
+
+# Employees above which sessions are loaded for the whole workforce in the range
+EMPLOYEE_FILTER_LIMIT = 1000
+
+# Shift Matching
+# -------------------------------------------------------------
+def shift_metrics(assignments, sessions, early_seconds):
+    """
+    Match attendance sessions to shift assignments and compute their metrics.
+
+    A session belongs to an assignment of the same employee when it clocked
+    in between `early_seconds` before the scheduled start and the scheduled
+    end. Sessions are sorted once by `(employee, clock-in)` and encoded as a
+    single sortable key, so the sessions of every assignment form one
+    contiguous slice found with `np.searchsorted`. Totals come from prefix
+    sums and the last clock-out from one `np.fmax.reduceat`; no Python loop
+    runs per employee or per assignment.
+
+    Args:
+        assignments (dict): Arrays `employee`, `start`, `end` and `grace`, one
+                            entry per assignment; times are Unix seconds.
+        sessions (dict): Arrays `employee`, `clock_in` and `clock_out` (NaN
+                         while open), one entry per session.
+        early_seconds (float): How long before the start a clock-in still counts.
+
+    Returns:
+        dict: Arrays `sessions`, `open`, `first_clock_in`, `last_clock_out`
+              (NaN when unknown), `worked`, `late`, `early_leave` and
+              `overtime`, aligned with `assignments`; durations are seconds.
+    """
+    count = len(assignments['employee'])
+    origin = assignments['start'].min() - early_seconds
+    span = assignments['end'].max() - origin + 1
+
+    # Keys only sort correctly for clock-ins inside [origin, origin + span)
+    inside = (sessions['clock_in'] >= origin) & (sessions['clock_in'] < assignments['end'].max())
+    employees, clock_in, clock_out = sessions['employee'][inside], sessions['clock_in'][inside], sessions['clock_out'][inside]
+    order = np.lexsort((clock_in, employees))
+    employees, clock_in, clock_out = employees[order], clock_in[order], clock_out[order]
+    keys = employees * span + (clock_in - origin)
+    lower = np.searchsorted(keys, assignments['employee'] * span + (assignments['start'] - early_seconds - origin), side='left')
+    upper = np.searchsorted(keys, assignments['employee'] * span + (assignments['end'] - origin), side='left')
+    matched = upper - lower
+    present = matched > 0
+
+    is_open = np.isnan(clock_out)
+    worked = np.concatenate(([0.0], np.cumsum(np.where(is_open, 0.0, clock_out - clock_in))))
+    opened = np.concatenate(([0], np.cumsum(is_open)))
+
+    # A trailing NaN lets empty slices at the very end index a valid element
+    padded_in = np.append(clock_in, np.nan)
+    padded_out = np.append(clock_out, np.nan)
+    if count:
+        last_out = np.fmax.reduceat(padded_out, np.column_stack((lower, upper)).ravel())[::2]
+    else:
+        last_out = np.empty(0)
+
+    first_in = np.where(present, padded_in[lower], np.nan)
+    last_out = np.where(present, last_out, np.nan)
+    worked = worked[upper] - worked[lower]
+    opened = opened[upper] - opened[lower]
+    closed = present & (opened == 0)
+    scheduled = assignments['end'] - assignments['start']
+
+    late = np.where(present & (first_in > assignments['start'] + assignments['grace']), first_in - assignments['start'], 0.0)
+    early_leave = np.where(closed, np.maximum(assignments['end'] - np.nan_to_num(last_out), 0.0), 0.0)
+    return {
+        'sessions': matched,
+        'open': opened,
+        'first_clock_in': first_in,
+        'last_clock_out': last_out,
+        'worked': worked,
+        'late': late,
+        'early_leave': early_leave,
+        'overtime': np.maximum(worked - scheduled, 0.0),
+    }
+
+# Shift Results
+# -------------------------------------------------------------
+def to_datetime(seconds):
+    return None if np.isnan(seconds) else datetime.fromtimestamp(seconds, tz=dt_timezone.utc)
+
+def compute_shift_results(assignments, early_seconds, now):
+    """
+    Compute the results of a batch of shift assignments.
+
+    Runs two queries whatever the batch size: the shifts involved and the
+    attendance sessions (archived ones included) that clocked in during the
+    covered period.
+
+    Args:
+        assignments (list): `(assignment_id, employee_id, date, shift_id)` tuples.
+        early_seconds (float): How long before the start a clock-in still counts.
+        now (datetime): Results of shifts that ended before this are marked final.
+
+    Returns:
+        list: One dict of `ShiftResult` field values per assignment.
+    """
+    if not assignments:
+        return []
+    shifts = Shift.objects.in_bulk({shift_id for _, _, _, shift_id in assignments})
+    windows = {(day, shift_id): shifts[shift_id].window(day) for _, _, day, shift_id in assignments}
+    scheduled = [windows[day, shift_id] for _, _, day, shift_id in assignments]
+
+    frame = {
+        'employee': np.array([employee_id for _, employee_id, _, _ in assignments], dtype=np.float64),
+        'start': np.array([start.timestamp() for start, _ in scheduled], dtype=np.float64),
+        'end': np.array([end.timestamp() for _, end in scheduled], dtype=np.float64),
+        'grace': np.array([shifts[shift_id].grace_minutes * 60 for _, _, _, shift_id in assignments], dtype=np.float64),
+    }
+
+    lower = datetime.fromtimestamp(frame['start'].min() - early_seconds, tz=dt_timezone.utc)
+    upper = datetime.fromtimestamp(frame['end'].max(), tz=dt_timezone.utc)
+    logs = attendance_history(lower).filter(clock_in_time__gte=lower, clock_in_time__lt=upper)
+    employees = {employee_id for _, employee_id, _, _ in assignments}
+    if len(employees) <= EMPLOYEE_FILTER_LIMIT:
+        logs = logs.filter(employee_id__in=employees)
+    rows = list(logs.values_list('employee_id', 'clock_in_time', 'clock_out_time'))
+    sessions = {
+        'employee': np.fromiter((row[0] for row in rows), dtype=np.float64, count=len(rows)),
+        'clock_in': np.fromiter((row[1].timestamp() for row in rows), dtype=np.float64, count=len(rows)),
+        'clock_out': np.fromiter((row[2].timestamp() if row[2] else np.nan for row in rows), dtype=np.float64, count=len(rows)),
+    }
+    metrics = shift_metrics(frame, sessions, early_seconds)
+
+    columns = {key: values.tolist() for key, values in metrics.items()}
+    results = []
+    for index, (assignment_id, employee_id, day, _) in enumerate(assignments):
+        start, end = scheduled[index]
+        status = 'Absent' if not columns['sessions'][index] else 'Open' if columns['open'][index] else 'Present'
+        results.append({
+            'assignment_id': assignment_id,
+            'employee_id': employee_id,
+            'date': day,
+            'scheduled_start': start,
+            'scheduled_end': end,
+            'first_clock_in': to_datetime(columns['first_clock_in'][index]),
+            'last_clock_out': to_datetime(columns['last_clock_out'][index]),
+            'sessions': columns['sessions'][index],
+            'worked_seconds': columns['worked'][index],
+            'late_seconds': columns['late'][index],
+            'early_leave_seconds': columns['early_leave'][index],
+            'overtime_seconds': columns['overtime'][index],
+            'status': status,
+            'final': end <= now,
+        })
+    return results
@@ -0,0 +1,100 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from .serializers import ATTENDANCE_REPORT_VALUES
+
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+}
+
+# JSON Streaming Helpers
+# -------------------------------------------------------------
+def iter_json_chunks(rows, stream_format, batch_size, progress=None):
+    """
+    Encode an iterable of dicts as NDJSON lines or as a single JSON array.
+
+    Rows are grouped into batches of `batch_size` before being yielded so the
+    server writes a few large chunks instead of one tiny chunk per row.
+
+    Args:
+        rows (iterable): Iterable of JSON-ready dicts.
+        stream_format (str): Either 'ndjson' or 'json'.
+        batch_size (int): Number of rows encoded per yielded chunk.
+        progress (callable, optional): Called with the number of rows encoded
+                                       so far after each batch.
+
+    Yields:
+        str: Encoded chunks of the response body.
+    """
+    encode = DjangoJSONEncoder(separators=(',', ':')).encode
+    separator = '\n' if stream_format == 'ndjson' else ','
+    batch = []
+    written = 0
+    first = True
+    if stream_format == 'json':
+        yield '['
+    for row in rows:
+        batch.append(encode(row))
+        if len(batch) >= batch_size:
+            written += len(batch)
+            yield ('' if first else separator) + separator.join(batch)
+            first = False
+            batch = []
+            if progress:
+                progress(written)
+    if batch:
+        written += len(batch)
+        yield ('' if first else separator) + separator.join(batch)
+        first = False
+        if progress:
+            progress(written)
+    if stream_format == 'json':
+        yield ']'
+    elif not first:
+        yield '\n'
+
+def streaming_json_response(rows, stream_format, batch_size, headers=None):
+    """
+    Build a `StreamingHttpResponse` that encodes `rows` lazily.
+
+    Args:
+        rows (iterable): Iterable of JSON-ready dicts, typically backed by
+                         `QuerySet.iterator()`.
+        stream_format (str): Either 'ndjson' or 'json'.
+        batch_size (int): Number of rows encoded per chunk.
+        headers (dict, optional): Extra response headers.
+
+    Returns:
+        StreamingHttpResponse: The streaming response.
+
+    Raises:
+        ValidationError: If `stream_format` is not supported.
+    """
+    if stream_format not in STREAM_FORMATS:
+        raise ValidationError({'stream': f"Unsupported stream format. Use one of: {', '.join(STREAM_FORMATS)}."})
+    return StreamingHttpResponse(
+        iter_json_chunks(rows, stream_format, batch_size),
+        content_type=STREAM_FORMATS[stream_format],
+        headers=headers,
+    )
+
+# Attendance Report Rows
+# -------------------------------------------------------------
+def attendance_report_rows(queryset, chunk_size):
+    """
+    Lazily produce attendance report rows from an `Attendance` queryset.
+
+    Rows are fetched with a single employee join through `values_list(...).iterator()`
+    and rendered by `ATTENDANCE_REPORT_VALUES`; they are our own data, so they
+    are never re-validated.
+
+    Args:
+        queryset (QuerySet): An ordered `Attendance` queryset.
+        chunk_size (int): Rows fetched per database round trip.
+
+    Yields:
+        dict: JSON-ready rows matching `AttendanceReportSerializer`.
+    """
+    logs = queryset.values_list(*ATTENDANCE_REPORT_VALUES.columns)
+    return ATTENDANCE_REPORT_VALUES.rows(logs.iterator(chunk_size=chunk_size))
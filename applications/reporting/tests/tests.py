@@ -1,3 +1,510 @@
-from django.test import TestCase
+import gzip
+from pathlib import Path
+from io import StringIO
+import json
+import numpy as np
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from applications.attendance.models import Attendance, Shift, ShiftAssignment
+from applications.leave_management.models import LeaveRequest
+from applications.reporting.aggregations import attendance_frequency, frequency_labels
+from applications.reporting.analytics import load_sessions, working_time_stats
+from applications.reporting.charts import ChartService, ChartUnavailable
+from applications.reporting.jobs import GENERATORS, run_job
+from applications.reporting.models import AttendanceDailySummary, DatasetVersion, ReportJob, ShiftResult
+from applications.reporting.shifts import shift_metrics
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.db.models.fields.files import FieldFile
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone as django_timezone
 
-# Create your tests here.
+# Fixtures
+# ------------------------------
+@pytest.fixture
+def client(authenticated_client):
+    return authenticated_client('reporter', 'Manager')
+
+def create_sessions(employee, count, start=datetime(2024, 11, 26, 9, 0, tzinfo=timezone.utc)):
+    return [
+        Attendance.objects.create(
+            employee=employee,
+            clock_in_time=start + timedelta(days=day),
+            clock_out_time=start + timedelta(days=day, hours=8),
+        ) for day in range(count)
+    ]
+
+def read_stream(response):
+    return b''.join(response.streaming_content).decode()
+
+# Attendance Report Streaming Test
+# ------------------------------
+@pytest.mark.django_db
+def test_attendance_report_streams_ndjson(client, create_employee):
+    create_sessions(create_employee(), 3)
+
+    response = client.get('/api/reporting/attendance/', {'stream': 'ndjson'})
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in read_stream(response).splitlines()]
+    assert len(rows) == 3
+    assert rows[0]['employee_name'] == 'Tester test'
+    assert rows[0]['duration'] == '8:00:00'
+
+    # The streamed rows match the buffered report exactly
+    assert rows == client.get('/api/reporting/attendance/').json()
+
+@pytest.mark.django_db
+def test_attendance_report_stream_keyset_pages(client, create_employee):
+    create_sessions(create_employee(), 5)
+
+    first = client.get('/api/reporting/attendance/', {'stream': 'json', 'limit': 2})
+    first_rows = json.loads(read_stream(first))
+    assert len(first_rows) == 2
+
+    second = client.get('/api/reporting/attendance/', {'stream': 'json', 'limit': 2, 'cursor': first['X-Next-Cursor']})
+    third = client.get('/api/reporting/attendance/', {'stream': 'json', 'limit': 2, 'cursor': second['X-Next-Cursor']})
+    second_rows, third_rows = json.loads(read_stream(second)), json.loads(read_stream(third))
+    assert len(second_rows) == 2 and len(third_rows) == 1
+    assert 'X-Next-Cursor' not in third
+    assert first_rows[-1]['clock_in_time'] < second_rows[0]['clock_in_time']
+
+@pytest.mark.django_db
+def test_attendance_report_stream_rejects_bad_cursor(client):
+    response = client.get('/api/reporting/attendance/', {'stream': 'ndjson', 'cursor': 'not-a-cursor'})
+    assert response.status_code == 400
+
+# Streaming CSV Export Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_export_attendance_csv_streams(client, create_employee):
+    create_sessions(create_employee(), 2)
+
+    response = client.get('/api/reporting/export/attendance/')
+    assert response.status_code == 200
+    assert response.streaming
+    lines = read_stream(response).splitlines()
+    assert lines[0] == 'Employee ID,Full Name,Clock In Time,Clock Out Time'
+    assert lines[1] == 'E1000,Tester test,2024-11-26T12:00:00+03:00,2024-11-26T20:00:00+03:00'
+    assert len(lines) == 3
+
+@pytest.mark.django_db
+def test_export_leaves_csv_gzip(client, create_employee):
+    employee = create_employee()
+    LeaveRequest.objects.create(employee=employee, start_date='2024-12-01', end_date='2024-12-05', reason='Vacation')
+
+    response = client.get('/api/reporting/export/leaves/', {'compress': 'gzip'})
+    assert response['Content-Type'] == 'application/gzip'
+    assert response['Content-Disposition'] == 'attachment; filename="leaves.csv.gz"'
+    lines = gzip.decompress(b''.join(response.streaming_content)).decode().splitlines()
+    assert lines[0].startswith('Employee ID,Full Name,Start Date,End Date,Reason,Status')
+    assert lines[1].startswith('E1000,Tester test,2024-12-01,2024-12-05,Vacation,Pending,')
+    # Sunday to Thursday: four working days
+    assert lines[0].endswith(',Working Days') and lines[1].endswith(',4')
+
+@pytest.mark.django_db
+def test_export_employees_csv_empty_is_404(client):
+    assert client.get('/api/reporting/export/employees/').status_code == 404
+
+# Attendance Frequency Aggregation Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_attendance_frequency_single_query(django_assert_num_queries, create_employee):
+    create_sessions(create_employee(0, 'Same Name'), 3)
+    create_sessions(create_employee(1, 'Same Name'), 2)
+    create_sessions(create_employee(2, 'Other Name'), 1)
+
+    with django_assert_num_queries(1):
+        rows = attendance_frequency()
+    assert [row['count'] for row in rows] == [3, 2, 1]
+    assert frequency_labels(rows) == ['Same Name (E1000)', 'Same Name (E1001)', 'Other Name']
+
+    assert len(attendance_frequency(top=2)) == 2
+    rows = attendance_frequency(start=date(2024, 11, 27), end=date(2024, 11, 27))
+    assert [row['count'] for row in rows] == [1, 1]
+
+@pytest.mark.django_db
+def test_attendance_graph_filters(client, create_employee):
+    create_sessions(create_employee(), 2)
+
+    response = client.get('/api/reporting/graphs/attendance/', {'from': '2024-11-26', 'top': 5})
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'image/png'
+    assert client.get('/api/reporting/graphs/attendance/', {'from': '2025-01-01'}).status_code == 404
+    assert client.get('/api/reporting/graphs/attendance/', {'from': '2024-12-02', 'to': '2024-12-01'}).status_code == 400
+
+# Chart Service Tests
+# ------------------------------
+def test_chart_service_caches_by_series(monkeypatch):
+    service = ChartService(max_workers=0, cache_size=2)
+    calls = []
+    monkeypatch.setattr('applications.reporting.charts.render', lambda kind, spec: calls.append(spec) or b'png')
+
+    assert service.render('pie', labels=['A'], values=[1], title='T') == b'png'
+    service.render('pie', labels=['A'], values=[1], title='T')
+    assert len(calls) == 1
+
+    # Least recently used entries are evicted
+    service.render('pie', labels=['B'], values=[1], title='T')
+    service.render('pie', labels=['C'], values=[1], title='T')
+    service.render('pie', labels=['A'], values=[1], title='T')
+    assert len(calls) == 4
+    assert len(service.cache) == 2
+
+def test_chart_service_renders_in_worker_process():
+    service = ChartService(max_workers=1, cache_size=4, timeout=60)
+    try:
+        png = service.render('bar', labels=['A', 'B'], values=[2, 3], title='T', xlabel='X', ylabel='Y')
+    finally:
+        service.shutdown()
+    assert png.startswith(b'\x89PNG')
+
+def test_chart_service_replaces_a_pool_with_a_killed_worker():
+    service = ChartService(max_workers=1, cache_size=4, timeout=60)
+    try:
+        service.render('bar', labels=['A'], values=[1], title='T', xlabel='X', ylabel='Y')
+        for process in list(service._pool._processes.values()):
+            process.kill()
+            process.join()
+        png = service.render('bar', labels=['B'], values=[2], title='T', xlabel='X', ylabel='Y')
+    finally:
+        service.shutdown()
+    assert png.startswith(b'\x89PNG')
+
+@pytest.mark.django_db
+def test_graph_returns_503_when_the_chart_is_unavailable(client, monkeypatch, create_employee):
+    employee = create_employee()
+    LeaveRequest.objects.create(employee=employee, start_date='2024-12-01', end_date='2024-12-05', reason='Vacation')
+
+    def timed_out(self, kind, **spec):
+        raise ChartUnavailable('The chart was not rendered within 1 seconds.')
+    monkeypatch.setattr(ChartService, 'render', timed_out)
+    response = client.get('/api/reporting/graphs/leaves/')
+    assert response.status_code == 503
+
+@pytest.mark.django_db
+def test_leave_status_graph(client, create_employee):
+    employee = create_employee()
+    LeaveRequest.objects.create(employee=employee, start_date='2024-12-01', end_date='2024-12-05', reason='Vacation')
+
+    response = client.get('/api/reporting/graphs/leaves/')
+    assert response.status_code == 200
+    assert response.content.startswith(b'\x89PNG')
+
+# Attendance Daily Summary Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_daily_summary_maintained_incrementally(create_employee):
+    employee = create_employee()
+    first, second = create_sessions(employee, 2)
+    # A second session on the first day, 23:30 local time, still open
+    Attendance.objects.create(employee=employee, clock_in_time=datetime(2024, 11, 26, 20, 30, tzinfo=timezone.utc))
+
+    summary = AttendanceDailySummary.objects.get(employee=employee, date=date(2024, 11, 26))
+    assert summary.session_count == 2
+    assert summary.worked_seconds == 8 * 3600
+    assert summary.first_clock_in == first.clock_in_time
+    assert summary.last_clock_out == first.clock_out_time
+
+    # Moving a session to another day refreshes both days
+    second.clock_in_time = datetime(2024, 11, 26, 10, 0, tzinfo=timezone.utc)
+    second.save()
+    assert AttendanceDailySummary.objects.get(employee=employee, date=date(2024, 11, 26)).session_count == 3
+    assert not AttendanceDailySummary.objects.filter(date=date(2024, 11, 27)).exists()
+
+    first.delete()
+    assert AttendanceDailySummary.objects.get(employee=employee, date=date(2024, 11, 26)).session_count == 2
+
+@pytest.mark.django_db
+def test_backfill_attendance_summary_command(create_employee):
+    employee = create_employee()
+    create_sessions(employee, 3)
+    AttendanceDailySummary.objects.all().delete()
+    AttendanceDailySummary.objects.create(employee=employee, date=date(2024, 1, 1), first_clock_in=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    call_command('backfill_attendance_summary', batch_size=1, stdout=StringIO())
+    assert list(AttendanceDailySummary.objects.order_by('date').values_list('date', 'session_count')) == [
+        (date(2024, 11, 26), 1), (date(2024, 11, 27), 1), (date(2024, 11, 28), 1),
+    ]
+
+@pytest.mark.django_db
+def test_attendance_reports_read_from_summary(client, django_assert_num_queries, create_employee):
+    create_sessions(create_employee(), 3)
+
+    response = client.get('/api/reporting/attendance/', {'source': 'summary', 'from': '2024-11-27'})
+    assert response.status_code == 200
+    assert [row['date'] for row in response.json()] == ['2024-11-27', '2024-11-28']
+    assert response.json()[0]['worked_seconds'] == 8 * 3600
+
+    with django_assert_num_queries(1):
+        rows = attendance_frequency(start=date(2024, 11, 27), source='summary')
+    assert rows[0]['count'] == 2
+
+# Report Job Tests
+# ------------------------------
+@pytest.fixture
+def job_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.REPORTING_JOB_WORKERS = 0
+    return settings
+
+@pytest.mark.django_db
+def test_report_job_lifecycle(client, job_settings, create_employee, staff_user):
+    create_sessions(create_employee(), 3)
+
+    response = client.post('/api/reporting/jobs/', {'kind': 'attendance_csv', 'params': {'from': '2024-11-27'}}, format='json')
+    assert response.status_code == 202
+    job_id = response.json()['id']
+    assert response.json()['status'] == 'Pending'
+    assert client.get(f'/api/reporting/jobs/{job_id}/download/').status_code == 409
+
+    call_command('run_report_jobs', once=True, stdout=StringIO())
+
+    job = client.get(f'/api/reporting/jobs/{job_id}/').json()
+    assert job['status'] == 'Completed'
+    assert job['progress'] == 100
+    assert job['rows_processed'] == job['total_rows'] == 2
+    download = client.get(job['download_url'])
+    assert download['Content-Disposition'] == 'attachment; filename="attendance.csv"'
+    assert len(b''.join(download.streaming_content).decode().splitlines()) == 3
+
+    # Jobs are private to the user who submitted them
+    client.force_authenticate(user=staff_user('other'))
+    assert client.get(f'/api/reporting/jobs/{job_id}/').status_code == 404
+    assert client.get(job['download_url']).status_code == 404
+
+@pytest.mark.django_db
+def test_report_job_graph_and_failures(client, job_settings, create_employee):
+    create_sessions(create_employee(), 1)
+    graph = ReportJob.objects.create(kind='attendance_graph')
+    broken = ReportJob.objects.create(kind='unknown')
+
+    call_command('run_report_jobs', once=True, stdout=StringIO())
+    graph.refresh_from_db()
+    broken.refresh_from_db()
+    assert graph.status == 'Completed'
+    assert graph.result.read().startswith(b'\x89PNG')
+    assert broken.status == 'Failed'
+
+    response = client.post('/api/reporting/jobs/', {'kind': 'attendance_report', 'params': {'from': '2024-12-02', 'to': '2024-12-01'}}, format='json')
+    assert response.status_code == 400
+
+@pytest.mark.django_db
+def test_stale_running_jobs_are_recovered(job_settings, monkeypatch):
+    job_settings.REPORTING_JOB_MAX_ATTEMPTS = 2
+    stale = django_timezone.now() - timedelta(seconds=job_settings.REPORTING_JOB_LEASE_SECONDS + 1)
+    retried = ReportJob.objects.create(kind='employees_csv', status='Running', attempts=1, started_at=stale, heartbeat_at=stale)
+    exhausted = ReportJob.objects.create(kind='employees_csv', status='Running', attempts=2, started_at=stale, heartbeat_at=stale)
+    alive = ReportJob.objects.create(kind='employees_csv', status='Running', attempts=1, started_at=stale, heartbeat_at=django_timezone.now())
+
+    output = StringIO()
+    call_command('run_report_jobs', once=True, stdout=output)
+    assert 'Recovered stale report jobs: 1 re-queued, 1 failed.' in output.getvalue()
+    assert ReportJob.objects.get(pk=retried.pk).status == 'Completed'
+    assert ReportJob.objects.get(pk=retried.pk).attempts == 2
+    assert ReportJob.objects.get(pk=exhausted.pk).status == 'Failed'
+    assert ReportJob.objects.get(pk=alive.pk).status == 'Running'
+
+    # A worker whose job was recovered and claimed again stops writing to it
+    def recovered_midway(job, progress):
+        ReportJob.objects.filter(pk=job.pk).update(attempts=F('attempts') + 1)
+        progress(1)
+        return 'never.csv', [], 1
+    monkeypatch.setitem(GENERATORS, 'employees_csv', recovered_midway)
+    job = ReportJob.objects.create(kind='employees_csv')
+    assert run_job(job.pk)
+    job.refresh_from_db()
+    assert (job.status, job.rows_processed, job.error) == ('Running', 0, '')
+
+    # Recovered while the artifact is saved: the stored file is removed again
+    save_artifact = FieldFile.save
+    def recovered_while_saving(self, name, content, save=True):
+        ReportJob.objects.filter(pk=self.instance.pk).update(attempts=F('attempts') + 1)
+        return save_artifact(self, name, content, save)
+    monkeypatch.setitem(GENERATORS, 'employees_csv', lambda job, progress: ('late.csv', ['id\n'], 1))
+    monkeypatch.setattr(FieldFile, 'save', recovered_while_saving)
+    job = ReportJob.objects.create(kind='employees_csv')
+    assert run_job(job.pk)
+    job.refresh_from_db()
+    assert (job.status, bool(job.result)) == ('Running', False)
+    assert not list(Path(job_settings.MEDIA_ROOT).rglob('*late.csv'))
+
+# Working Time Analytics Tests
+# ------------------------------
+def test_working_time_stats_match_numpy():
+    rng = np.random.default_rng(7)
+    employee_ids = rng.integers(1, 20, size=5000)
+    days = rng.integers(738000, 738030, size=5000)
+    durations = rng.uniform(600, 12 * 3600, size=5000)
+
+    stats = working_time_stats(employee_ids, days, durations, overtime_seconds=8 * 3600, short_seconds=1800)
+    for index, pk in enumerate(stats['employee_id']):
+        mine = durations[employee_ids == pk]
+        assert stats['sessions'][index] == len(mine)
+        assert np.isclose(stats['total'][index], mine.sum())
+        assert np.isclose(stats['p50'][index], np.percentile(mine, 50))
+        assert np.isclose(stats['p95'][index], np.percentile(mine, 95))
+        assert stats['short_sessions'][index] == (mine < 1800).sum()
+        daily = [durations[(employee_ids == pk) & (days == day)].sum() for day in np.unique(days[employee_ids == pk])]
+        assert np.isclose(stats['overtime'][index], sum(max(0, total - 8 * 3600) for total in daily))
+
+@pytest.mark.django_db
+def test_working_time_analytics_endpoint(client, create_employee):
+    employee = create_employee()
+    create_sessions(employee, 2)
+    # Two sessions on one local day adding up to 10 hours, one of them short
+    start = datetime(2024, 12, 1, 6, 0, tzinfo=timezone.utc)
+    Attendance.objects.create(employee=employee, clock_in_time=start, clock_out_time=start + timedelta(hours=9, minutes=40))
+    Attendance.objects.create(employee=employee, clock_in_time=start + timedelta(hours=10), clock_out_time=start + timedelta(hours=10, minutes=20))
+
+    response = client.get('/api/reporting/analytics/working-time/', {'from': '2024-11-26', 'short_minutes': 30})
+    assert response.status_code == 200
+    [row] = response.json()
+    assert row['employee_id'] == 'E1000'
+    assert row['sessions'] == 4
+    assert row['total_hours'] == 26.0
+    assert row['p50_hours'] == 8.0
+    assert row['overtime_hours'] == 2.0
+    assert row['short_sessions'] == 1
+    assert client.get('/api/reporting/analytics/working-time/', {'overtime_hours': 'x'}).status_code == 400
+
+@pytest.mark.django_db
+def test_load_sessions_fills_arrays_chunk_by_chunk(create_employee):
+    employee = create_employee()
+    create_sessions(employee, 5)
+    Attendance.objects.create(employee=employee, clock_in_time=datetime(2024, 12, 5, 9, 0, tzinfo=timezone.utc))
+
+    employee_ids, days, durations = load_sessions(date(2024, 11, 26), chunk_size=2)
+    assert employee_ids.tolist() == [employee.pk] * 5
+    assert sorted(days.tolist()) == [date(2024, 11, 26 + day).toordinal() for day in range(5)]
+    assert durations.tolist() == [8 * 3600.0] * 5
+
+# Shift Report Tests
+# ------------------------------
+def test_shift_metrics_match_python_loop():
+    rng = np.random.default_rng(11)
+    starts = np.repeat(np.arange(10) * 86400.0, 5) + 8 * 3600
+    assignments = {'employee': np.tile(np.arange(1.0, 6.0), 10), 'start': starts, 'end': starts + 9 * 3600, 'grace': np.full(50, 300.0)}
+    clock_in = rng.uniform(0, 10 * 86400, size=400)
+    clock_out = clock_in + rng.uniform(600, 6 * 3600, size=400)
+    clock_out[rng.random(400) < 0.05] = np.nan
+    sessions = {'employee': rng.integers(1, 6, size=400).astype(float), 'clock_in': clock_in, 'clock_out': clock_out}
+
+    metrics = shift_metrics(assignments, sessions, early_seconds=2 * 3600)
+    for index in range(50):
+        employee, start, end = assignments['employee'][index], assignments['start'][index], assignments['end'][index]
+        mine = (sessions['employee'] == employee) & (clock_in >= start - 2 * 3600) & (clock_in < end)
+        assert metrics['sessions'][index] == mine.sum()
+        assert metrics['open'][index] == np.isnan(clock_out[mine]).sum()
+        assert np.isclose(metrics['worked'][index], np.nansum(clock_out[mine] - clock_in[mine]))
+        if mine.any():
+            first = clock_in[mine].min()
+            assert metrics['first_clock_in'][index] == first
+            assert np.isclose(metrics['late'][index], first - start if first > start + 300 else 0)
+            if not np.isnan(clock_out[mine]).any():
+                assert np.isclose(metrics['early_leave'][index], max(end - clock_out[mine].max(), 0))
+
+@pytest.mark.django_db
+def test_shift_report_computes_and_stores_results(client, django_assert_num_queries, create_employee):
+    local = lambda *args: django_timezone.make_aware(datetime(*args))
+    day_worker, night_worker = create_employee(0, 'Day Worker'), create_employee(1, 'Night Worker')
+    day = Shift.objects.create(name='Day', start_time='08:00', end_time='17:00', grace_minutes=5)
+    night = Shift.objects.create(name='Night', start_time='22:00', end_time='06:00')
+    ShiftAssignment.objects.create(employee=day_worker, shift=day, date=date(2024, 11, 26))
+    ShiftAssignment.objects.create(employee=day_worker, shift=day, date=date(2024, 11, 27))
+    ShiftAssignment.objects.create(employee=night_worker, shift=night, date=date(2024, 11, 26))
+    Attendance.objects.create(employee=day_worker, clock_in_time=local(2024, 11, 26, 8, 10), clock_out_time=local(2024, 11, 26, 16, 30))
+    Attendance.objects.create(employee=night_worker, clock_in_time=local(2024, 11, 26, 21, 50), clock_out_time=local(2024, 11, 27, 7, 0))
+
+    response = client.get('/api/reporting/shifts/', {'from': '2024-11-26', 'to': '2024-11-27'})
+    assert response.status_code == 200
+    late, night_row, absent = response.json()
+    assert (late['employee_name'], late['shift'], late['status']) == ('Day Worker', 'Day', 'Present')
+    assert (late['late_seconds'], late['early_leave_seconds'], late['overtime_seconds']) == (600, 1800, 0)
+    assert late['scheduled_start'] == '2024-11-26T08:00:00+03:00'
+    assert (night_row['late_seconds'], night_row['early_leave_seconds'], night_row['overtime_seconds']) == (0, 0, 4200)
+    assert (absent['date'], absent['status'], absent['sessions']) == ('2024-11-27', 'Absent', 0)
+    assert ShiftResult.objects.filter(final=True).count() == 3
+
+    # Stored results are reused; a late clock-in drops only the affected results
+    with django_assert_num_queries(2):
+        client.get('/api/reporting/shifts/', {'from': '2024-11-26', 'to': '2024-11-27'})
+    Attendance.objects.create(employee=day_worker, clock_in_time=local(2024, 11, 27, 7, 55), clock_out_time=local(2024, 11, 27, 17, 0))
+    assert ShiftResult.objects.count() == 1
+    rows = client.get('/api/reporting/shifts/', {'from': '2024-11-27'}).json()
+    assert [(row['status'], row['late_seconds']) for row in rows] == [('Present', 0)]
+
+    Shift.objects.filter(pk=day.pk).update(grace_minutes=15)
+    rows = client.get('/api/reporting/shifts/', {'from': '2024-11-26', 'refresh': 'true'}).json()
+    assert rows[0]['late_seconds'] == 0
+
+# Conditional GET Tests
+# ------------------------------
+@pytest.mark.django_db
+def test_report_conditional_get(client, django_assert_num_queries, django_capture_on_commit_callbacks, create_employee):
+    employee = create_employee()
+    with django_capture_on_commit_callbacks(execute=True):
+        create_sessions(employee, 2)
+
+    response = client.get('/api/reporting/attendance/')
+    assert response.status_code == 200
+    etag = response['ETag']
+    assert response['Last-Modified']
+
+    # Only the version lookup runs; the report itself is never queried
+    with django_assert_num_queries(1):
+        response = client.get('/api/reporting/attendance/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+    # Another filter of the same report gets its own tag
+    assert client.get('/api/reporting/attendance/', {'source': 'summary'})['ETag'] != etag
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_sessions(employee, 1, start=datetime(2024, 12, 5, 9, 0, tzinfo=timezone.utc))
+    # One bump per committed transaction, however many rows it saved
+    assert DatasetVersion.objects.get(name='attendance.attendance').version == 2
+    response = client.get('/api/reporting/attendance/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+@pytest.mark.django_db
+def test_dataset_version_bumps_once_per_transaction(django_capture_on_commit_callbacks, create_employee):
+    employee = create_employee()
+    with CaptureQueriesContext(connection) as queries:
+        with django_capture_on_commit_callbacks(execute=True):
+            create_sessions(employee, 5)
+            Attendance.objects.filter(employee=employee).first().delete()
+            LeaveRequest.objects.create(employee=employee, start_date='2024-12-02', end_date='2024-12-03', reason='Trip')
+    bumps = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE "reporting_datasetversion"')]
+    # One UPDATE per table; the employee saved earlier in the test transaction shares the same bump
+    assert len(bumps) == 3
+    versions = dict(DatasetVersion.objects.values_list('name', 'version'))
+    assert (versions['attendance.attendance'], versions['leave_management.leaverequest'], versions['onboarding.employee']) == (1, 1, 1)
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_dataset_version_bump_keeps_the_write(monkeypatch, caplog, create_employee):
+    employee = create_employee()
+    def locked(*models):
+        raise RuntimeError('Version row locked')
+    monkeypatch.setattr(DatasetVersion.objects, 'bump', locked)
+
+    # The bump runs after the commit; its error is logged, not raised
+    log = create_sessions(employee, 1)[0]
+    assert 'Version row locked' in caplog.text
+    assert Attendance.objects.filter(pk=log.pk).exists()
+
+@pytest.mark.django_db
+def test_report_responses_are_compressed(client, create_employee):
+    employee = create_employee()
+    create_sessions(employee, 30)
+
+    response = client.get('/api/reporting/attendance/', HTTP_ACCEPT_ENCODING='gzip')
+    assert response['Content-Encoding'] == 'gzip'
+    assert len(json.loads(gzip.decompress(response.content))) == 30
+
+    # Charts are already compressed and are passed through untouched
+    response = client.get('/api/reporting/graphs/attendance/', HTTP_ACCEPT_ENCODING='gzip')
+    assert response['Content-Type'] == 'image/png'
+    assert not response.has_header('Content-Encoding')
@@ -1,11 +1,18 @@
 from django.urls import path
-from .views import AttendanceReportView, LeaveReportView, EmployeeReportView, ExportEmployeeDataAsCSV, AttendanceFrequencyGraphView, LeaveStatusGraphView
+from .views import AttendanceReportView, LeaveReportView, EmployeeReportView, ExportEmployeeDataAsCSV, ExportAttendanceDataAsCSV, ExportLeaveDataAsCSV, AttendanceFrequencyGraphView, LeaveStatusGraphView, ReportJobListView, ReportJobDetailView, ReportJobDownloadView, WorkingTimeAnalyticsView, ShiftReportView
 
 urlpatterns = [
     path('employees/', EmployeeReportView.as_view(), name='employee-report'),
     path('attendance/', AttendanceReportView.as_view(), name='attendance-report'),
     path('leaves/', LeaveReportView.as_view(), name='leave-report'),
     path('export/employees/', ExportEmployeeDataAsCSV.as_view(), name='export-employees-csv'),
+    path('export/attendance/', ExportAttendanceDataAsCSV.as_view(), name='export-attendance-csv'),
+    path('export/leaves/', ExportLeaveDataAsCSV.as_view(), name='export-leaves-csv'),
     path('graphs/attendance/', AttendanceFrequencyGraphView.as_view(), name='attendance-graph'),
     path('graphs/leaves/', LeaveStatusGraphView.as_view(), name='leave-status-graph'),
+    path('analytics/working-time/', WorkingTimeAnalyticsView.as_view(), name='working-time-analytics'),
+    path('shifts/', ShiftReportView.as_view(), name='shift-report'),
+    path('jobs/', ReportJobListView.as_view(), name='report-job-list'),
+    path('jobs/<int:pk>/', ReportJobDetailView.as_view(), name='report-job-detail'),
+    path('jobs/<int:pk>/download/', ReportJobDownloadView.as_view(), name='report-job-download'),
 ]
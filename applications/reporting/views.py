@@ -1,20 +1,32 @@
-import csv
-from io import BytesIO
-import matplotlib.pyplot as plt
+import os
 import numpy as np
-from django.http import HttpResponse
-from django.shortcuts import get_list_or_404
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.shortcuts import get_list_or_404, get_object_or_404
+from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
-from core.auth.permissions import IsAdmin, IsManager
+from core.auth.permissions import HasRole
 from rest_framework import status, serializers
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from applications.onboarding.models import Employee
+from applications.attendance.archive import attendance_history
 from applications.attendance.models import Attendance
-from applications.leave_management.models import LeaveRequest
-from django.utils.decorators import method_decorator
-from rest_framework.decorators import permission_classes
+from applications.leave_management.holidays import working_days
+from applications.leave_management.models import LeaveRequest, PublicHoliday
 from drf_spectacular.utils import extend_schema
+from core.filters import parse_bool_param, parse_date_range, parse_float_param, parse_int_param
+from core.pagination import decode_cursor, encode_cursor, seek
+from .analytics import working_time_report
+from .aggregations import attendance_frequency, frequency_labels, leave_status_counts
+from .charts import ChartUnavailable, get_chart_service
+from .conditional import conditional_report
+from .jobs import submit_job
+from .models import AttendanceDailySummary, ReportJob, ShiftResult
+from .exports import ATTENDANCE_EXPORT, EMPLOYEE_EXPORT, LEAVE_EXPORT
+from .serializers import ATTENDANCE_REPORT_VALUES, ATTENDANCE_SUMMARY_VALUES, SHIFT_REPORT_VALUES, AttendanceReportSerializer, ReportJobSerializer, ShiftReportSerializer
+from .streaming import attendance_report_rows, streaming_json_response
 
 # Employee Report View
 # -------------------------------------------------------------
@@ -40,18 +52,23 @@ class EmployeeReportView(APIView):
                     - date_joined
                 - HTTP 404: If no employees exist.
     """
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    @conditional_report(Employee)
     def get(self, request):
         employees = get_list_or_404(Employee.objects.all().values('employee_id', 'employee_nin', 'full_name', 'email', 'job_title', 'phone_number', 'date_joined'))
         return Response(employees, status=status.HTTP_200_OK)
     
 # Attendance Report View
 # -------------------------------------------------------------
-class AttendanceReportSerializer(serializers.Serializer):
-    employee_name = serializers.CharField()
-    clock_in_time = serializers.DateTimeField()
-    clock_out_time = serializers.DateTimeField(allow_null=True)
-    duration = serializers.CharField()
+def parse_source(request):
+    """
+    Read the `?source=` query parameter selecting raw logs or the daily summary table.
+    """
+    source = request.query_params.get('source', 'logs')
+    if source not in ('logs', 'summary'):
+        raise ValidationError({'source': "Use 'logs' or 'summary'."})
+    return source
 
 class AttendanceReportView(APIView):
     """
@@ -68,27 +85,81 @@ class AttendanceReportView(APIView):
                 - clock_in_time: The clock-in time of the employee.
                 - clock_out_time: The clock-out time of the employee.
                 - duration: Time difference between clock-in and clock-out.
-            If the clock-out time is not set, the duration will be 'Empty'.
+                - duration_seconds: The same duration in seconds.
+            If the clock-out time is not set, the duration will be 'Empty' and
+            duration_seconds will be null.
+            Query Parameters:
+                - stream (str, optional): 'ndjson' or 'json' to stream the report in
+                  chunks instead of building it in memory.
+                - cursor (str, optional): Opaque keyset cursor returned in the
+                  `X-Next-Cursor` header of a previous streamed page.
+                - limit (int, optional): Maximum number of rows in a streamed page.
+                - source (str, optional): 'summary' to return per-employee daily totals
+                  from the rollup table instead of raw logs.
+                - from, to (date, optional): Day range for the summary report.
             Returns:
-                - HTTP 200: List of attendance logs.
+                - HTTP 200: List of attendance logs, or a streamed NDJSON/JSON body.
+                - HTTP 400: If a query parameter is invalid.
                 - HTTP 404: If no attendance logs exist.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = AttendanceReportSerializer
 
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
+    @conditional_report(Attendance, Employee)
     def get(self, request):
-        logs = get_list_or_404(Attendance)
-        log_data = [
-            {
-                'employee_name': log.employee.name,
-                'clock_in_time': log.clock_in_time,
-                'clock_out_time': log.clock_out_time,
-                'duration': log.duration if log.clock_out_time else 'Empty',
-            } for log in logs
-        ]
-        serializer = self.serializer_class(data=log_data, many=True)
-        serializer.is_valid(raise_exception=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if parse_source(request) == 'summary':
+            return self.summary(request)
+        if request.query_params.get('stream'):
+            return self.stream(request)
+
+        logs = get_list_or_404(attendance_history().order_by('clock_in_time', 'id').values_list(*ATTENDANCE_REPORT_VALUES.columns))
+        return Response(ATTENDANCE_REPORT_VALUES.serialize(logs), status=status.HTTP_200_OK)
+
+    def summary(self, request):
+        """
+        Return per-employee daily totals from the `AttendanceDailySummary` rollup.
+
+        Returns:
+            Response: One row per employee and day in the requested range.
+        """
+        start, end = parse_date_range(request)
+        summaries = AttendanceDailySummary.objects.order_by('date', 'employee_id')
+        if start:
+            summaries = summaries.filter(date__gte=start)
+        if end:
+            summaries = summaries.filter(date__lte=end)
+        rows = summaries.values_list(*ATTENDANCE_SUMMARY_VALUES.columns)
+        return Response(ATTENDANCE_SUMMARY_VALUES.serialize(rows), status=status.HTTP_200_OK)
+
+    def stream(self, request):
+        """
+        Stream the attendance report ordered by `(clock_in_time, id)`.
+
+        Rows are read with `QuerySet.iterator()` in chunks and encoded as they are
+        produced, so memory stays flat regardless of table size. The rows are our
+        own data, so they are rendered straight from tuples and never
+        re-validated. When `limit` is given, the cursor for the following page is
+        returned in the `X-Next-Cursor` header.
+
+        Returns:
+            StreamingHttpResponse: The NDJSON or JSON array body.
+        """
+        cursor = request.query_params.get('cursor')
+        cursor = decode_cursor(cursor) if cursor else None
+        queryset = attendance_history(cursor[0] if cursor else None).order_by('clock_in_time', 'id')
+        if cursor:
+            queryset = seek(queryset, cursor)
+
+        headers = {}
+        limit = parse_int_param(request, 'limit')
+        if limit is not None:
+            boundary = list(queryset.values_list('clock_in_time', 'id')[limit - 1:limit + 1])
+            if len(boundary) == 2:
+                headers['X-Next-Cursor'] = encode_cursor(*boundary[0])
+            queryset = queryset[:limit]
+
+        rows = attendance_report_rows(queryset, settings.REPORTING_STREAM_CHUNK_SIZE)
+        return streaming_json_response(rows, request.query_params['stream'], settings.REPORTING_STREAM_CHUNK_SIZE, headers=headers)
     
 # Leave Report View
 # -------------------------------------------------------------
@@ -121,20 +192,64 @@ class LeaveReportView(APIView):
                 - end_date: The end date of the leave.
                 - reason: The reason for the leave.
                 - status: The status of the leave request ('Pending', 'Approved', 'Rejected').
+                - working_days: Working days of the leave, excluding weekends and
+                  public holidays, counted for all rows in one vectorized call.
             Returns:
                 - HTTP 200: List of leave requests.
                 - HTTP 404: If no leave requests exist.
     """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
     serializer_class = LeaveRequestSerializer
     
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
+    @conditional_report(LeaveRequest, Employee, PublicHoliday)
     def get(self, request):
         leaves = get_list_or_404(LeaveRequest.objects.all().values('employee__full_name', 'start_date', 'end_date', 'reason', 'status'))
+        days = working_days([leave['start_date'] for leave in leaves], [leave['end_date'] for leave in leaves]).tolist()
+        for leave, count in zip(leaves, days):
+            leave['working_days'] = count
         return Response(leaves, status=status.HTTP_200_OK)
     
+# Streaming CSV Export Base View
+# -------------------------------------------------------------
+class CSVExportView(APIView):
+    """
+    Base API view for streaming a queryset as a CSV download.
+
+    Subclasses set `export` to a `CSVExport` definition and `queryset` to the
+    rows to export. The file is produced with constant memory and the first
+    bytes are sent before the last rows are read. `dataset_models` lists the
+    tables the export reads, for conditional GET validation.
+
+    Query Parameters:
+        - compress (str, optional): 'gzip' to download a gzip-compressed `.csv.gz` file.
+
+    Returns:
+        - HTTP 200: A streamed CSV (or gzipped CSV) file.
+        - HTTP 404: If there are no rows to export.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    export = None
+    queryset = None
+    dataset_models = ()
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    @extend_schema(
+        responses={200: "text/csv"},
+        description="Returns a streamed CSV file.",
+    )
+    @conditional_report()
+    def get(self, request):
+        queryset = self.get_queryset()
+        if not queryset.exists():
+            raise Http404
+        compress = request.query_params.get('compress') == 'gzip'
+        return self.export.response(queryset, settings.REPORTING_EXPORT_CHUNK_SIZE, compress=compress)
+
 # Export Employee As CSV View
 # -------------------------------------------------------------
-class ExportEmployeeDataAsCSV(APIView):
+class ExportEmployeeDataAsCSV(CSVExportView):
     """
     API view for exporting employee data as a CSV file.
 
@@ -144,7 +259,7 @@ class ExportEmployeeDataAsCSV(APIView):
 
     Methods:
         get(request):
-            Generate and return a CSV file containing employee data with the following fields:
+            Stream a CSV file containing employee data with the following fields:
                 - Employee ID
                 - Full Name
                 - Email
@@ -154,23 +269,65 @@ class ExportEmployeeDataAsCSV(APIView):
                 - HTTP 200: A downloadable CSV file.
                 - HTTP 404: If no employees exist.
     """
-    @extend_schema(
-        responses={200: "text/csv"},
-        description="Returns a CSV file containing employee data.",
-    )
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
-    def get(self, request):
-        # Create the HttResponse object with CSV headers
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="employees.csv"'
+    export = EMPLOYEE_EXPORT
+    queryset = Employee.objects.order_by('id')
+    dataset_models = (Employee,)
+
+# Export Attendance As CSV View
+# -------------------------------------------------------------
+class ExportAttendanceDataAsCSV(CSVExportView):
+    """
+    API view for exporting attendance logs as a CSV file.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Stream a CSV file containing attendance logs with the following fields:
+                - Employee ID
+                - Full Name
+                - Clock In Time
+                - Clock Out Time
+            Returns:
+                - HTTP 200: A downloadable CSV file.
+                - HTTP 404: If no attendance logs exist.
+    """
+    export = ATTENDANCE_EXPORT
+    dataset_models = (Attendance, Employee)
 
-        writer = csv.writer(response) # Create a CSV writer object
-        writer.writerow(['Employee ID', 'Full Name', 'Email', 'Job Title', 'Date Joined']) # Write CSV headers
-        employees = get_list_or_404(Employee)
-        for employee in employees: 
-            writer.writerow([employee.employee_id, employee.full_name, employee.email, employee.job_title, employee.date_joined]) # CSV body writing
+    def get_queryset(self):
+        return attendance_history().order_by('clock_in_time', 'id')
 
-        return response
+# Export Leave Requests As CSV View
+# -------------------------------------------------------------
+class ExportLeaveDataAsCSV(CSVExportView):
+    """
+    API view for exporting leave requests as a CSV file.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Stream a CSV file containing leave requests with the following fields:
+                - Employee ID
+                - Full Name
+                - Start Date
+                - End Date
+                - Reason
+                - Status
+                - Created At
+                - Working Days (weekends and public holidays excluded)
+            Returns:
+                - HTTP 200: A downloadable CSV file.
+                - HTTP 404: If no leave requests exist.
+    """
+    export = LEAVE_EXPORT
+    queryset = LeaveRequest.objects.order_by('id')
+    dataset_models = (LeaveRequest, Employee, PublicHoliday)
 
 # Attendance Frequency Graph View
 # -------------------------------------------------------------   
@@ -185,34 +342,48 @@ class AttendanceFrequencyGraphView(APIView):
     Methods:
         get(request):
             Calculate attendance frequency for each employee and generate a bar graph.
+            The frequencies are computed in a single grouped query and the graph is
+            rendered by the chart service, which caches PNGs by input series.
             The graph includes:
                 - X-axis: Employee full names.
                 - Y-axis: Attendance count.
+            Query Parameters:
+                - from (date, optional): First day to include (YYYY-MM-DD).
+                - to (date, optional): Last day to include (YYYY-MM-DD).
+                - top (int, optional): Only plot the `top` most frequent employees.
+                - source (str, optional): 'summary' to count sessions from the daily
+                  summary table instead of raw logs.
             Returns:
                 - HTTP 200: A PNG image of the bar graph.
+                - HTTP 400: If a query parameter is invalid.
                 - HTTP 404: If no attendance records exist.
+                - HTTP 503: If the chart could not be rendered in time.
     """
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    @conditional_report(Attendance, Employee)
     def get(self, request):
         # Calculate attendance frequency
-        employees = Attendance.objects.values_list('employee__full_name', flat=True).distinct()
-        frequencies = [ Attendance.objects.filter(employee__full_name=name).count() for name in employees ]
-
-        # Create a bar graph
-        plt.figure(figsize=(12,6))
-        plt.bar(employees, frequencies, color='blue')
-        plt.xlabel('Employee Full Name', color='purple')
-        plt.ylabel('Attendance Count', color='purple')
-        plt.title('Employee Attendance Frequency Bar Graph', color='purple')
-        plt.xticks(rotation=45)
-        # Save the plot to a BytesIO object
-        buffer = BytesIO()
-        plt.tight_layout()
-        plt.savefig(buffer, format='png')
-        buffer.seek(0)
-        plt.close()
-        # Return as an HTTP response
-        return HttpResponse(buffer, content_type='image/png')
+        start, end = parse_date_range(request)
+        rows = attendance_frequency(start, end, top=parse_int_param(request, 'top'), source=parse_source(request))
+        if not rows:
+            return Response({'error': 'No data to plot'}, status=status.HTTP_404_NOT_FOUND)
+        employees = frequency_labels(rows)
+        frequencies = [row['count'] for row in rows]
+
+        # Render the bar graph (cached by input series)
+        try:
+            png = get_chart_service().render(
+                'bar',
+                labels=employees,
+                values=frequencies,
+                title='Employee Attendance Frequency Bar Graph',
+                xlabel='Employee Full Name',
+                ylabel='Attendance Count',
+            )
+        except ChartUnavailable as e:
+            return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return HttpResponse(png, content_type='image/png')
     
 # Leave Status Graph View
 # -------------------------------------------------------------   
@@ -227,18 +398,20 @@ class LeaveStatusGraphView(APIView):
     Methods:
         get(request):
             Calculate the distribution of leave request statuses ('Pending', 'Approved', 'Rejected') 
-            and generate a pie chart.
+            and generate a pie chart. The chart is rendered by the chart service,
+            which caches PNGs by input series.
             Returns:
                 - HTTP 200: A PNG image of the pie chart.
                 - HTTP 400: If there is invalid or insufficient data for the chart.
                 - HTTP 500: If an error occurs during graph generation.
+                - HTTP 503: If the chart could not be rendered in time.
     """
-    @method_decorator(permission_classes([IsAuthenticated, IsAdmin, IsManager]))
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    @conditional_report(LeaveRequest)
     def get(self, request):
         # Calculate leave request status distribution        
-        labels = ['Pending', 'Approved', 'Rejected']
-        statuses = LeaveRequest.objects.values_list('status', flat=True)
-        counts = [statuses.filter(status=status).count() for status in labels]
+        labels, counts = leave_status_counts()
 
          # Validate data
         if not counts or any(c is None or c < 0 for c in counts):
@@ -251,21 +424,207 @@ class LeaveStatusGraphView(APIView):
         if np.sum(counts) == 0:
             return Response({'error': 'No data to plot'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Generate pie chart
+        # Generate pie chart (cached by input series)
         try:
-            plt.figure(figsize=(6, 6))
-            plt.pie(counts, labels=labels, autopct='%1.1f%%', startangle=140)
-            plt.axis('equal')  # Equal aspect ratio ensures the pie is drawn as a circle
-            plt.title('Leave Request Status Distribution')
-            # Save the plot to a BytesIO object
-            buffer = BytesIO()
-            plt.tight_layout()
-            plt.savefig(buffer, format='png')
-            buffer.seek(0)
-            plt.close()
-
-            # Return the plot as a response
-            return HttpResponse(buffer, content_type='image/png')
+            png = get_chart_service().render(
+                'pie',
+                labels=labels,
+                values=[int(count) for count in counts],
+                title='Leave Request Status Distribution',
+            )
+            return HttpResponse(png, content_type='image/png')
+        except ChartUnavailable as e:
+            return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
\ No newline at end of file
+
+# Report Job List View
+# -------------------------------------------------------------
+class ReportJobListView(APIView):
+    """
+    API view for submitting background report jobs and listing the caller's jobs.
+
+    Heavy reports are generated by a worker outside the request, so the
+    request returns immediately with a job id whatever the report size.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Retrieve the caller's most recent report jobs.
+            Returns:
+                - HTTP 200: List of serialized report jobs.
+        post(request):
+            Submit a new report job.
+            Payload:
+                - kind (str): One of 'employees_csv', 'attendance_csv', 'leaves_csv',
+                  'attendance_report', 'attendance_graph', 'leave_status_graph'.
+                - params (dict, optional): 'from'/'to' dates and 'top' for the graph.
+            Returns:
+                - HTTP 202: The pending job, including its id.
+                - HTTP 400: Validation errors.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = ReportJobSerializer
+
+    def get(self, request):
+        jobs = ReportJob.objects.filter(requested_by=request.user).order_by('-created_at')[:50]
+        serializer = ReportJobSerializer(jobs, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def post(self, request):
+        serializer = ReportJobSerializer(data=request.data)
+        if serializer.is_valid():
+            job = serializer.save(requested_by=request.user)
+            submit_job(job)
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+# Report Job Detail View
+# -------------------------------------------------------------
+class ReportJobDetailView(APIView):
+    """
+    API view for polling the status and progress of a report job.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request, pk):
+            Retrieve one of the caller's report jobs by primary key.
+            Returns:
+                - HTTP 200: Serialized report job, with `download_url` once completed.
+                - HTTP 404: If the job does not exist or was submitted by another user.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = ReportJobSerializer
+
+    def get(self, request, pk):
+        job = get_object_or_404(ReportJob, pk=pk, requested_by=request.user)
+        serializer = ReportJobSerializer(job)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+# Report Job Download View
+# -------------------------------------------------------------
+class ReportJobDownloadView(APIView):
+    """
+    API view for downloading the artifact of a completed report job.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request, pk):
+            Stream the generated file from storage.
+            Returns:
+                - HTTP 200: The report file as an attachment.
+                - HTTP 404: If the job does not exist or was submitted by another user.
+                - HTTP 409: If the job has not completed.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    @extend_schema(
+        responses={200: "application/octet-stream"},
+        description="Returns the generated report file.",
+    )
+    def get(self, request, pk):
+        job = get_object_or_404(ReportJob, pk=pk, requested_by=request.user)
+        if job.status != 'Completed' or not job.result:
+            return Response({'error': f'Report job is {job.status}.'}, status=status.HTTP_409_CONFLICT)
+        filename = os.path.basename(job.result.name).split('_', 1)[-1]
+        return FileResponse(job.result.open('rb'), as_attachment=True, filename=filename)
+
+# Working Time Analytics View
+# -------------------------------------------------------------
+class WorkingTimeAnalyticsView(APIView):
+    """
+    API view for per-employee working time analytics over a date range.
+
+    Closed sessions are fetched as flat arrays and aggregated with NumPy, so a
+    million sessions are summarised without building model instances or
+    looping per employee in Python.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Retrieve per-employee statistics, including:
+                - employee_id, employee_name
+                - sessions: Number of closed sessions.
+                - total_hours, mean_hours: Total and mean session length.
+                - p50_hours, p95_hours: Median and 95th percentile session length.
+                - overtime_hours: Time worked beyond `overtime_hours` per local day.
+                - short_sessions: Sessions shorter than `short_minutes`.
+            Query Parameters:
+                - from (date, optional): First day to include (YYYY-MM-DD).
+                - to (date, optional): Last day to include (YYYY-MM-DD).
+                - overtime_hours (float, optional): Daily overtime threshold.
+                - short_minutes (float, optional): Short session threshold.
+            Returns:
+                - HTTP 200: List of per-employee statistics.
+                - HTTP 400: If a query parameter is invalid.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+
+    @conditional_report(Attendance, Employee)
+    def get(self, request):
+        start, end = parse_date_range(request)
+        report = working_time_report(
+            start,
+            end,
+            overtime_hours=parse_float_param(request, 'overtime_hours', default=settings.REPORTING_OVERTIME_HOURS),
+            short_minutes=parse_float_param(request, 'short_minutes', default=settings.REPORTING_SHORT_SESSION_MINUTES),
+        )
+        return Response(report, status=status.HTTP_200_OK)
+
+# Shift Report View
+# -------------------------------------------------------------
+class ShiftReportView(APIView):
+    """
+    API view for the lateness, early leave and overtime of every shift assignment in a date range.
+
+    Results are computed for the whole workforce in one batch, with a few
+    set-based queries and NumPy matching, and stored; later requests for the
+    same range only compute assignments whose result is missing, not final or
+    was dropped because the underlying attendance changed.
+
+    Permissions:
+        - Requires authentication (IsAuthenticated).
+        - Admin and Manager roles are required.
+
+    Methods:
+        get(request):
+            Retrieve one row per shift assignment, ordered by day and employee, including:
+                - employee_id, employee_name, shift, date
+                - scheduled_start, scheduled_end: The scheduled shift window.
+                - first_clock_in, last_clock_out: The matched attendance, if any.
+                - sessions, worked_seconds: Matched sessions and their total length.
+                - late_seconds: Time from the scheduled start to the first clock-in,
+                  when it is past the shift's grace period.
+                - early_leave_seconds: Time from the last clock-out to the scheduled end.
+                - overtime_seconds: Time worked beyond the scheduled length.
+                - status: 'Present', 'Open' or 'Absent'.
+            Query Parameters:
+                - from, to (date, optional): Inclusive range of assignment days; a
+                  single bound selects that day, and both default to today.
+                - refresh (bool, optional): 'true' to recompute stored results.
+            Returns:
+                - HTTP 200: List of shift results.
+                - HTTP 400: If a query parameter is invalid.
+    """
+    permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager')]
+    serializer_class = ShiftReportSerializer
+
+    def get(self, request):
+        start, end = parse_date_range(request)
+        today = timezone.localdate()
+        start, end = start or end or today, end or start or today
+        ShiftResult.objects.refresh_range(start, end, force=bool(parse_bool_param(request, 'refresh')))
+        rows = ShiftResult.objects.filter(date__gte=start, date__lte=end).order_by('date', 'employee_id').values_list(*SHIFT_REPORT_VALUES.columns)
+        return Response(SHIFT_REPORT_VALUES.serialize(rows), status=status.HTTP_200_OK)
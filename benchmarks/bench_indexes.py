@@ -0,0 +1,223 @@
+"""
+Benchmark of the attendance, leave request and user device indexes.
+
+A throwaway test database is created, migrated back to the state before the
+query indexes, seeded with synthetic data and then queried with the access
+patterns the views use. The indexes are then migrated in and the same
+queries, with the same parameters, are run again. Query plans and median
+timings of both phases are printed side by side.
+
+Usage:
+    python benchmarks/bench_indexes.py --employees 2000 --sessions 100 --repeat 25
+
+The database settings come from the environment, exactly as for the
+application; the benchmark only ever touches the test database.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django
+
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test.utils import setup_databases, teardown_databases
+from applications.onboarding.models import Employee, UserDevice
+from applications.attendance.models import Attendance
+from applications.leave_management.models import LeaveRequest
+
+# Migration States
+# -------------------------------------------------------------
+BEFORE_INDEXES = [
+    ('attendance', '0004_attendance_event_id'),
+    ('leave_management', '0001_initial'),
+    ('onboarding', '0003_userdevice'),
+]
+
+def migrate(targets=None):
+    """
+    Migrate the test database to `targets`, or to the latest migrations when omitted.
+    """
+    executor = MigrationExecutor(connection)
+    executor.migrate(targets or executor.loader.graph.leaf_nodes())
+
+def analyze():
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+# Synthetic Data
+# -------------------------------------------------------------
+START = datetime(2024, 1, 1, 6, 0, tzinfo=dt_timezone.utc)
+
+def seed(employees, sessions, batch_size=5000):
+    """
+    Seed employees, attendance sessions, leave requests, users and devices.
+
+    Every employee gets `sessions` daily sessions; the last one is left open
+    for one employee in fifty. Rows are written with `bulk_create`, so no
+    signals run.
+    """
+    rng = random.Random(7)
+    Employee.objects.bulk_create([
+        Employee(
+            employee_id=f'B{index:07d}',
+            employee_nin=f'NIN{index:010d}',
+            full_name=f'Employee {index}',
+            email=f'employee{index}@bench.local',
+            job_title=rng.choice(['Engineer', 'Analyst', 'Driver', 'Nurse']),
+            phone_number='256700000000',
+        ) for index in range(employees)
+    ], batch_size=batch_size)
+    employee_ids = list(Employee.objects.order_by('id').values_list('id', flat=True))
+
+    logs = []
+    for employee_id in employee_ids:
+        for day in range(sessions):
+            clock_in = START + timedelta(days=day, minutes=rng.randint(0, 180))
+            is_open = day == sessions - 1 and employee_id % 50 == 0
+            logs.append(Attendance(
+                employee_id=employee_id,
+                clock_in_time=clock_in,
+                clock_out_time=None if is_open else clock_in + timedelta(hours=rng.uniform(4, 10)),
+            ))
+        if len(logs) >= batch_size:
+            Attendance.objects.bulk_create(logs, batch_size=batch_size)
+            logs = []
+    Attendance.objects.bulk_create(logs, batch_size=batch_size)
+
+    leaves = []
+    for employee_id in employee_ids:
+        for _ in range(5):
+            start = date(2024, 1, 1) + timedelta(days=rng.randint(0, 360))
+            leaves.append(LeaveRequest(
+                employee_id=employee_id,
+                start_date=start,
+                end_date=start + timedelta(days=rng.randint(0, 14)),
+                reason='Benchmark',
+                status=rng.choices(['Pending', 'Approved', 'Rejected'], weights=[1, 8, 1])[0],
+            ))
+    LeaveRequest.objects.bulk_create(leaves, batch_size=batch_size)
+
+    User.objects.bulk_create([User(username=f'bench{index}') for index in range(employees // 2)], batch_size=batch_size)
+    user_ids = list(User.objects.filter(username__startswith='bench').values_list('id', flat=True))
+    UserDevice.objects.bulk_create([
+        UserDevice(user_id=user_id, device_name=f'Device {device}', refresh_token='token')
+        for user_id in user_ids for device in range(5)
+    ], batch_size=batch_size)
+    return employee_ids, user_ids
+
+# Benchmarked Queries
+# -------------------------------------------------------------
+def build_queries(employee_ids, user_ids, sessions, repeat):
+    """
+    Return `(name, [queryset, ...])` pairs with one queryset per repetition.
+
+    Parameters are drawn from a fixed seed so both phases run identical queries.
+    """
+    rng = random.Random(11)
+
+    def day(offset):
+        return START + timedelta(days=offset)
+
+    def employee_range():
+        first = rng.randint(0, max(sessions - 30, 0))
+        return Attendance.objects.filter(employee_id=rng.choice(employee_ids), clock_in_time__gte=day(first), clock_in_time__lt=day(first + 30)).order_by('clock_in_time')
+
+    def time_page():
+        return Attendance.objects.filter(clock_in_time__gte=day(rng.randint(0, sessions - 1))).order_by('clock_in_time', 'id')[:500]
+
+    def open_session():
+        return Attendance.objects.filter(employee_id=rng.choice(employee_ids), clock_out_time__isnull=True)
+
+    def open_sessions():
+        return Attendance.objects.filter(clock_out_time__isnull=True).values_list('employee_id', flat=True)
+
+    def pending_leaves():
+        return LeaveRequest.objects.filter(status='Pending').values_list('id', flat=True)
+
+    def leave_overlap():
+        start = date(2024, 1, 1) + timedelta(days=rng.randint(0, 360))
+        return LeaveRequest.objects.filter(employee_id=rng.choice(employee_ids), start_date__lte=start + timedelta(days=7), end_date__gte=start)
+
+    def user_devices():
+        return UserDevice.objects.filter(user_id=rng.choice(user_ids)).order_by('-created_at')
+
+    factories = [
+        ('attendance by employee and month', employee_range),
+        ('attendance keyset page', time_page),
+        ('open session of employee', open_session),
+        ('all open sessions', open_sessions),
+        ('pending leave requests', pending_leaves),
+        ('leave overlap of employee', leave_overlap),
+        ('devices of user, newest first', user_devices),
+    ]
+    return [(name, [factory() for _ in range(repeat)]) for name, factory in factories]
+
+def run_queries(queries):
+    """
+    Evaluate each query and return `{name: (median_ms, plan)}`.
+    """
+    results = {}
+    for name, querysets in queries:
+        plan = querysets[0].explain()
+        timings = []
+        for queryset in querysets:
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = (statistics.median(timings), plan)
+    return results
+
+# Report
+# -------------------------------------------------------------
+def report(before, after):
+    for name in before:
+        print(f'\n== {name}')
+        print('-- before --')
+        print(before[name][1])
+        print('-- after --')
+        print(after[name][1])
+
+    print(f"\n{'query':<34} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name in before:
+        old, new = before[name][0], after[name][0]
+        print(f'{name:<34} {old:>10.3f} {new:>10.3f} {old / new if new else float("inf"):>7.1f}x')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=2000, help='Number of employees to seed.')
+    parser.add_argument('--sessions', type=int, default=100, help='Attendance sessions per employee.')
+    parser.add_argument('--repeat', type=int, default=25, help='Runs per query and phase.')
+    options = parser.parse_args()
+
+    old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+    try:
+        print(f'Database: {connection.vendor}')
+        migrate(BEFORE_INDEXES)
+        started = time.perf_counter()
+        employee_ids, user_ids = seed(options.employees, options.sessions)
+        print(f'Seeded {Attendance.objects.count()} attendance logs, {LeaveRequest.objects.count()} leave requests '
+              f'and {UserDevice.objects.count()} devices in {time.perf_counter() - started:.1f}s')
+        queries = build_queries(employee_ids, user_ids, options.sessions, options.repeat)
+
+        analyze()
+        before = run_queries(queries)
+        migrate()
+        analyze()
+        after = run_queries(queries)
+        report(before, after)
+    finally:
+        teardown_databases(old_config, verbosity=0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of the per-request cost of the role permission checks.
+
+A view guarded by `[IsAuthenticated, IsAdmin, IsManager]` used to validate
+the bearer token again in every role check, twice in `IsManager`, and print
+the role each time. That path is reproduced here and timed against the
+current checks, which read the role from the token DRF already validated and
+cache it on the request, and against one `HasRole('Admin', 'Manager')`.
+
+Each iteration builds a fresh request that looks like one DRF has just
+authenticated with `JWTAuthentication`, so no database is needed and the
+role cache never carries over from one request to the next.
+
+Usage:
+    python benchmarks/bench_permissions.py --requests 20000 --repeat 5
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django
+
+django.setup()
+
+from django.contrib.auth.models import User
+from rest_framework.permissions import BasePermission, IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+from core.auth.permissions import HasRole, IsAdmin, IsManager
+
+# Previous Checks
+# -------------------------------------------------------------
+def legacy_get_role(request):
+    jwt_auth = JWTAuthentication()
+    validated_token = jwt_auth.get_validated_token(request.headers.get("Authorization").split()[1])
+    return validated_token.get("role")
+
+class LegacyIsAdmin(BasePermission):
+    def has_permission(self, request, view):
+        role = legacy_get_role(request)
+        print(f'{role}')
+        return bool(role == 'Admin')
+
+class LegacyIsManager(BasePermission):
+    def has_permission(self, request, view):
+        role = legacy_get_role(request)
+        role = legacy_get_role(request)
+        print(f'{role}')
+        return bool(role == 'Manager')
+
+# Requests
+# -------------------------------------------------------------
+def build_request(factory, user, raw_token):
+    # The state DRF leaves behind after JWTAuthentication succeeded
+    request = Request(factory.get('/', HTTP_AUTHORIZATION=f'Bearer {raw_token}'))
+    request.user = user
+    request.auth = JWTAuthentication().get_validated_token(raw_token)
+    return request
+
+def check(requests, permissions):
+    # Every permission is evaluated, as if each one had been granted
+    for request in requests:
+        for permission in permissions:
+            permission().has_permission(request, None)
+
+def median_us(requests_count, permissions, factory, user, raw_token, repeat):
+    timings = []
+    for _ in range(repeat):
+        requests = [build_request(factory, user, raw_token) for _ in range(requests_count)]
+        started = time.perf_counter()
+        # Printing goes to a buffer, so the terminal does not dominate the timing
+        with contextlib.redirect_stdout(io.StringIO()):
+            check(requests, permissions)
+        timings.append((time.perf_counter() - started) * 1e6 / requests_count)
+    return statistics.median(timings)
+
+# Report
+# -------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20000, help='Requests checked per run.')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per permission set.')
+    options = parser.parse_args()
+
+    factory = APIRequestFactory()
+    user = User(id=1, username='bench')
+    token = AccessToken()
+    token['user_id'] = user.id
+    token['role'] = 'Manager'
+    raw_token = str(token)
+
+    cases = [
+        ('previous [IsAuthenticated, IsAdmin, IsManager]', [IsAuthenticated, LegacyIsAdmin, LegacyIsManager]),
+        ('cached [IsAuthenticated, IsAdmin, IsManager]', [IsAuthenticated, IsAdmin, IsManager]),
+        ("[IsAuthenticated, HasRole('Admin', 'Manager')]", [IsAuthenticated, HasRole('Admin', 'Manager')]),
+    ]
+    baseline = None
+    print(f"{'permissions':<50} {'us/request':>11} {'speedup':>8}")
+    for name, permissions in cases:
+        elapsed = median_us(options.requests, permissions, factory, user, raw_token, options.repeat)
+        baseline = baseline or elapsed
+        print(f'{name:<50} {elapsed:>11.2f} {baseline / elapsed:>7.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark of the `ValuesSerializer` read path against the DRF serializers.
+
+A throwaway test database is created and seeded with synthetic employees,
+attendance logs and leave requests. Each list endpoint's read path is then
+timed both ways, database fetch included: the DRF serializer over model
+instances, as the views used to do, and `ValuesSerializer` over
+`values_list()` tuples. Both outputs are compared before any timing so the
+benchmark also proves they are identical.
+
+Usage:
+    python benchmarks/bench_serializers.py --rows 100000 --repeat 3
+
+The database settings come from the environment, exactly as for the
+application; the benchmark only ever touches the test database.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django
+
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_databases, teardown_databases
+from applications.onboarding.models import Employee
+from applications.onboarding.serializers import EMPLOYEE_VALUES, EmployeeSerializer
+from applications.attendance.models import Attendance
+from applications.attendance.serializers import ATTENDANCE_VALUES, AttendanceSerializer
+from applications.leave_management.models import LeaveRequest
+from applications.leave_management.serializers import LEAVE_REQUEST_VALUES, LeaveRequestSerializer
+from applications.reporting.serializers import ATTENDANCE_REPORT_VALUES, AttendanceReportSerializer, format_report_duration
+
+# Synthetic Data
+# -------------------------------------------------------------
+START = datetime(2024, 1, 1, 6, 0, tzinfo=dt_timezone.utc)
+
+def seed(rows, batch_size=5000):
+    """
+    Seed `rows` attendance logs and leave requests spread over `rows // 50` employees.
+
+    On the last day, one employee in twenty is left clocked in. Rows are
+    written with `bulk_create`, so no signals run.
+    """
+    rng = random.Random(7)
+    Employee.objects.bulk_create([
+        Employee(
+            employee_id=f'B{index:07d}',
+            employee_nin=f'NIN{index:010d}',
+            full_name=f'Employee {index}',
+            email=f'employee{index}@bench.local',
+            job_title=rng.choice(['Engineer', 'Analyst', 'Driver', 'Nurse']),
+            phone_number='256700000000',
+        ) for index in range(max(rows // 50, 1))
+    ], batch_size=batch_size)
+    employee_ids = list(Employee.objects.values_list('id', flat=True))
+
+    logs, leaves = [], []
+    for index in range(rows):
+        employee_id = employee_ids[index % len(employee_ids)]
+        clock_in = START + timedelta(days=index // len(employee_ids), minutes=rng.randint(0, 180))
+        logs.append(Attendance(
+            employee_id=employee_id,
+            clock_in_time=clock_in,
+            clock_out_time=None if index >= rows - len(employee_ids) and index % 20 == 0 else clock_in + timedelta(seconds=rng.randint(4 * 3600, 10 * 3600)),
+        ))
+        start = date(2024, 1, 1) + timedelta(days=rng.randint(0, 360))
+        leaves.append(LeaveRequest(employee_id=employee_id, start_date=start, end_date=start + timedelta(days=rng.randint(0, 14)), reason='Benchmark'))
+        if len(logs) >= batch_size:
+            Attendance.objects.bulk_create(logs)
+            LeaveRequest.objects.bulk_create(leaves)
+            logs, leaves = [], []
+    Attendance.objects.bulk_create(logs)
+    LeaveRequest.objects.bulk_create(leaves)
+
+# Read Paths
+# -------------------------------------------------------------
+def attendance_report_instances(queryset):
+    # The previous report path: tuples turned into dicts, then serialized
+    rows = [
+        {
+            'employee_name': name,
+            'clock_in_time': clock_in_time,
+            'clock_out_time': clock_out_time,
+            'duration': format_report_duration(duration_seconds),
+            'duration_seconds': duration_seconds,
+        }
+        for name, clock_in_time, clock_out_time, duration_seconds in queryset.values_list('employee__full_name', 'clock_in_time', 'clock_out_time', 'duration_seconds')
+    ]
+    return AttendanceReportSerializer(rows, many=True).data
+
+def build_cases():
+    """
+    Return `(name, drf_read, values_read)` triples; each read returns the rendered rows.
+    """
+    attendance = Attendance.objects.order_by('clock_in_time', 'id')
+    leaves = LeaveRequest.objects.order_by('id')
+    employees = Employee.objects.order_by('id')
+    return [
+        (
+            'attendance list',
+            lambda: AttendanceSerializer(attendance, many=True).data,
+            lambda: ATTENDANCE_VALUES.serialize(attendance.values_list(*ATTENDANCE_VALUES.columns)),
+        ),
+        (
+            'leave request list',
+            lambda: LeaveRequestSerializer(leaves, many=True).data,
+            lambda: LEAVE_REQUEST_VALUES.serialize(leaves.values_list(*LEAVE_REQUEST_VALUES.columns)),
+        ),
+        (
+            'employee list',
+            lambda: EmployeeSerializer(employees, many=True).data,
+            lambda: EMPLOYEE_VALUES.serialize(employees.values_list(*EMPLOYEE_VALUES.columns)),
+        ),
+        (
+            'attendance report',
+            lambda: attendance_report_instances(attendance),
+            lambda: ATTENDANCE_REPORT_VALUES.serialize(attendance.values_list(*ATTENDANCE_REPORT_VALUES.columns)),
+        ),
+    ]
+
+def median_ms(read, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        read()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+# Report
+# -------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000, help='Attendance logs and leave requests to seed.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per read path.')
+    options = parser.parse_args()
+
+    old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+    try:
+        print(f'Database: {connection.vendor}')
+        started = time.perf_counter()
+        seed(options.rows)
+        print(f'Seeded {Attendance.objects.count()} attendance logs, {LeaveRequest.objects.count()} leave requests '
+              f'and {Employee.objects.count()} employees in {time.perf_counter() - started:.1f}s')
+
+        print(f"\n{'read path':<20} {'rows':>8} {'drf ms':>10} {'values ms':>10} {'speedup':>8}")
+        for name, drf_read, values_read in build_cases():
+            rows = values_read()
+            if rows != drf_read():
+                raise SystemExit(f'{name}: ValuesSerializer output differs from the DRF serializer.')
+            old, new = median_ms(drf_read, options.repeat), median_ms(values_read, options.repeat)
+            print(f'{name:<20} {len(rows):>8} {old:>10.1f} {new:>10.1f} {old / new if new else float("inf"):>7.1f}x')
+    finally:
+        teardown_databases(old_config, verbosity=0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from applications.onboarding.models import Employee
+
+# Shared Fixtures
+# ------------------------------
+@pytest.fixture
+def create_employee():
+    """
+    Factory creating an employee; `index` keeps the unique fields apart and
+    any other keyword overrides a field.
+    """
+    def create(index=0, full_name='Tester test', **fields):
+        return Employee.objects.create(**{
+            'employee_id': f'E{1000 + index}',
+            'employee_nin': f'cm96lkgg8908d{index:02d}',
+            'full_name': full_name,
+            'email': f'tester{index}@gmail.com',
+            'job_title': 'Engineer',
+            'phone_number': '256772484255',
+            **fields,
+        })
+    return create
+
+@pytest.fixture
+def staff_user():
+    """
+    Factory returning the user `username` with the given profile role.
+    """
+    def get(username='staff', role='Admin'):
+        user = User.objects.get_or_create(username=username)[0]
+        user.profile.role = role
+        user.profile.save()
+        return user
+    return get
+
+@pytest.fixture
+def authenticated_client(staff_user):
+    """
+    Factory returning an API client authenticated as `staff_user(username, role)`.
+    """
+    def get(username='staff', role='Admin'):
+        client = APIClient()
+        client.force_authenticate(user=staff_user(username, role))
+        return client
+    return get
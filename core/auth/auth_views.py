@@ -1,6 +1,5 @@
 from django.contrib.auth.models import User
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
-from django.core.mail import send_mail
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -10,6 +9,7 @@ from rest_framework import status, serializers
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from applications.onboarding.models import UserDevice
+from applications.notifications.models import OutboundEmail
 from .token_serializer import CustomTokenObtainPairSerializer
 
 # Custom Token Obtain Pair API View
@@ -123,7 +123,7 @@ class ActiveDevicesView(APIView):
 
     Returns:
         Response:
-            - HTTP 200: A list of active devices including:
+            - HTTP 200: A list of active devices, newest first, including:
                 - id (int): Device ID.
                 - device_name (str): Name of the device.
                 - created_at (datetime): Timestamp of when the device was added.
@@ -131,7 +131,7 @@ class ActiveDevicesView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        devices = UserDevice.objects.filter(user=request.user)
+        devices = UserDevice.objects.filter(user=request.user).order_by('-created_at')
         return Response(
             [{"id": device.id, "device_name": device.device_name, "created_at": device.created_at} for device in devices],
             status=status.HTTP_200_OK
@@ -145,6 +145,8 @@ class PasswordResetRequestView(APIView):
 
     This view allows users to request a password reset by providing their email 
     address. A password reset link is sent to the user's email if the account exists.
+    The email is queued in the outbox and sent by the delivery worker, so the
+    request does not wait on the mail server.
 
     Methods:
         post(request):
@@ -167,12 +169,11 @@ class PasswordResetRequestView(APIView):
             uid = urlsafe_base64_encode(force_bytes(user.pk))
             reset_link = f"http://localhost:8000/reset-password/{uid}/{token}/"
 
-            # Send email
-            send_mail(
+            # Queued in the outbox; the deliver_emails worker sends it
+            OutboundEmail.objects.enqueue(
                 subject="Password Reset Request",
-                message=f"Click the link to reset your password: {reset_link}",
-                from_email="jobatwok1@gmail.com",
-                recipient_list=[user.email],
+                body=f"Click the link to reset your password: {reset_link}",
+                recipients=[user.email],
             )
             return Response({"message": "Password reset email sent."}, status=status.HTTP_200_OK)
         except User.DoesNotExist:
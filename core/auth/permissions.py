@@ -1,34 +1,92 @@
 from rest_framework.permissions import BasePermission
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import Token
 
 # Helper Function
 # -------------------------------------
+# Request attribute holding the resolved role; absent until the first lookup
+ROLE_ATTRIBUTE = '_auth_role'
+
 def get_role(request):
     """
     Helper function to extract the user's role from a JWT token.
 
-    This function validates the JWT token provided in the request's `Authorization` 
-    header and extracts the user's role from the token payload.
+    The role is resolved at most once per request and cached on the request,
+    so every permission class of a view shares one lookup. When DRF
+    authenticated the request with `JWTAuthentication`, the token it already
+    validated is `request.auth` and its `role` claim is read as is. Requests
+    authenticated another way (e.g. `TokenAuthentication`) carry no claims;
+    their role is read from the user's `Profile` instead.
 
     Args:
-        request (Request): The incoming HTTP request containing the JWT token 
-                           in the `Authorization` header.
+        request (Request): The incoming, already authenticated HTTP request.
 
     Returns:
-        str: The role of the user as specified in the JWT token payload.
-    
-    Raises:
-        AuthenticationFailed: If the token is invalid or missing.
-        KeyError: If the role is not present in the token payload.
+        str: The role of the user as specified in the JWT token payload or
+             profile, or None for anonymous users and users without one.
     
     Example Usage:
         role = get_role(request)
     """
-    jwt_auth = JWTAuthentication()
-    validated_token = jwt_auth.get_validated_token(request.headers.get("Authorization").split()[1])
-    role = validated_token.get("role")
+    try:
+        return getattr(request, ROLE_ATTRIBUTE)
+    except AttributeError:
+        pass
+    if isinstance(request.auth, Token):
+        role = request.auth.get('role')
+    else:
+        profile = getattr(request.user, 'profile', None)
+        role = profile.role if profile is not None else None
+    setattr(request, ROLE_ATTRIBUTE, role)
     return role
 
+# Role Auth
+# -------------------------------------
+class HasRole(BasePermission):
+    """
+    Permission granted when the user's role is any of the given roles.
+
+    Unlike listing `IsAdmin` and `IsManager` together in `permission_classes`,
+    which DRF combines with AND and no user can satisfy, the roles of one
+    `HasRole` are combined with OR. DRF instantiates every entry of
+    `permission_classes`, so an instance returns itself when called.
+
+    Args:
+        *roles (str): The roles allowed through.
+        methods (dict, optional): Maps HTTP methods to the roles allowed for
+                                  them instead, e.g. `{'DELETE': ('Admin',)}`.
+
+    Example:
+        permission_classes = [IsAuthenticated, HasRole('Admin', 'Manager', methods={'DELETE': ('Admin',)})]
+
+    Returns:
+        bool: True if the user's role is one of `roles`, False otherwise.
+    """
+    roles = frozenset()
+
+    def __init__(self, *roles, methods=None):
+        if roles:
+            self.roles = frozenset(roles)
+        self.methods = {method.upper(): frozenset(allowed) for method, allowed in (methods or {}).items()}
+
+    def __call__(self):
+        return self
+
+    def __repr__(self):
+        return f"HasRole({', '.join(repr(role) for role in sorted(self.roles))})"
+
+    def has_permission(self, request, view):
+        """
+        Checks if the user's role is one of the roles allowed for the request method.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            view (View): The view being accessed.
+
+        Returns:
+            bool: True if the user's role is allowed, False otherwise.
+        """
+        return get_role(request) in self.methods.get(request.method, self.roles)
+
 # Admin Auth
 # -------------------------------------
 class IsAdmin(BasePermission):
@@ -60,7 +118,6 @@ class IsAdmin(BasePermission):
             bool: True if the user's role is 'Admin', False otherwise.
         """
         role = get_role(request)
-        print(f'{role}')
         return bool(role == 'Admin')
     
 # Manager Auth
@@ -94,8 +151,6 @@ class IsManager(BasePermission):
             bool: True if the user's role is 'Manager', False otherwise.
         """
         role = get_role(request)
-        role = get_role(request)
-        print(f'{role}')
         return bool(role == 'Manager')
     
 # Employee Auth
@@ -129,5 +184,4 @@ class IsEmployee(BasePermission):
             bool: True if the user's role is 'Employee', False otherwise.
         """
         role = get_role(request)
-        print(f'{role}')
         return bool(role == 'Employee')
\ No newline at end of file
@@ -0,0 +1,148 @@
+from datetime import datetime, time, timedelta
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+# Query Parameter Helpers
+# -------------------------------------
+def parse_date_param(request, name):
+    """
+    Parse an optional `YYYY-MM-DD` query parameter.
+
+    Args:
+        request (Request): The incoming DRF request.
+        name (str): The name of the query parameter.
+
+    Returns:
+        date: The parsed date, or None if the parameter is absent.
+
+    Raises:
+        ValidationError: If the value is not a valid date.
+    """
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        return serializers.DateField().to_internal_value(value)
+    except ValidationError as exc:
+        raise ValidationError({name: exc.detail})
+
+def parse_int_param(request, name, min_value=1, max_value=None):
+    """
+    Parse an optional integer query parameter within bounds.
+
+    Args:
+        request (Request): The incoming DRF request.
+        name (str): The name of the query parameter.
+        min_value (int): The smallest accepted value.
+        max_value (int, optional): The largest accepted value.
+
+    Returns:
+        int: The parsed value, or None if the parameter is absent.
+
+    Raises:
+        ValidationError: If the value is not an integer within bounds.
+    """
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return serializers.IntegerField(min_value=min_value, max_value=max_value).run_validation(value)
+    except ValidationError as exc:
+        raise ValidationError({name: exc.detail})
+
+def parse_float_param(request, name, default=None, min_value=0):
+    """
+    Parse an optional numeric query parameter.
+
+    Args:
+        request (Request): The incoming DRF request.
+        name (str): The name of the query parameter.
+        default (float, optional): Value returned when the parameter is absent.
+        min_value (float): The smallest accepted value.
+
+    Returns:
+        float: The parsed value, or `default` if the parameter is absent.
+
+    Raises:
+        ValidationError: If the value is not a number within bounds.
+    """
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return serializers.FloatField(min_value=min_value).run_validation(value)
+    except ValidationError as exc:
+        raise ValidationError({name: exc.detail})
+
+def parse_bool_param(request, name):
+    """
+    Parse an optional boolean query parameter such as `?open=true`.
+
+    Args:
+        request (Request): The incoming DRF request.
+        name (str): The name of the query parameter.
+
+    Returns:
+        bool: The parsed value, or None if the parameter is absent.
+
+    Raises:
+        ValidationError: If the value is not a recognised boolean.
+    """
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return serializers.BooleanField().to_internal_value(value)
+    except ValidationError as exc:
+        raise ValidationError({name: exc.detail})
+
+def parse_date_range(request, start_name='from', end_name='to'):
+    """
+    Parse an inclusive `?from=&to=` date range.
+
+    Returns:
+        tuple: `(start, end)` dates, either of which may be None.
+
+    Raises:
+        ValidationError: If a date is invalid or `from` is after `to`.
+    """
+    start = parse_date_param(request, start_name)
+    end = parse_date_param(request, end_name)
+    if start and end and start > end:
+        raise ValidationError({end_name: f"'{end_name}' must not be before '{start_name}'."})
+    return start, end
+
+def local_day_bounds(start=None, end=None):
+    """
+    Convert an inclusive date range into half-open datetime bounds.
+
+    Dates are interpreted in the project `TIME_ZONE`, so `from=2024-12-01`
+    starts at local midnight. Filtering with `__gte` / `__lt` on these bounds
+    lets the database use an index on the timestamp column, unlike `__date`.
+
+    Args:
+        start (date, optional): First day of the range.
+        end (date, optional): Last day of the range, inclusive.
+
+    Returns:
+        tuple: `(lower, upper)` aware datetimes, either of which may be None.
+    """
+    tz = timezone.get_current_timezone()
+    lower = timezone.make_aware(datetime.combine(start, time.min), tz) if start else None
+    upper = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min), tz) if end else None
+    return lower, upper
+
+def filter_datetime_range(queryset, field, start=None, end=None):
+    """
+    Restrict `queryset` to rows whose `field` falls on the given local days.
+
+    Returns:
+        QuerySet: The filtered queryset.
+    """
+    lower, upper = local_day_bounds(start, end)
+    if lower:
+        queryset = queryset.filter(**{f'{field}__gte': lower})
+    if upper:
+        queryset = queryset.filter(**{f'{field}__lt': upper})
+    return queryset
@@ -0,0 +1,23 @@
+from django.middleware.gzip import GZipMiddleware
+
+# Compression Middleware
+# -------------------------------------
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Gzip middleware that leaves already-compressed payloads alone.
+
+    JSON reports and CSV exports compress very well, but PNG charts and
+    `.csv.gz` downloads would only cost CPU to recompress. Responses that set
+    `Content-Encoding` themselves, or whose content type is listed in
+    `skip_content_types`, are passed through unchanged. Strong ETags are
+    weakened by the parent class, which conditional GET handling accepts.
+
+    Attributes:
+        skip_content_types (tuple): Content type prefixes that are never compressed.
+    """
+    skip_content_types = ('image/', 'application/gzip', 'application/zip')
+
+    def process_response(self, request, response):
+        if response.get('Content-Type', '').startswith(self.skip_content_types):
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,64 @@
+import base64
+import binascii
+import json
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+# Keyset Cursor Helpers
+# -------------------------------------
+def encode_cursor(timestamp, pk) -> str:
+    """
+    Encode a `(timestamp, id)` keyset position as an opaque cursor string.
+
+    Args:
+        timestamp (datetime): The ordering timestamp of the last row served.
+        pk (int): The primary key of the last row served, used as a tie-breaker.
+
+    Returns:
+        str: A URL-safe token that can be passed back as `?cursor=`.
+    """
+    payload = json.dumps([timestamp.isoformat(), pk], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(token):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        token (str): The opaque cursor received from the client.
+
+    Returns:
+        tuple: `(timestamp, pk)` of the last row the client has already seen.
+
+    Raises:
+        ValidationError: If the cursor is malformed.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        timestamp, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        timestamp = parse_datetime(timestamp)
+        if timestamp is None or not isinstance(pk, int):
+            raise ValueError
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise ValidationError({'cursor': 'Invalid cursor.'})
+    return timestamp, pk
+
+def seek(queryset, cursor, field='clock_in_time'):
+    """
+    Restrict a queryset ordered by `(field, id)` to the rows after `cursor`.
+
+    The filter is expressed as `field > t OR (field = t AND id > pk)` so the
+    database can resume from the position with an index range scan instead of
+    counting past an OFFSET.
+
+    Args:
+        queryset (QuerySet): A queryset ordered by `(field, 'id')`.
+        cursor (tuple): A `(timestamp, pk)` pair as returned by `decode_cursor`.
+        field (str): The timestamp field the queryset is ordered by.
+
+    Returns:
+        QuerySet: The filtered queryset.
+    """
+    timestamp, pk = cursor
+    return queryset.filter(Q(**{f'{field}__gt': timestamp}) | Q(**{field: timestamp, 'id__gt': pk}))
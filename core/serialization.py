@@ -0,0 +1,187 @@
+from functools import cached_property
+from operator import methodcaller
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework.settings import api_settings
+
+# Values Serializer
+# -------------------------------------
+class ValuesSerializer:
+    """
+    Read-only fast path that renders `values_list()` rows exactly like a DRF serializer.
+
+    The fields of `serializer_class` are inspected once to decide which
+    columns to fetch and how to convert each one; rendering a row is then a
+    loop over precompiled `(name, position, converter)` steps on a plain
+    tuple. No model instances are built and no per-field `get_attribute`
+    lookups run, which is where `ModelSerializer(many=True)` spends most of
+    its time on large lists. The output, key order included, is the same
+    as `serializer_class(instances, many=True).data`.
+
+    Nested serializers are flattened into `relation__field` columns.
+    Fields that cannot be read from a column, such as `SerializerMethodField`,
+    must be given in `computed`.
+
+    Args:
+        serializer_class (type): The DRF serializer whose output is reproduced.
+        sources (dict, optional): Maps field names to the column they are read
+                                  from, for fields whose `source` is not a column.
+        computed (dict, optional): Maps field names to `(columns, function)`;
+                                   the function receives the raw column values
+                                   and returns the JSON-ready value.
+
+    Example:
+        ATTENDANCE_VALUES = ValuesSerializer(AttendanceSerializer, computed={'duration': (('duration_seconds',), format_duration)})
+        rows = ATTENDANCE_VALUES.serialize(queryset.values_list(*ATTENDANCE_VALUES.columns))
+    """
+    def __init__(self, serializer_class, sources=None, computed=None, prefix=''):
+        self.serializer_class = serializer_class
+        self.sources = sources or {}
+        self.computed = computed or {}
+        self.prefix = prefix
+
+    @cached_property
+    def fields(self):
+        """
+        The readable fields of the serializer with the columns each one needs.
+
+        Returns:
+            list: `(name, field, columns)` triples in output order.
+        """
+        fields = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if name in self.computed:
+                columns = [self.prefix + column for column in self.computed[name][0]]
+            elif isinstance(field, serializers.BaseSerializer):
+                if isinstance(field, serializers.ListSerializer):
+                    raise ImproperlyConfigured(f'{self.serializer_class.__name__}.{name}: many=True fields cannot be read from values.')
+                field = ValuesSerializer(type(field), prefix=f'{self.prefix}{field.source.replace(".", "__")}__')
+                columns = field.columns
+            elif isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+                raise ImproperlyConfigured(f'{self.serializer_class.__name__}.{name} needs an entry in `computed`.')
+            else:
+                columns = [self.prefix + self.sources.get(name, field.source.replace('.', '__'))]
+            fields.append((name, field, columns))
+        return fields
+
+    @cached_property
+    def columns(self):
+        """
+        The column names to pass to `values_list()`, in row order.
+        """
+        return [column for _, _, columns in self.fields for column in columns]
+
+    @cached_property
+    def index(self):
+        """
+        Maps each column name to its position in a row.
+        """
+        return {column: position for position, column in enumerate(self.columns)}
+
+    def compile(self, offset=0):
+        """
+        Build the conversion steps for the currently active time zone.
+
+        Args:
+            offset (int): Position of this serializer's first column in the row.
+
+        Returns:
+            list: `(name, position, converter)` steps. A position of None means
+                  the converter takes the whole row.
+        """
+        steps, position = [], offset
+        for name, field, columns in self.fields:
+            if name in self.computed:
+                steps.append((name, None, computed_converter(self.computed[name][1], position, len(columns))))
+            elif isinstance(field, ValuesSerializer):
+                steps.append((name, None, nested_converter(field.compile(position), position, len(columns))))
+            else:
+                steps.append((name, position, field_converter(field)))
+            position += len(columns)
+        return steps
+
+    def rows(self, rows):
+        """
+        Lazily render `values_list()` rows as JSON-ready dicts.
+
+        Args:
+            rows (iterable): Tuples with the values of `columns`, in order.
+
+        Yields:
+            dict: One rendered row per input row.
+        """
+        steps = self.compile()
+        for row in rows:
+            data = {}
+            for name, position, convert in steps:
+                if position is None:
+                    data[name] = convert(row)
+                else:
+                    value = row[position]
+                    data[name] = None if value is None else convert(value)
+            yield data
+
+    def serialize(self, rows):
+        """
+        Render `values_list()` rows as a list of JSON-ready dicts.
+        """
+        return list(self.rows(rows))
+
+# Field Converters
+# -------------------------------------
+def datetime_converter(field, zone):
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(zone).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    return convert
+
+def field_converter(field):
+    """
+    Return a function converting one non-null column value like `field.to_representation`.
+
+    Common field types get a direct conversion that gives the same result
+    without the generic checks; every other field falls back to its own
+    `to_representation`.
+    """
+    if isinstance(field, serializers.DateTimeField) and getattr(field, 'format', api_settings.DATETIME_FORMAT) == ISO_8601:
+        zone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if zone is not None:
+            return datetime_converter(field, zone)
+    elif isinstance(field, serializers.DateField) and getattr(field, 'format', api_settings.DATE_FORMAT) == ISO_8601:
+        return methodcaller('isoformat')
+    elif type(field) in (serializers.CharField, serializers.EmailField):
+        return str
+    elif type(field) is serializers.IntegerField:
+        return int
+    elif type(field) is serializers.FloatField:
+        return float
+    elif isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+        # The column already holds the related primary key
+        return lambda value: value
+    return field.to_representation
+
+def computed_converter(function, position, width):
+    end = position + width
+    return lambda row: function(*row[position:end])
+
+def nested_converter(steps, position, width):
+    end = position + width
+
+    def convert(row):
+        # A missing related object yields only nulls, which DRF renders as null
+        if all(value is None for value in row[position:end]):
+            return None
+        data = {}
+        for name, index, convert_field in steps:
+            if index is None:
+                data[name] = convert_field(row)
+            else:
+                value = row[index]
+                data[name] = None if value is None else convert_field(value)
+        return data
+    return convert
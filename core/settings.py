@@ -49,6 +49,7 @@ INSTALLED_APPS += [
     'applications.leave_management',
     'applications.onboarding',
     'applications.reporting',
+    'applications.notifications',
 	'rest_framework',
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
@@ -100,6 +101,7 @@ SIMPLE_JWT = {
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -144,6 +146,9 @@ DATABASES = {
         'PASSWORD': env.str('PASSWORD'),
         'HOST': env.str('HOST'),
         'PORT': env.str('PORT'),
+        'TEST': {
+            'NAME': env.str('TEST_NAME', default=None),
+        },
     }
 }
 
@@ -185,11 +190,19 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'static/'
 
+# Media files (generated report artifacts)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = env.str('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# Shared between processes in production, e.g. CACHE_URL=redis://cache:6379/1
+CACHES = {'default': env.cache('CACHE_URL', default='locmemcache://')}
+
 # Email
 EMAIL_BACKEND = env.str('EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = env.str('EMAIL_HOST', default='smtp.gmail.com')
@@ -197,3 +210,42 @@ EMAIL_PORT = env.int('EMAIL_PORT', default=587)
 EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS', default=True)
 EMAIL_HOST_USER = env.str('EMAIL_HOST_USER', default=None)
 EMAIL_HOST_PASSWORD = env.str('EMAIL_HOST_PASSWORD', default=None)
+DEFAULT_FROM_EMAIL = env.str('DEFAULT_FROM_EMAIL', default='jobatwok1@gmail.com')
+# Keeps one stalled send well inside NOTIFICATIONS_LEASE_SECONDS
+EMAIL_TIMEOUT = env.int('EMAIL_TIMEOUT', default=30)
+
+# Notifications
+# Emails are queued in the outbox and sent by `manage.py deliver_emails`
+NOTIFICATIONS_BATCH_SIZE = env.int('NOTIFICATIONS_BATCH_SIZE', default=100)
+NOTIFICATIONS_MAX_ATTEMPTS = env.int('NOTIFICATIONS_MAX_ATTEMPTS', default=5)
+NOTIFICATIONS_RETRY_SECONDS = env.int('NOTIFICATIONS_RETRY_SECONDS', default=60)
+NOTIFICATIONS_LEASE_SECONDS = env.int('NOTIFICATIONS_LEASE_SECONDS', default=300)
+
+# Reporting
+REPORTING_STREAM_CHUNK_SIZE = env.int('REPORTING_STREAM_CHUNK_SIZE', default=2000)
+REPORTING_EXPORT_CHUNK_SIZE = env.int('REPORTING_EXPORT_CHUNK_SIZE', default=2000)
+REPORTING_CHART_WORKERS = env.int('REPORTING_CHART_WORKERS', default=2)
+REPORTING_CHART_CACHE_SIZE = env.int('REPORTING_CHART_CACHE_SIZE', default=128)
+REPORTING_CHART_TIMEOUT = env.float('REPORTING_CHART_TIMEOUT', default=30.0)
+REPORTING_JOB_WORKERS = env.int('REPORTING_JOB_WORKERS', default=2)
+REPORTING_JOB_LEASE_SECONDS = env.int('REPORTING_JOB_LEASE_SECONDS', default=600)
+REPORTING_JOB_MAX_ATTEMPTS = env.int('REPORTING_JOB_MAX_ATTEMPTS', default=3)
+REPORTING_OVERTIME_HOURS = env.float('REPORTING_OVERTIME_HOURS', default=8.0)
+REPORTING_SHORT_SESSION_MINUTES = env.float('REPORTING_SHORT_SESSION_MINUTES', default=30.0)
+REPORTING_SHIFT_EARLY_MINUTES = env.float('REPORTING_SHIFT_EARLY_MINUTES', default=180.0)
+
+# Attendance
+ATTENDANCE_BULK_BATCH_SIZE = env.int('ATTENDANCE_BULK_BATCH_SIZE', default=500)
+ATTENDANCE_BULK_MAX_EVENTS = env.int('ATTENDANCE_BULK_MAX_EVENTS', default=5000)
+ATTENDANCE_PAGE_SIZE = env.int('ATTENDANCE_PAGE_SIZE', default=100)
+ATTENDANCE_MAX_PAGE_SIZE = env.int('ATTENDANCE_MAX_PAGE_SIZE', default=1000)
+ATTENDANCE_ARCHIVE_AFTER_DAYS = env.int('ATTENDANCE_ARCHIVE_AFTER_DAYS', default=0)
+ATTENDANCE_ARCHIVE_CHUNK_SIZE = env.int('ATTENDANCE_ARCHIVE_CHUNK_SIZE', default=5000)
+ATTENDANCE_IMPORT_BATCH_SIZE = env.int('ATTENDANCE_IMPORT_BATCH_SIZE', default=5000)
+ATTENDANCE_PRESENCE_TTL = env.int('ATTENDANCE_PRESENCE_TTL', default=300)
+
+# Leave
+# Working days as Monday..Sunday flags; public holidays are excluded on top
+LEAVE_WORKWEEK = env.str('LEAVE_WORKWEEK', default='1111100')
+LEAVE_BULK_MAX_DECISIONS = env.int('LEAVE_BULK_MAX_DECISIONS', default=1000)
+LEAVE_CALENDAR_MAX_DAYS = env.int('LEAVE_CALENDAR_MAX_DAYS', default=366)